@@ -1,28 +1,28 @@
 """
 슬랙 이벤트 API로부터 이벤트를 수신하고 처리하는 컨트롤러
 """
-from fastapi import APIRouter, Request, Depends, HTTPException
+from fastapi import APIRouter, Request, HTTPException
 from typing import Dict, Any
 import logging
 
-from services.slack_service import SlackService
-from services.mcp_service import MCPService
-from services.command_service import CommandService
+from services.event_dedup import event_deduplicator
+from services.event_queue import event_queue
+from services.slack_cache import dm_channel_cache, user_cache, user_prefetcher
+from services.event_service import EventService
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.post("/slack/events")
-async def slack_events(request: Request, 
-                       slack_service: SlackService = Depends(),
-                       mcp_service: MCPService = Depends()) -> Dict[str, Any]:
+async def slack_events(request: Request) -> Dict[str, Any]:
     """
-    슬랙 이벤트 API로부터 이벤트를 수신하고 처리하는 엔드포인트
+    슬랙 이벤트 API로부터 이벤트를 수신하는 엔드포인트
+    슬랙은 3초 안에 응답하지 않으면 같은 이벤트를 재전송하므로, 처리할 이벤트를 작업 큐에 넣고 바로 응답합니다.
+    큐가 가득 찬 경우 503으로 응답하여 슬랙이 나중에 다시 보내게 합니다.
+    이미 받은 이벤트(슬랙 재전송, 같은 메시지의 중복 전송)는 처리하지 않고 응답합니다.
     
     Args:
         request: FastAPI Request 객체
-        slack_service: 슬랙 서비스 인스턴스
-        mcp_service: MCP 서비스 인스턴스
         
     Returns:
         Dict[str, Any]: 응답 메시지
@@ -38,55 +38,48 @@ async def slack_events(request: Request,
     if payload["type"] == "url_verification":
         return {"challenge": payload["challenge"]}
     
-    # 이벤트 콜백 처리
+    # 이벤트 콜백 처리 - 메시지, 사용자 참여 이벤트는 백그라운드 워커가 처리
     if payload["type"] == "event_callback":
         event = payload.get("event", {})
-        event_type = event.get("type")
         
-        # 메시지 이벤트 처리
-        if event_type == "message":
-            # 봇 메시지 무시
-            if event.get("bot_id"):
-                return {"status": "ok"}
-            
-            user_id = event.get("user")
-            text = event.get("text")
-            channel = event.get("channel")
-            
-            if not user_id or not text:
-                return {"status": "ok"}
-            
-            # 사용자 정보 조회
-            user_info = await slack_service.get_user_info(user_id)
-            
-            # 명령어 처리 - 슬랙봇 자체에서 처리할 기본 명령어만 처리
-            command_service = CommandService(slack_service, mcp_service)
-            command_response = await command_service.process_message(user_id, text, channel)
-            
-            if command_response:
-                # 명령어가 처리된 경우 응답 메시지 전송
-                await slack_service.send_message(channel, command_response)
-            else:
-                # 명령어가 아닌 경우 MCP 서버로 메시지 중계
-                # 모든 라이드 셰어링 관련 비즈니스 로직은 MCP 서버의 에이전트가 처리
-                await mcp_service.relay_message(
-                    user_id=user_id,
-                    user_name=user_info.get("name", "Unknown User"),
-                    message=text,
-                    channel_id=channel
-                )
-            
+        if not EventService.should_handle(event):
             return {"status": "ok"}
         
-        # 사용자 참여 이벤트 처리
-        elif event_type == "member_joined_channel":
-            user_id = event.get("user")
-            channel = event.get("channel")
-            
-            # 환영 메시지 전송
-            welcome_message = f"안녕하세요! 라이드 셰어링 봇입니다. '도움말' 명령어를 입력하시면 사용 가능한 명령어 목록을 확인하실 수 있습니다."
-            await slack_service.send_message(channel, welcome_message)
-            
+        if await event_deduplicator.is_duplicate(payload, request.headers.get("X-Slack-Retry-Num")):
+            logger.info(f"Dropping duplicate slack event {payload.get('event_id')}")
             return {"status": "ok"}
+        
+        if not event_queue.offer(event):
+            # 슬랙이 재전송한 이벤트를 받을 수 있도록 기억한 키를 지움
+            await event_deduplicator.forget(payload)
+            logger.warning(f"Slack event queue is full, rejecting {event.get('type')} event")
+            raise HTTPException(status_code=503, detail="Event queue is full")
+    
+    return {"status": "ok"}
+
+@router.get("/slack/events/stats")
+async def slack_event_stats() -> Dict[str, Any]:
+    """
+    슬랙 이벤트 작업 큐와 중복 제거 상태를 반환하는 엔드포인트
+    대기/처리 중인 이벤트 수와 최대 대기 수, 큐가 가득 차 거부한 이벤트 수, 처리 실패 수, 큐 대기/처리 시간,
+    재전송 수와 버린 중복 이벤트 수(dedup).
     
-    return {"status": "ok"}
\ No newline at end of file
+    Returns:
+        Dict[str, Any]: 작업 큐/중복 제거 통계
+    """
+    return {**event_queue.stats(), "dedup": event_deduplicator.stats()}
+
+@router.get("/slack/cache/stats")
+async def slack_cache_stats() -> Dict[str, Any]:
+    """
+    슬랙 사용자 정보/DM 채널 캐시 상태를 반환하는 엔드포인트
+    캐시 크기와 적중률, 동시 미스를 합친 수(coalesced), users.list로 채운 사용자 수와 소요 시간.
+    
+    Returns:
+        Dict[str, Any]: 캐시 통계
+    """
+    return {
+        "user_info": user_cache.stats(),
+        "dm_channel": dm_channel_cache.stats(),
+        "prefetch": user_prefetcher.stats(),
+    }
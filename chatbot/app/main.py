@@ -2,6 +2,7 @@
 슬랙봇 FastAPI 애플리케이션 진입점
 """
 import logging
+from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import FastAPI, Query, Depends
 from starlette.middleware.cors import CORSMiddleware
@@ -9,13 +10,36 @@ from starlette.middleware.cors import CORSMiddleware
 from controllers import slack_controller, mcp_controller
 from utils.logger import setup_logger
 from utils.config import get_settings
-from services.slack_service import SlackService
+from services.slack_service import SlackService, get_slack_client, close_slack_client
+from services.mcp_service import get_mcp_client, close_mcp_client
+from services.event_queue import event_queue
+from services.event_dedup import event_deduplicator
+from services.slack_cache import user_prefetcher
 
 # 로거 설정
 logger = setup_logger("slackbot")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    애플리케이션 수명 동안 공유하는 HTTP 클라이언트와 슬랙 이벤트 워커를 시작합니다.
+    종료 시 큐에 남은 이벤트를 처리한 뒤 클라이언트를 닫습니다.
+    """
+    get_mcp_client()
+    slack_client = get_slack_client()
+    if get_settings().SLACK_USER_PREFETCH:
+        # 사용자 정보 캐시를 users.list로 채움 (백그라운드, 주기적으로 갱신)
+        user_prefetcher.start(slack_client)
+    event_queue.start()
+    yield
+    await user_prefetcher.close()
+    await event_queue.drain(get_settings().SLACK_EVENT_DRAIN_TIMEOUT)
+    await close_mcp_client()
+    await close_slack_client()
+    await event_deduplicator.close()
+
 # FastAPI 애플리케이션 생성
-app = FastAPI(title="Slack Bot API")
+app = FastAPI(title="Slack Bot API", lifespan=lifespan)
 
 # CORS 미들웨어 설정
 app.add_middleware(
@@ -0,0 +1,222 @@
+"""
+슬랙 이벤트 중복 제거
+"""
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+import logging
+import time
+
+from utils.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryDedupStore:
+    """
+    워커 프로세스 안에서만 공유되는 TTL 집합.
+    삽입 순서가 만료 순서와 같으므로(TTL이 일정) 앞에서부터 만료된 키를 지우며, 확인/추가는 O(1)입니다.
+    maxsize를 넘으면 가장 오래된 키부터 지워 메모리를 제한합니다.
+    """
+
+    def __init__(self, maxsize: int = 100000):
+        """
+        MemoryDedupStore 초기화
+
+        Args:
+            maxsize: 보관하는 최대 키 수
+        """
+        self.maxsize = maxsize
+        self._expires_at: "OrderedDict[str, float]" = OrderedDict()
+        self.evicted = 0
+
+    def _expire(self, now: float) -> None:
+        while self._expires_at:
+            key, expires_at = next(iter(self._expires_at.items()))
+            if expires_at > now:
+                break
+            self._expires_at.popitem(last=False)
+
+    async def add_if_absent(self, key: str, ttl: float) -> bool:
+        """
+        키가 없으면 ttl초 동안 보관합니다.
+
+        Args:
+            key: 중복 확인 키
+            ttl: 보관 시간(초)
+
+        Returns:
+            bool: 새로 추가했으면 True, 이미 있으면 False
+        """
+        now = time.monotonic()
+        self._expire(now)
+        if key in self._expires_at:
+            return False
+        self._expires_at[key] = now + ttl
+        if len(self._expires_at) > self.maxsize:
+            self._expires_at.popitem(last=False)
+            self.evicted += 1
+        return True
+
+    async def discard(self, key: str) -> None:
+        """키를 지웁니다."""
+        self._expires_at.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+
+class RedisDedupStore:
+    """
+    여러 인스턴스가 공유하는 Redis 저장소. (SET NX EX)
+    redis 패키지가 필요합니다.
+    """
+
+    def __init__(self, url: str, prefix: str = "slackbot:dedup:"):
+        """
+        RedisDedupStore 초기화
+
+        Args:
+            url: Redis URL (예: redis://localhost:6379/0)
+            prefix: 키 접두사
+        """
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("SLACK_DEDUP_REDIS_URL requires the redis package (pip install redis)") from e
+        self.client = redis.from_url(url)
+        self.prefix = prefix
+
+    async def add_if_absent(self, key: str, ttl: float) -> bool:
+        return bool(await self.client.set(self.prefix + key, 1, nx=True, ex=max(1, int(ttl))))
+
+    async def discard(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+class EventDeduplicator:
+    """
+    슬랙 이벤트 중복을 제거합니다.
+    - event_id: 슬랙이 응답을 받지 못해 같은 이벤트를 재전송한 경우 (X-Slack-Retry-Num)
+    - client_msg_id: 사용자의 클라이언트가 같은 메시지를 두 번 보낸 경우 (event_id는 다름)
+    저장소 오류 시에는 이벤트를 처리합니다. (중복 처리가 이벤트 유실보다 낫다고 봄)
+    """
+
+    def __init__(self, store, ttl: float = 600):
+        """
+        EventDeduplicator 초기화
+
+        Args:
+            store: MemoryDedupStore 또는 RedisDedupStore (add_if_absent/discard를 제공하는 객체)
+            ttl: 처리한 이벤트를 기억하는 시간(초). 슬랙은 약 5분 동안 재전송합니다.
+        """
+        self.store = store
+        self.ttl = ttl
+        self.checked = 0
+        self.retries = 0
+        self.duplicates: Dict[str, int] = {"event_id": 0, "client_msg_id": 0}
+        self.errors = 0
+
+    @staticmethod
+    def keys(payload: Dict[str, Any]) -> List[str]:
+        """
+        이벤트 콜백의 중복 확인 키 목록을 반환합니다.
+
+        Args:
+            payload: 슬랙 이벤트 콜백 본문
+
+        Returns:
+            List[str]: "event_id:..." / "client_msg_id:..." 키
+        """
+        keys = []
+        if payload.get("event_id"):
+            keys.append(f"event_id:{payload['event_id']}")
+        client_msg_id = payload.get("event", {}).get("client_msg_id")
+        if client_msg_id:
+            keys.append(f"client_msg_id:{client_msg_id}")
+        return keys
+
+    async def is_duplicate(self, payload: Dict[str, Any], retry_num: Optional[str] = None) -> bool:
+        """
+        이미 받은 이벤트인지 확인하고, 처음 받은 이벤트는 기억합니다.
+
+        Args:
+            payload: 슬랙 이벤트 콜백 본문
+            retry_num: X-Slack-Retry-Num 헤더 값 (재전송인 경우)
+
+        Returns:
+            bool: 중복이면 True
+        """
+        self.checked += 1
+        if retry_num:
+            self.retries += 1
+
+        added = []
+        try:
+            for key in self.keys(payload):
+                if not await self.store.add_if_absent(key, self.ttl):
+                    self.duplicates[key.split(":", 1)[0]] += 1
+                    # 이번 이벤트로 추가한 키는 되돌려, 남은 키가 다른 이벤트를 막지 않게 합니다.
+                    for added_key in added:
+                        await self.store.discard(added_key)
+                    return True
+                added.append(key)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Slack event dedup store error: {e}")
+        return False
+
+    async def forget(self, payload: Dict[str, Any]) -> None:
+        """
+        처리하지 못한 이벤트(큐가 가득 참 등)를 잊어, 슬랙의 재전송을 받을 수 있게 합니다.
+
+        Args:
+            payload: 슬랙 이벤트 콜백 본문
+        """
+        try:
+            for key in self.keys(payload):
+                await self.store.discard(key)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Slack event dedup store error: {e}")
+
+    async def close(self) -> None:
+        """공유 저장소 연결을 닫습니다. (애플리케이션 종료 시)"""
+        if hasattr(self.store, "close"):
+            await self.store.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        중복 제거 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 확인한 이벤트 수, 재전송 수, 키별로 버린 중복 수, 저장소 오류 수
+        """
+        stats = {
+            "store": type(self.store).__name__,
+            "checked": self.checked,
+            "retries": self.retries,
+            "duplicates": dict(self.duplicates),
+            "errors": self.errors,
+        }
+        if isinstance(self.store, MemoryDedupStore):
+            stats.update({"size": len(self.store), "evicted": self.store.evicted})
+        return stats
+
+
+def create_dedup_store():
+    """
+    설정에 따라 중복 제거 저장소를 생성합니다. SLACK_DEDUP_REDIS_URL이 있으면 Redis를 사용합니다.
+
+    Returns:
+        MemoryDedupStore | RedisDedupStore: 중복 제거 저장소
+    """
+    settings = get_settings()
+    if settings.SLACK_DEDUP_REDIS_URL:
+        return RedisDedupStore(settings.SLACK_DEDUP_REDIS_URL)
+    return MemoryDedupStore(maxsize=settings.SLACK_DEDUP_MAXSIZE)
+
+
+event_deduplicator = EventDeduplicator(create_dedup_store(), ttl=get_settings().SLACK_DEDUP_TTL_SECONDS)
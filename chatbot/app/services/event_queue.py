@@ -0,0 +1,188 @@
+"""
+슬랙 이벤트를 백그라운드에서 처리하는 작업 큐
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import logging
+import time
+
+from services.event_service import EventService
+from services.mcp_service import MCPService
+from services.slack_service import SlackService
+from utils.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class _Timing:
+    """처리 시간 집계 (개수/합계/최대, 밀리초)"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class EventQueue:
+    """
+    고정된 수의 워커가 크기가 제한된 큐의 이벤트를 처리합니다.
+    슬랙은 3초 안에 응답하지 않으면 이벤트를 재전송하므로, 컨트롤러는 큐에 넣기만 하고 바로 응답합니다.
+    큐가 가득 차면 이벤트를 받지 않으며(offer가 False 반환), 컨트롤러는 503으로 응답해 슬랙이 나중에 다시 보내게 합니다.
+    """
+
+    def __init__(self, handler: Callable[[Dict[str, Any]], Awaitable[None]],
+                 workers: int = 8, maxsize: int = 1000):
+        """
+        EventQueue 초기화
+
+        Args:
+            handler: 이벤트 하나를 처리하는 코루틴 함수
+            workers: 동시에 처리하는 워커 수
+            maxsize: 대기할 수 있는 최대 이벤트 수
+        """
+        self.handler = handler
+        self.workers = workers
+        self.maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._accepting = False
+        self._stopping = False
+        self.busy = 0
+        self.high_water = 0
+        self.enqueued = 0
+        self.rejected = 0
+        self.processed = 0
+        self.failed = 0
+        self.abandoned = 0
+        self.wait = _Timing()
+        self.handle = _Timing()
+
+    def start(self) -> None:
+        """워커를 시작합니다. (이벤트 루프 안에서 호출)"""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._tasks = [asyncio.create_task(self._work(), name=f"slack-event-worker-{i}") for i in range(self.workers)]
+        self._accepting = True
+        self._stopping = False
+
+    def offer(self, event: Dict[str, Any]) -> bool:
+        """
+        이벤트를 큐에 넣습니다. 기다리지 않습니다.
+
+        Args:
+            event: 슬랙 이벤트
+
+        Returns:
+            bool: 큐에 넣었는지 여부 (큐가 가득 찼거나 종료 중이면 False)
+        """
+        if not self._tasks:
+            self.start()
+        if not self._accepting:
+            self.rejected += 1
+            return False
+        try:
+            self._queue.put_nowait((time.perf_counter(), event))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return False
+        self.enqueued += 1
+        self.high_water = max(self.high_water, self._queue.qsize())
+        return True
+
+    async def _work(self) -> None:
+        while True:
+            queued_at, event = await self._queue.get()
+            self.wait.observe(queued_at)
+            self.busy += 1
+            started = time.perf_counter()
+            try:
+                await self.handler(event)
+                self.processed += 1
+            except asyncio.CancelledError:
+                # 워커 자신이 취소된 경우(drain)에만 종료합니다. 처리 중 다른 작업의 취소가 전파된 경우는 실패로 집계하고 계속 처리합니다.
+                if self._stopping:
+                    raise
+                self.failed += 1
+                logger.error(f"Slack event handler was cancelled: {event.get('type')}")
+            except Exception:
+                self.failed += 1
+                logger.exception(f"Error handling slack event {event.get('type')}")
+            finally:
+                self.handle.observe(started)
+                self.busy -= 1
+                self._queue.task_done()
+
+    async def drain(self, timeout: float) -> None:
+        """
+        새 이벤트를 받지 않고, 큐에 남은 이벤트를 timeout초까지 처리한 뒤 워커를 종료합니다.
+        그때까지 처리하지 못한 이벤트는 버리고 abandoned로 집계합니다.
+
+        Args:
+            timeout: 남은 이벤트 처리를 기다리는 최대 시간(초)
+        """
+        if not self._tasks:
+            return
+        self._accepting = False
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            self.abandoned = self._queue.qsize() + self.busy
+            logger.warning(f"Slack event queue drain timed out, abandoning {self.abandoned} events")
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        큐 상태와 처리 카운터를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 대기/처리 중인 이벤트 수, 최대 대기 수, 거부/실패 수, 대기/처리 시간
+        """
+        return {
+            "workers": self.workers,
+            "maxsize": self.maxsize,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "busy": self.busy,
+            "high_water": self.high_water,
+            "enqueued": self.enqueued,
+            "rejected": self.rejected,
+            "processed": self.processed,
+            "failed": self.failed,
+            "abandoned": self.abandoned,
+            "wait": self.wait.stats(),
+            "handle": self.handle.stats(),
+        }
+
+
+async def process_slack_event(event: Dict[str, Any]) -> None:
+    """
+    워커가 이벤트 하나를 처리합니다. 서비스는 공유 HTTP 클라이언트를 사용하므로 이벤트마다 생성합니다.
+
+    Args:
+        event: 슬랙 이벤트
+    """
+    await EventService(SlackService(), MCPService()).handle(event)
+
+
+_settings = get_settings()
+event_queue = EventQueue(
+    process_slack_event,
+    workers=_settings.SLACK_EVENT_WORKERS,
+    maxsize=_settings.SLACK_EVENT_QUEUE_SIZE,
+)
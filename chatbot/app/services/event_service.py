@@ -0,0 +1,102 @@
+"""
+슬랙 이벤트 처리를 담당하는 서비스
+"""
+from typing import Dict, Any
+import logging
+
+from services.slack_service import SlackService
+from services.mcp_service import MCPService
+from services.command_service import CommandService
+
+logger = logging.getLogger(__name__)
+
+# 백그라운드 워커가 처리하는 이벤트 타입
+HANDLED_EVENT_TYPES = {"message", "member_joined_channel"}
+
+WELCOME_MESSAGE = "안녕하세요! 라이드 셰어링 봇입니다. '도움말' 명령어를 입력하시면 사용 가능한 명령어 목록을 확인하실 수 있습니다."
+
+
+class EventService:
+    """슬랙 이벤트 처리를 담당하는 서비스 클래스"""
+
+    def __init__(self,
+                 slack_service: SlackService,
+                 mcp_service: MCPService):
+        """
+        EventService 초기화
+
+        Args:
+            slack_service: 슬랙 서비스 인스턴스
+            mcp_service: MCP 서비스 인스턴스
+        """
+        self.slack_service = slack_service
+        self.mcp_service = mcp_service
+
+    @staticmethod
+    def should_handle(event: Dict[str, Any]) -> bool:
+        """
+        처리할 이벤트인지 확인합니다. (큐에 넣기 전에 호출)
+
+        Args:
+            event: 슬랙 이벤트
+
+        Returns:
+            bool: 처리 대상 여부
+        """
+        event_type = event.get("type")
+        if event_type not in HANDLED_EVENT_TYPES:
+            return False
+
+        if event_type == "message":
+            # 봇 메시지와 사용자/본문이 없는 메시지(수정, 삭제 등) 무시
+            return not event.get("bot_id") and bool(event.get("user")) and bool(event.get("text"))
+        return True
+
+    async def handle(self, event: Dict[str, Any]) -> None:
+        """
+        슬랙 이벤트를 처리합니다.
+
+        Args:
+            event: 슬랙 이벤트
+        """
+        event_type = event.get("type")
+
+        # 메시지 이벤트 처리
+        if event_type == "message":
+            await self.handle_message(event)
+
+        # 사용자 참여 이벤트 처리
+        elif event_type == "member_joined_channel":
+            # 환영 메시지 전송
+            await self.slack_service.send_message(event.get("channel"), WELCOME_MESSAGE)
+
+    async def handle_message(self, event: Dict[str, Any]) -> None:
+        """
+        메시지 이벤트를 처리합니다. 기본 명령어는 직접 응답하고, 나머지는 MCP 서버로 중계합니다.
+
+        Args:
+            event: 슬랙 메시지 이벤트
+        """
+        user_id = event.get("user")
+        text = event.get("text")
+        channel = event.get("channel")
+
+        # 사용자 정보 조회
+        user_info = await self.slack_service.get_user_info(user_id)
+
+        # 명령어 처리 - 슬랙봇 자체에서 처리할 기본 명령어만 처리
+        command_service = CommandService(self.slack_service, self.mcp_service)
+        command_response = await command_service.process_message(user_id, text, channel)
+
+        if command_response:
+            # 명령어가 처리된 경우 응답 메시지 전송
+            await self.slack_service.send_message(channel, command_response)
+        else:
+            # 명령어가 아닌 경우 MCP 서버로 메시지 중계
+            # 모든 라이드 셰어링 관련 비즈니스 로직은 MCP 서버의 에이전트가 처리
+            await self.mcp_service.relay_message(
+                user_id=user_id,
+                user_name=user_info.get("name", "Unknown User"),
+                message=text,
+                channel_id=channel
+            )
@@ -2,14 +2,89 @@
 MCP 서버와의 통신을 담당하는 서비스
 """
 from typing import Dict, Any, Optional
+import asyncio
 import logging
+import random
 import httpx
 from datetime import datetime
 
-from utils.config import get_settings
+from utils.config import get_settings, Settings
 
 logger = logging.getLogger(__name__)
 
+# 멱등 요청을 재시도할 응답 상태 코드
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+# 요청이 서버에 전달되기 전에 실패한 오류 (멱등이 아닌 요청도 재시도 가능)
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# 멱등 요청만 재시도하는 오류 (서버가 요청을 받았을 수 있음)
+RETRY_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def create_mcp_client(settings: Settings) -> httpx.AsyncClient:
+    """
+    MCP 서버용 HTTP 클라이언트를 생성합니다.
+    
+    Args:
+        settings: 애플리케이션 설정
+        
+    Returns:
+        httpx.AsyncClient: 커넥션 풀/타임아웃이 설정된 클라이언트
+    """
+    http2 = settings.MCP_HTTP2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("h2 package is not installed; MCP client falls back to HTTP/1.1")
+            http2 = False
+    
+    return httpx.AsyncClient(
+        base_url=settings.MCP_API_URL,
+        headers={
+            "Authorization": f"Bearer {settings.MCP_API_KEY}",
+            "Content-Type": "application/json"
+        },
+        limits=httpx.Limits(
+            max_connections=settings.MCP_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.MCP_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.MCP_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            connect=settings.MCP_CONNECT_TIMEOUT,
+            read=settings.MCP_READ_TIMEOUT,
+            write=settings.MCP_READ_TIMEOUT,
+            pool=settings.MCP_POOL_TIMEOUT,
+        ),
+        http2=http2,
+    )
+
+
+def get_mcp_client() -> httpx.AsyncClient:
+    """
+    앱 전체에서 공유하는 MCP 서버용 HTTP 클라이언트를 반환합니다.
+    lifespan 밖(스크립트 등)에서 호출되면 처음 사용할 때 생성합니다.
+    
+    Returns:
+        httpx.AsyncClient: 공유 클라이언트
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_mcp_client(get_settings())
+    return _client
+
+
+async def close_mcp_client() -> None:
+    """공유 클라이언트의 커넥션을 모두 닫습니다. (애플리케이션 종료 시)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
 class MCPService:
     """MCP 서버와의 통신을 담당하는 서비스 클래스"""
     
@@ -18,6 +93,44 @@ class MCPService:
         settings = get_settings()
         self.api_url = settings.MCP_API_URL
         self.api_key = settings.MCP_API_KEY
+        self.retry_attempts = max(1, settings.MCP_RETRY_ATTEMPTS)
+        self.retry_backoff = settings.MCP_RETRY_BACKOFF
+        self.client = get_mcp_client()
+    
+    async def _request(self, method: str, path: str, idempotent: bool,
+                       timeout: Optional[float] = None, **kwargs) -> httpx.Response:
+        """
+        공유 클라이언트로 요청을 보내고, 실패하면 지터를 준 지수 백오프로 재시도합니다.
+        멱등 요청은 연결/타임아웃 오류와 429/502/503/504 응답에 재시도하고,
+        멱등이 아닌 요청은 서버에 전달되지 않은 경우(연결 실패, 풀 대기 초과)에만 재시도합니다.
+        
+        Args:
+            method: HTTP 메서드
+            path: MCP 서버 경로
+            idempotent: 여러 번 보내도 결과가 같은 요청인지 여부
+            timeout: 이 요청에만 적용할 타임아웃(초) (없으면 클라이언트 기본값)
+            
+        Returns:
+            httpx.Response: 성공 응답
+        """
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        
+        for attempt in range(1, self.retry_attempts + 1):
+            last_attempt = attempt == self.retry_attempts
+            try:
+                response = await self.client.request(method, path, **kwargs)
+                if not (idempotent and response.status_code in RETRY_STATUS_CODES) or last_attempt:
+                    response.raise_for_status()
+                    return response
+                logger.warning(f"MCP {method} {path} returned {response.status_code}, retrying ({attempt}/{self.retry_attempts})")
+            except NOT_SENT_ERRORS + RETRY_ERRORS as e:
+                if last_attempt or not (idempotent or isinstance(e, NOT_SENT_ERRORS)):
+                    raise
+                logger.warning(f"MCP {method} {path} failed: {e!r}, retrying ({attempt}/{self.retry_attempts})")
+            
+            # full jitter: 0 ~ backoff * 2^(attempt-1)초
+            await asyncio.sleep(random.uniform(0, self.retry_backoff * 2 ** (attempt - 1)))
     
     async def check_connection(self) -> bool:
         """
@@ -28,19 +141,8 @@ class MCPService:
         """
         try:
             # MCP 서버의 헬스 체크 엔드포인트 호출
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.api_url}/health",
-                    headers=headers,
-                    timeout=5.0
-                )
-                response.raise_for_status()
-                return True
+            await self._request("GET", "/health", idempotent=True, timeout=5.0)
+            return True
         except Exception as e:
             logger.error(f"MCP server connection check failed: {e}")
             return False
@@ -49,6 +151,7 @@ class MCPService:
                            channel_id: Optional[str] = None) -> Dict[str, Any]:
         """
         사용자 메시지를 MCP 서버로 중계합니다.
+        중계는 멱등이 아니므로 서버에 전달되지 않은 경우에만 재시도합니다.
         
         Args:
             user_id: 사용자 ID
@@ -72,19 +175,8 @@ class MCPService:
                 payload["channel_id"] = channel_id
             
             # MCP 서버로 데이터 전송
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.api_url}/api/messages",
-                    json=payload,
-                    headers=headers
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._request("POST", "/api/messages", idempotent=False, json=payload)
+            return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error relaying message to MCP server: {e}")
             raise
@@ -0,0 +1,258 @@
+"""
+슬랙 사용자 정보와 DM 채널 캐시
+"""
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import asyncio
+import logging
+import time
+
+from utils.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def _cancelling(task: Optional[asyncio.Task]) -> bool:
+    """작업 자체에 취소 요청이 있는지 여부 (Task.cancelling은 Python 3.11부터 제공)"""
+    cancelling = getattr(task, "cancelling", None)
+    return bool(cancelling()) if cancelling is not None else False
+
+
+class TTLCache:
+    """
+    TTL과 최대 크기(LRU)를 가진 캐시.
+    get_or_load는 같은 키의 동시 미스를 하나의 조회로 합칩니다(single-flight). 조회가 실패하면 캐시하지 않고 기다리던 호출 모두에 예외를 전달하며,
+    조회하던 호출이 취소되면 기다리던 호출이 다시 조회합니다.
+    """
+
+    def __init__(self, name: str, ttl: float, maxsize: int):
+        """
+        TTLCache 초기화
+
+        Args:
+            name: 캐시 이름 (통계용)
+            ttl: 항목을 보관하는 시간(초)
+            maxsize: 최대 항목 수 (넘으면 가장 오래 사용하지 않은 항목부터 제거)
+        """
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.loads = 0
+        self.load_errors = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        만료되지 않은 값을 반환합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[Any]: 캐시된 값 (없거나 만료되었으면 None)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        값을 저장합니다. (ttl초 뒤 만료)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        """항목을 지웁니다."""
+        self._entries.pop(key, None)
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        캐시된 값을 반환하고, 없으면 loader로 조회해 저장합니다.
+        같은 키를 조회 중인 호출이 있으면 새로 조회하지 않고 그 결과를 기다립니다.
+
+        Args:
+            key: 캐시 키
+            loader: 값을 조회하는 코루틴 함수
+
+        Returns:
+            Any: 캐시된 값 또는 조회한 값
+        """
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # 이 호출이 아니라 조회하던 호출이 취소된 경우에는 다시 조회합니다.
+                if not inflight.cancelled() or _cancelling(asyncio.current_task()):
+                    raise
+                return await self.get_or_load(key, loader)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            self.loads += 1
+            value = await loader()
+            self.put(key, value)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            # 기다리던 호출은 취소되지 않고 다시 조회합니다.
+            future.cancel()
+            raise
+        except Exception as e:
+            self.load_errors += 1
+            future.set_exception(e)
+            # 기다리는 호출이 없으면 "exception was never retrieved" 경고가 나지 않도록 확인 처리
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 크기, 적중/미스 수, 합쳐진 동시 미스 수, 조회/실패 수, 제거 수
+        """
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "loads": self.loads,
+            "load_errors": self.load_errors,
+            "evictions": self.evictions,
+        }
+
+
+class UserPrefetcher:
+    """
+    users.list를 페이지 단위로 조회해 사용자 정보 캐시를 채우고, interval초마다 다시 채웁니다.
+    새로 고침 주기를 캐시 TTL보다 짧게 두면 기존 사용자의 정보는 만료되지 않고 갱신됩니다.
+    """
+
+    def __init__(self, cache: TTLCache, interval: float, page_size: int = 200):
+        """
+        UserPrefetcher 초기화
+
+        Args:
+            cache: 사용자 정보 캐시
+            interval: 다시 채우는 주기(초), 0이면 시작할 때 한 번만 채움
+            page_size: users.list 페이지 크기 (슬랙 권장 최대 200)
+        """
+        self.cache = cache
+        self.interval = interval
+        self.page_size = page_size
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.errors = 0
+        self.last_count = 0
+        self.last_duration_ms = 0.0
+
+    async def warm(self, client) -> int:
+        """
+        users.list의 모든 페이지를 조회해 캐시에 저장합니다.
+
+        Args:
+            client: 슬랙 AsyncWebClient
+
+        Returns:
+            int: 저장한 사용자 수
+        """
+        started = time.perf_counter()
+        count, cursor = 0, None
+        while True:
+            response = await client.users_list(limit=self.page_size, cursor=cursor)
+            for member in response.get("members", []):
+                self.cache.put(member["id"], member)
+                count += 1
+            cursor = (response.get("response_metadata") or {}).get("next_cursor")
+            if not cursor:
+                break
+        self.runs += 1
+        self.last_count = count
+        self.last_duration_ms = round((time.perf_counter() - started) * 1000, 3)
+        return count
+
+    async def _run(self, client) -> None:
+        while True:
+            try:
+                count = await self.warm(client)
+                logger.info(f"Prefetched {count} slack users")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Error prefetching slack users: {e}")
+            if self.interval <= 0:
+                return
+            await asyncio.sleep(self.interval)
+
+    def start(self, client) -> None:
+        """
+        백그라운드에서 캐시 채우기를 시작합니다. 시작을 기다리지 않으므로 채우는 중의 미스는 users.info로 조회합니다.
+
+        Args:
+            client: 슬랙 AsyncWebClient
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(client), name="slack-user-prefetch")
+
+    async def close(self) -> None:
+        """백그라운드 작업을 종료합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 채우기 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 실행/실패 횟수, 마지막으로 채운 사용자 수와 소요 시간
+        """
+        return {
+            "interval_seconds": self.interval,
+            "runs": self.runs,
+            "errors": self.errors,
+            "last_count": self.last_count,
+            "last_duration_ms": self.last_duration_ms,
+        }
+
+
+_settings = get_settings()
+user_cache = TTLCache("user_info", ttl=_settings.SLACK_USER_CACHE_TTL_SECONDS, maxsize=_settings.SLACK_USER_CACHE_MAXSIZE)
+dm_channel_cache = TTLCache("dm_channel", ttl=_settings.SLACK_DM_CHANNEL_CACHE_TTL_SECONDS, maxsize=_settings.SLACK_DM_CHANNEL_CACHE_MAXSIZE)
+user_prefetcher = UserPrefetcher(user_cache, interval=_settings.SLACK_USER_REFRESH_SECONDS)
@@ -3,20 +3,91 @@
 """
 from typing import Dict, Any, Optional
 import logging
-from slack_sdk import WebClient
+import aiohttp
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_async_handlers import (
+    AsyncConnectionErrorRetryHandler,
+    AsyncRateLimitErrorRetryHandler,
+)
+from slack_sdk.web.async_client import AsyncWebClient
 
-from utils.config import get_settings
+from services.slack_cache import dm_channel_cache, user_cache
+from utils.config import get_settings, Settings
 
 logger = logging.getLogger(__name__)
 
+_session: Optional[aiohttp.ClientSession] = None
+_client: Optional[AsyncWebClient] = None
+
+
+def create_slack_client(settings: Settings, session: aiohttp.ClientSession) -> AsyncWebClient:
+    """
+    공유 aiohttp 세션을 사용하는 슬랙 Web API 클라이언트를 생성합니다.
+    요청 한도 초과(429)는 Retry-After만큼 기다린 뒤, 연결 오류는 한 번 재시도합니다.
+    
+    Args:
+        settings: 애플리케이션 설정
+        session: 커넥션 풀을 가진 aiohttp 세션
+        
+    Returns:
+        AsyncWebClient: 슬랙 Web API 클라이언트
+    """
+    return AsyncWebClient(
+        token=settings.SLACK_BOT_TOKEN,
+        base_url=settings.SLACK_API_URL,
+        timeout=settings.SLACK_HTTP_TIMEOUT,
+        session=session,
+        retry_handlers=[
+            AsyncConnectionErrorRetryHandler(),
+            AsyncRateLimitErrorRetryHandler(max_retry_count=settings.SLACK_RATE_LIMIT_RETRIES),
+        ],
+    )
+
+
+def get_slack_client() -> AsyncWebClient:
+    """
+    앱 전체에서 공유하는 슬랙 Web API 클라이언트를 반환합니다.
+    aiohttp 세션은 이벤트 루프 안에서 만들어야 하므로 lifespan이나 async 함수 안에서 호출합니다.
+    lifespan 밖(스크립트 등)에서 호출되면 처음 사용할 때 생성합니다.
+    
+    Returns:
+        AsyncWebClient: 공유 클라이언트
+    """
+    global _session, _client
+    if _client is None or _session is None or _session.closed:
+        settings = get_settings()
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=settings.SLACK_HTTP_MAX_CONNECTIONS, ttl_dns_cache=300),
+        )
+        _client = create_slack_client(settings, _session)
+    return _client
+
+
+async def close_slack_client() -> None:
+    """공유 aiohttp 세션의 커넥션을 모두 닫습니다. (애플리케이션 종료 시)"""
+    global _session, _client
+    if _session is not None:
+        await _session.close()
+    _session = None
+    _client = None
+
+
 class SlackService:
     """슬랙 API와의 통신을 담당하는 서비스 클래스"""
     
     def __init__(self):
         """SlackService 초기화"""
-        settings = get_settings()
-        self.client = WebClient(token=settings.SLACK_BOT_TOKEN)
+        self._client: Optional[AsyncWebClient] = None
+    
+    @property
+    def client(self) -> AsyncWebClient:
+        """
+        슬랙 Web API 클라이언트
+        FastAPI는 동기 의존성(__init__)을 스레드 풀에서 실행하므로, 공유 클라이언트는 async 메서드 안에서 처음 사용할 때 가져옵니다.
+        """
+        if self._client is None:
+            self._client = get_slack_client()
+        return self._client
     
     async def send_message(self, channel_id: str, text: str) -> Dict[str, Any]:
         """
@@ -30,7 +101,7 @@ class SlackService:
             Dict[str, Any]: 슬랙 API 응답
         """
         try:
-            response = self.client.chat_postMessage(
+            response = await self.client.chat_postMessage(
                 channel=channel_id,
                 text=text
             )
@@ -42,6 +113,7 @@ class SlackService:
     async def send_direct_message(self, user_id: str, text: str) -> Dict[str, Any]:
         """
         사용자에게 다이렉트 메시지를 전송합니다.
+        DM 채널 ID는 캐시하여 conversations.open을 사용자마다 한 번만 호출합니다.
         
         Args:
             user_id: 메시지를 전송할 사용자 ID
@@ -52,8 +124,7 @@ class SlackService:
         """
         try:
             # 사용자와의 DM 채널 열기
-            response = self.client.conversations_open(users=user_id)
-            channel_id = response["channel"]["id"]
+            channel_id = await dm_channel_cache.get_or_load(user_id, lambda: self._open_dm_channel(user_id))
             
             # 메시지 전송
             return await self.send_message(channel_id, text)
@@ -64,6 +135,8 @@ class SlackService:
     async def get_user_info(self, user_id: str) -> Dict[str, Any]:
         """
         사용자 정보를 조회합니다.
+        시작 시 users.list로 채워 두고 주기적으로 갱신하는 캐시를 먼저 확인하며,
+        같은 사용자에 대한 동시 미스는 users.info 한 번으로 합칩니다.
         
         Args:
             user_id: 조회할 사용자 ID
@@ -72,8 +145,15 @@ class SlackService:
             Dict[str, Any]: 사용자 정보
         """
         try:
-            response = self.client.users_info(user=user_id)
-            return response["user"]
+            return await user_cache.get_or_load(user_id, lambda: self._fetch_user_info(user_id))
         except SlackApiError as e:
             logger.error(f"Error getting user info: {e}")
-            raise
\ No newline at end of file
+            raise
+    
+    async def _open_dm_channel(self, user_id: str) -> str:
+        response = await self.client.conversations_open(users=user_id)
+        return response["channel"]["id"]
+    
+    async def _fetch_user_info(self, user_id: str) -> Dict[str, Any]:
+        response = await self.client.users_info(user=user_id)
+        return response["user"]
\ No newline at end of file
@@ -16,10 +16,45 @@ class Settings(BaseSettings):
     SLACK_BOT_TOKEN: str
     SLACK_SIGNING_SECRET: str
     
+    # 슬랙 Web API 클라이언트 설정 (앱 전체에서 aiohttp 세션을 공유)
+    SLACK_API_URL: str = "https://slack.com/api/"
+    SLACK_HTTP_MAX_CONNECTIONS: int = 100
+    SLACK_HTTP_TIMEOUT: int = 30
+    SLACK_RATE_LIMIT_RETRIES: int = 2
+    
+    # 슬랙 이벤트 백그라운드 처리 (워커 수, 큐 크기, 종료 시 남은 이벤트를 처리하는 최대 시간(초))
+    SLACK_EVENT_WORKERS: int = 8
+    SLACK_EVENT_QUEUE_SIZE: int = 1000
+    SLACK_EVENT_DRAIN_TIMEOUT: float = 25.0
+    
+    # 슬랙 이벤트 중복 제거 (기억하는 시간(초), 메모리 저장소 최대 키 수, 여러 인스턴스가 공유할 Redis URL)
+    SLACK_DEDUP_TTL_SECONDS: float = 600
+    SLACK_DEDUP_MAXSIZE: int = 100000
+    SLACK_DEDUP_REDIS_URL: Optional[str] = None
+    
+    # 슬랙 사용자 정보/DM 채널 캐시 (보관 시간(초), 최대 항목 수, users.list로 다시 채우는 주기(초), 0이면 시작 시 한 번)
+    SLACK_USER_CACHE_TTL_SECONDS: float = 3600
+    SLACK_USER_CACHE_MAXSIZE: int = 10000
+    SLACK_DM_CHANNEL_CACHE_TTL_SECONDS: float = 86400
+    SLACK_DM_CHANNEL_CACHE_MAXSIZE: int = 10000
+    SLACK_USER_PREFETCH: bool = True
+    SLACK_USER_REFRESH_SECONDS: float = 1800
+    
     # MCP 서버 설정
     MCP_API_URL: str
     MCP_API_KEY: str
     
+    # MCP 서버 HTTP 클라이언트 설정 (앱 전체에서 커넥션 풀을 공유)
+    MCP_HTTP_MAX_CONNECTIONS: int = 100
+    MCP_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    MCP_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    MCP_HTTP2: bool = True
+    MCP_CONNECT_TIMEOUT: float = 5.0
+    MCP_READ_TIMEOUT: float = 30.0
+    MCP_POOL_TIMEOUT: float = 5.0
+    MCP_RETRY_ATTEMPTS: int = 3
+    MCP_RETRY_BACKOFF: float = 0.2
+    
     # 애플리케이션 설정
     LOG_LEVEL: str = "INFO"
     DATABASE_URL: Optional[str] = None
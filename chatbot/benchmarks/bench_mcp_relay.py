@@ -0,0 +1,160 @@
+"""
+MCP 메시지 중계 처리량 벤치마크
+
+로컬 스텁 MCP 서버(/api/messages, 응답 지연 --delay-ms)를 별도 프로세스로 띄우고 --messages개의 메시지를 --concurrency개씩 동시에 중계합니다.
+- old: 예전처럼 호출마다 httpx.AsyncClient를 새로 만들어 전송 (매번 TCP 연결, keep-alive 없음)
+- new: MCPService.relay_message (앱 전체에서 공유하는 커넥션 풀 클라이언트)
+
+스텁 서버가 받은 TCP 연결 수도 함께 출력합니다. 스텁은 평문 HTTP이므로 TLS 핸드셰이크 비용은 포함되지 않습니다.
+실제 MCP 서버(HTTPS)로 비교하려면 --url을 지정합니다.
+
+실행 (chatbot 디렉토리에서):
+    python benchmarks/bench_mcp_relay.py --messages 2000 --concurrency 50
+    python benchmarks/bench_mcp_relay.py --url https://mcp.example.com --messages 200
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import time
+from datetime import datetime
+
+import httpx
+import uvicorn
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../app'))
+
+API_KEY = "bench-api-key"
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def stub_mcp_app(delay):
+    """
+    delay초 뒤 응답하는 MCP 서버 스텁.
+    요청을 받은 TCP 연결(클라이언트 주소)을 기록하며, GET /_connections는 그 수를 반환하고 초기화합니다.
+    """
+    connections = set()
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        if scope["path"] == "/_connections":
+            body = {"connections": len(connections)}
+            connections.clear()
+        else:
+            connections.add(tuple(scope["client"]))
+            while (await receive()).get("more_body"):
+                pass
+            if delay:
+                await asyncio.sleep(delay)
+            body = {"status": "accepted"}
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": json.dumps(body).encode()})
+    return app
+
+
+def serve_stub(port, delay):
+    uvicorn.run(stub_mcp_app(delay), host="127.0.0.1", port=port, log_level="warning", lifespan="off", backlog=4096)
+
+
+def start_stub_server(delay):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    process = multiprocessing.Process(target=serve_stub, args=(port, delay), daemon=True)
+    process.start()
+    url = f"http://127.0.0.1:{port}"
+    while True:
+        try:
+            httpx.get(f"{url}/_connections")
+            return process, url
+        except httpx.TransportError:
+            time.sleep(0.05)
+
+
+def take_connection_count(url):
+    return httpx.get(f"{url}/_connections").json()["connections"]
+
+
+async def old_relay(url, user_id, message):
+    payload = {"user_id": user_id, "user_name": "bench", "message": message, "timestamp": datetime.now().isoformat()}
+    headers = {"Authorization": f"Bearer {API_KEY}", "Content-Type": "application/json"}
+    async with httpx.AsyncClient() as client:
+        response = await client.post(f"{url}/api/messages", json=payload, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+
+async def run(relay, messages, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, errors = [], 0
+
+    async def one(i):
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await relay(f"U{i % 100:04d}", f"메시지 {i}")
+            except httpx.HTTPError:
+                errors += 1
+                return
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(messages)))
+    return time.perf_counter() - started, latencies, errors
+
+
+def report(name, elapsed, latencies, errors, connections=None):
+    print(
+        f"{name:4s} {len(latencies) / elapsed:9.1f} msg/s  "
+        f"p50 {percentile(latencies, 50):7.2f}ms  p99 {percentile(latencies, 99):7.2f}ms  "
+        f"errors {errors}  connections {connections if connections is not None else '-'}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--delay-ms", type=float, default=5.0, help="스텁 서버의 응답 지연")
+    parser.add_argument("--url", help="스텁 대신 사용할 MCP 서버 URL")
+    args = parser.parse_args()
+
+    stub = None
+    url = args.url
+    if url is None:
+        stub, url = start_stub_server(args.delay_ms / 1000)
+
+    os.environ.update({"MCP_API_URL": url, "MCP_API_KEY": API_KEY})
+    os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-bench")
+    os.environ.setdefault("SLACK_SIGNING_SECRET", "bench")
+    from services.mcp_service import MCPService, close_mcp_client
+
+    print(f"MCP {url}, {args.messages} messages, concurrency {args.concurrency}")
+    elapsed, latencies, errors = await run(lambda user_id, message: old_relay(url, user_id, message), args.messages, args.concurrency)
+    report("old", elapsed, latencies, errors, take_connection_count(url) if stub else None)
+
+    service = MCPService()
+    elapsed, latencies, errors = await run(
+        lambda user_id, message: service.relay_message(user_id=user_id, user_name="bench", message=message),
+        args.messages, args.concurrency,
+    )
+    report("new", elapsed, latencies, errors, take_connection_count(url) if stub else None)
+    await close_mcp_client()
+
+    if stub is not None:
+        stub.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,194 @@
+"""
+슬랙 Web API 동시 메시지 처리량 부하 테스트
+
+로컬 가짜 슬랙 API(users.info, users.list, conversations.open, chat.postMessage, 응답 지연 --delay-ms)를 별도 프로세스로 띄우고
+--conversations개의 대화가 동시에 진행될 때, 대화마다 사용자 정보 조회 후 DM을 --messages번 보내는 처리량을 측정합니다.
+- old: 예전 SlackService처럼 async 메서드 안에서 동기 WebClient를 호출 (호출마다 이벤트 루프가 멈춤)
+- new: SlackService (공유 aiohttp 세션의 AsyncWebClient, 사용자 정보/DM 채널 캐시)
+  --prefetch이면 측정 전에 users.list로 사용자 정보 캐시를 채웁니다.
+
+--rate-limit-every N이면 가짜 API가 chat.postMessage N번째마다 429(Retry-After: 0)를 반환합니다.
+new는 재시도 핸들러가 다시 보내고, old는 오류로 집계됩니다.
+
+실행 (chatbot 디렉토리에서):
+    python benchmarks/bench_slack_send.py --conversations 50 --messages 20
+    python benchmarks/bench_slack_send.py --conversations 50 --messages 20 --rate-limit-every 25
+    python benchmarks/bench_slack_send.py --conversations 500 --messages 2 --prefetch
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import time
+from urllib.parse import parse_qs
+
+import httpx
+import uvicorn
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../app'))
+
+# 가짜 슬랙 API의 users.list 사용자 수
+USERS = 1000
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def fake_slack_app(delay, rate_limit_every):
+    """
+    delay초 뒤 응답하는 가짜 슬랙 Web API.
+    users.list는 U0000 ~ U(USERS-1) 사용자를 cursor로 페이지를 나누어 반환합니다.
+    GET /_stats는 받은 TCP 연결 수와 메서드별 호출 수, 429 응답 수를 반환하고 초기화합니다.
+    """
+    stats = {"connections": set(), "calls": {}, "posts": 0, "rate_limited": 0}
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        status, headers = 200, [(b"content-type", b"application/json")]
+        method = scope["path"].rsplit("/", 1)[-1]
+        if method == "_stats":
+            body = {"connections": len(stats["connections"]), "calls": stats["calls"], "rate_limited": stats["rate_limited"]}
+            stats.update(connections=set(), calls={}, posts=0, rate_limited=0)
+        else:
+            stats["connections"].add(tuple(scope["client"]))
+            stats["calls"][method] = stats["calls"].get(method, 0) + 1
+            request_body = b""
+            while True:
+                message = await receive()
+                request_body += message.get("body", b"")
+                if not message.get("more_body"):
+                    break
+            params = {key: values[0] for key, values in parse_qs(scope["query_string"].decode() + "&" + request_body.decode(errors="ignore")).items()}
+            if delay:
+                await asyncio.sleep(delay)
+            if method == "users.info":
+                user_id = params.get("user", "U0000")
+                body = {"ok": True, "user": {"id": user_id, "name": f"bench-{user_id}", "real_name": "벤치"}}
+            elif method == "users.list":
+                offset, limit = int(params.get("cursor") or 0), int(params.get("limit") or 200)
+                members = [{"id": f"U{i:04d}", "name": f"bench-U{i:04d}"} for i in range(offset, min(offset + limit, USERS))]
+                next_cursor = str(offset + limit) if offset + limit < USERS else ""
+                body = {"ok": True, "members": members, "response_metadata": {"next_cursor": next_cursor}}
+            elif method == "conversations.open":
+                body = {"ok": True, "channel": {"id": "D0001"}}
+            elif method == "chat.postMessage":
+                stats["posts"] += 1
+                if rate_limit_every and stats["posts"] % rate_limit_every == 0:
+                    stats["rate_limited"] += 1
+                    status, body = 429, {"ok": False, "error": "ratelimited"}
+                    headers.append((b"retry-after", b"0"))
+                else:
+                    body = {"ok": True, "channel": "D0001", "ts": f"{time.time():.6f}"}
+            else:
+                body = {"ok": False, "error": "unknown_method"}
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": json.dumps(body).encode()})
+    return app
+
+
+def serve_fake_slack(port, delay, rate_limit_every):
+    uvicorn.run(fake_slack_app(delay, rate_limit_every), host="127.0.0.1", port=port,
+                log_level="warning", lifespan="off", backlog=4096)
+
+
+def start_fake_slack(delay, rate_limit_every):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    process = multiprocessing.Process(target=serve_fake_slack, args=(port, delay, rate_limit_every), daemon=True)
+    process.start()
+    url = f"http://127.0.0.1:{port}/api/"
+    while True:
+        try:
+            httpx.get(f"{url}_stats")
+            return process, url
+        except httpx.TransportError:
+            time.sleep(0.05)
+
+
+def take_stats(url):
+    return httpx.get(f"{url}_stats").json()
+
+
+class OldSlackService:
+    """예전 SlackService: async 메서드가 동기 WebClient를 호출합니다."""
+    def __init__(self, url):
+        self.client = WebClient(token="xoxb-bench", base_url=url)
+
+    async def send_direct_message(self, user_id, text):
+        response = self.client.conversations_open(users=user_id)
+        return self.client.chat_postMessage(channel=response["channel"]["id"], text=text)
+
+    async def get_user_info(self, user_id):
+        return self.client.users_info(user=user_id)["user"]
+
+
+async def run(service, conversations, messages):
+    latencies, errors = [], 0
+
+    async def conversation(i):
+        nonlocal errors
+        user_id = f"U{i:04d}"
+        for n in range(messages):
+            started = time.perf_counter()
+            try:
+                user = await service.get_user_info(user_id)
+                await service.send_direct_message(user_id, f"{user['name']}님, 메시지 {n}")
+            except SlackApiError:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(conversation(i) for i in range(conversations)))
+    return time.perf_counter() - started, latencies, errors
+
+
+def report(name, elapsed, latencies, errors, stats):
+    print(
+        f"{name:4s} {len(latencies) / elapsed:9.1f} msg/s  "
+        f"p50 {percentile(latencies, 50):7.2f}ms  p99 {percentile(latencies, 99):7.2f}ms  "
+        f"errors {errors}  connections {stats['connections']}  429s {stats['rate_limited']}"
+    )
+    print(f"     calls {stats['calls']}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--conversations", type=int, default=50)
+    parser.add_argument("--messages", type=int, default=20, help="대화당 메시지 수")
+    parser.add_argument("--delay-ms", type=float, default=20.0, help="가짜 슬랙 API의 응답 지연")
+    parser.add_argument("--rate-limit-every", type=int, default=0)
+    parser.add_argument("--prefetch", action="store_true", help="new 측정 전에 users.list로 사용자 정보 캐시를 채움")
+    args = parser.parse_args()
+
+    fake, url = start_fake_slack(args.delay_ms / 1000, args.rate_limit_every)
+    os.environ.update({"SLACK_API_URL": url, "SLACK_BOT_TOKEN": "xoxb-bench"})
+    os.environ.setdefault("SLACK_SIGNING_SECRET", "bench")
+    os.environ.setdefault("MCP_API_URL", "http://127.0.0.1:1")
+    os.environ.setdefault("MCP_API_KEY", "bench")
+    from services.slack_cache import user_cache, user_prefetcher
+    from services.slack_service import SlackService, close_slack_client, get_slack_client
+
+    print(f"{args.conversations} conversations x {args.messages} messages, Slack API delay {args.delay_ms}ms")
+    report("old", *await run(OldSlackService(url), args.conversations, args.messages), take_stats(url))
+    if args.prefetch:
+        print(f"prefetched {await user_prefetcher.warm(get_slack_client())} users: {take_stats(url)['calls']}")
+    report("new", *await run(SlackService(), args.conversations, args.messages), take_stats(url))
+    print(f"     user cache {user_cache.stats()}")
+    await close_slack_client()
+    fake.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,11 @@
+import os
+import sys
+
+# 애플리케이션 모듈은 chatbot/app 기준으로 import합니다. (from services... / from utils...)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../app"))
+
+# 서비스 모듈은 import 시 설정을 읽으므로 필수 설정에 테스트용 값을 채웁니다. (외부 API는 호출하지 않음)
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-test")
+os.environ.setdefault("SLACK_SIGNING_SECRET", "test")
+os.environ.setdefault("MCP_API_URL", "http://127.0.0.1:1")
+os.environ.setdefault("MCP_API_KEY", "test")
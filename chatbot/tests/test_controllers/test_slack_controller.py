@@ -0,0 +1,30 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from controllers import slack_controller
+from services.event_dedup import EventDeduplicator, MemoryDedupStore
+
+
+def message_callback(event_id):
+    return {
+        "type": "event_callback",
+        "event_id": event_id,
+        "event": {"type": "message", "user": "U1", "text": "안녕하세요", "channel": "D1", "client_msg_id": f"msg-{event_id}"},
+    }
+
+
+def test_rejected_event_is_forgotten_so_the_retry_is_accepted(monkeypatch):
+    offers = []
+    monkeypatch.setattr(slack_controller, "event_deduplicator", EventDeduplicator(MemoryDedupStore(), ttl=60))
+    monkeypatch.setattr(slack_controller.event_queue, "offer", lambda event: offers.append(event) or len(offers) > 1)
+    app = FastAPI()
+    app.include_router(slack_controller.router)
+    client = TestClient(app)
+
+    # 큐가 가득 차 503으로 응답한 이벤트는 슬랙이 재전송하면 다시 큐에 넣습니다.
+    assert client.post("/slack/events", json=message_callback("Ev1")).status_code == 503
+    assert client.post("/slack/events", json=message_callback("Ev1"), headers={"X-Slack-Retry-Num": "1"}).status_code == 200
+    # 큐에 넣은 뒤의 재전송은 버립니다.
+    assert client.post("/slack/events", json=message_callback("Ev1"), headers={"X-Slack-Retry-Num": "2"}).status_code == 200
+
+    assert len(offers) == 2
@@ -0,0 +1,84 @@
+import pytest
+
+from services.event_dedup import EventDeduplicator, MemoryDedupStore
+
+
+def callback(event_id, client_msg_id=None):
+    event = {"type": "message", "user": "U1", "text": "안녕하세요"}
+    if client_msg_id:
+        event["client_msg_id"] = client_msg_id
+    return {"type": "event_callback", "event_id": event_id, "event": event}
+
+
+class FailingStore:
+    async def add_if_absent(self, key, ttl):
+        raise ConnectionError("redis is down")
+
+    async def discard(self, key):
+        raise ConnectionError("redis is down")
+
+
+@pytest.mark.asyncio
+async def test_retried_delivery_is_duplicate_by_event_id():
+    dedup = EventDeduplicator(MemoryDedupStore(), ttl=60)
+
+    assert await dedup.is_duplicate(callback("Ev1", "m1")) is False
+    assert await dedup.is_duplicate(callback("Ev1", "m1"), retry_num="1") is True
+
+    stats = dedup.stats()
+    assert stats["retries"] == 1
+    assert stats["duplicates"] == {"event_id": 1, "client_msg_id": 0}
+
+
+@pytest.mark.asyncio
+async def test_same_message_with_new_event_id_is_duplicate_by_client_msg_id():
+    dedup = EventDeduplicator(MemoryDedupStore(), ttl=60)
+
+    assert await dedup.is_duplicate(callback("Ev1", "m1")) is False
+    assert await dedup.is_duplicate(callback("Ev2", "m1")) is True
+    assert dedup.stats()["duplicates"] == {"event_id": 0, "client_msg_id": 1}
+
+
+@pytest.mark.asyncio
+async def test_keys_added_before_a_duplicate_key_are_rolled_back():
+    dedup = EventDeduplicator(MemoryDedupStore(), ttl=60)
+    await dedup.is_duplicate(callback("Ev1", "m1"))
+
+    # Ev2는 client_msg_id로 중복 처리되며, 이때 추가한 event_id 키는 되돌려야 합니다.
+    assert await dedup.is_duplicate(callback("Ev2", "m1")) is True
+    assert await dedup.is_duplicate(callback("Ev2", "m2")) is False
+
+
+@pytest.mark.asyncio
+async def test_forgotten_event_is_accepted_again():
+    dedup = EventDeduplicator(MemoryDedupStore(), ttl=60)
+    payload = callback("Ev1", "m1")
+    await dedup.is_duplicate(payload)
+
+    # 큐가 가득 차 503으로 응답한 경우, 슬랙의 재전송은 처리되어야 합니다.
+    await dedup.forget(payload)
+
+    assert await dedup.is_duplicate(payload, retry_num="1") is False
+
+
+@pytest.mark.asyncio
+async def test_memory_store_expires_and_bounds_keys():
+    store = MemoryDedupStore(maxsize=2)
+    assert await store.add_if_absent("a", ttl=0) is True
+    assert await store.add_if_absent("a", ttl=60) is True
+
+    await store.add_if_absent("b", ttl=60)
+    await store.add_if_absent("c", ttl=60)
+
+    assert len(store) == 2
+    assert store.evicted == 1
+    assert await store.add_if_absent("a", ttl=60) is True
+
+
+@pytest.mark.asyncio
+async def test_store_errors_let_the_event_through():
+    dedup = EventDeduplicator(FailingStore(), ttl=60)
+
+    assert await dedup.is_duplicate(callback("Ev1", "m1")) is False
+    await dedup.forget(callback("Ev1", "m1"))
+    assert dedup.stats()["errors"] == 2
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from services.event_queue import EventQueue
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_events():
+    release = asyncio.Event()
+
+    async def handler(event):
+        await release.wait()
+
+    queue = EventQueue(handler, workers=1, maxsize=2)
+    accepted = [queue.offer({"type": "message", "n": n}) for n in range(4)]
+    # 워커가 첫 이벤트를 가져가기 전이므로 큐 크기만큼만 받습니다.
+    assert accepted == [True, True, False, False]
+
+    release.set()
+    await queue.drain(timeout=1)
+    stats = queue.stats()
+    assert (stats["enqueued"], stats["rejected"], stats["processed"]) == (2, 2, 2)
+
+
+@pytest.mark.asyncio
+async def test_drain_processes_queued_events_and_stops_accepting():
+    handled = []
+
+    async def handler(event):
+        await asyncio.sleep(0.001)
+        handled.append(event["n"])
+
+    queue = EventQueue(handler, workers=4, maxsize=100)
+    for n in range(50):
+        assert queue.offer({"type": "message", "n": n})
+
+    drain = asyncio.create_task(queue.drain(timeout=5))
+    await asyncio.sleep(0)
+    # 종료 중에는 새 이벤트를 받지 않습니다.
+    assert queue.offer({"type": "message", "n": 50}) is False
+    await drain
+
+    assert sorted(handled) == list(range(50))
+    assert queue.stats()["abandoned"] == 0
+
+
+@pytest.mark.asyncio
+async def test_drain_timeout_counts_abandoned_events():
+    async def handler(event):
+        await asyncio.sleep(10)
+
+    queue = EventQueue(handler, workers=1, maxsize=10)
+    for n in range(3):
+        queue.offer({"type": "message", "n": n})
+    await asyncio.sleep(0)
+
+    await queue.drain(timeout=0.05)
+
+    # 처리 중인 1개와 대기 중인 2개
+    assert queue.stats()["abandoned"] == 3
+
+
+@pytest.mark.asyncio
+async def test_handler_errors_and_foreign_cancellation_do_not_stop_workers():
+    async def handler(event):
+        if event["n"] == 0:
+            raise RuntimeError("slack api error")
+        if event["n"] == 1:
+            # 다른 작업의 취소가 전파된 경우 (예: single-flight 조회를 하던 작업이 취소됨)
+            future = asyncio.get_running_loop().create_future()
+            future.cancel()
+            await future
+
+    queue = EventQueue(handler, workers=1, maxsize=10)
+    for n in range(4):
+        queue.offer({"type": "message", "n": n})
+
+    await queue.drain(timeout=1)
+
+    stats = queue.stats()
+    assert (stats["failed"], stats["processed"], stats["abandoned"]) == (2, 2, 0)
@@ -0,0 +1,96 @@
+import httpx
+import pytest
+
+from services import mcp_service
+from services.mcp_service import MCPService
+
+
+def make_service(responses):
+    """
+    responses를 순서대로 돌려주는 MockTransport 클라이언트를 사용하는 MCPService를 만듭니다.
+    항목이 예외 클래스이면 요청 시 그 예외를 발생시키고, 정수이면 그 상태 코드로 응답합니다.
+    """
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        result = responses[min(len(calls), len(responses)) - 1]
+        if isinstance(result, type):
+            raise result("mock failure", request=request)
+        return httpx.Response(result, json={"ok": result < 400})
+
+    service = MCPService()
+    service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://mcp.test")
+    service.retry_attempts = 3
+    # 백오프 상한이 0이면 재시도 사이에 기다리지 않습니다.
+    service.retry_backoff = 0
+    return service, calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", sorted(mcp_service.RETRY_STATUS_CODES))
+async def test_get_is_retried_on_retryable_status(status):
+    service, calls = make_service([status, 200])
+
+    response = await service._request("GET", "/health", idempotent=True)
+
+    assert response.status_code == 200
+    assert calls == ["GET", "GET"]
+
+
+@pytest.mark.asyncio
+async def test_get_is_retried_on_timeout_but_not_on_server_error():
+    service, calls = make_service([httpx.ReadTimeout, 200])
+    assert (await service._request("GET", "/health", idempotent=True)).status_code == 200
+    assert len(calls) == 2
+
+    service, calls = make_service([500, 200])
+    with pytest.raises(httpx.HTTPStatusError):
+        await service._request("GET", "/health", idempotent=True)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", mcp_service.NOT_SENT_ERRORS)
+async def test_post_is_retried_only_when_not_sent(error):
+    service, calls = make_service([error, 200])
+
+    response = await service._request("POST", "/api/messages", idempotent=False, json={})
+
+    assert response.status_code == 200
+    assert calls == ["POST", "POST"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("result", [httpx.ReadTimeout, httpx.RemoteProtocolError, 503, 429])
+async def test_post_is_not_retried_once_the_server_may_have_received_it(result):
+    service, calls = make_service([result, 200])
+
+    with pytest.raises(httpx.HTTPError):
+        await service._request("POST", "/api/messages", idempotent=False, json={})
+    assert calls == ["POST"]
+
+
+@pytest.mark.asyncio
+async def test_last_attempt_raises():
+    service, calls = make_service([503])
+    with pytest.raises(httpx.HTTPStatusError):
+        await service._request("GET", "/health", idempotent=True)
+    assert len(calls) == 3
+
+    service, calls = make_service([httpx.ConnectError])
+    with pytest.raises(httpx.ConnectError):
+        await service._request("POST", "/api/messages", idempotent=False, json={})
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_services_share_one_client_until_closed():
+    first = MCPService().client
+
+    assert MCPService().client is first
+
+    await mcp_service.close_mcp_client()
+    assert first.is_closed
+    assert MCPService().client is not first
+    await mcp_service.close_mcp_client()
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from services.slack_cache import TTLCache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    cache = TTLCache("test", ttl=60, maxsize=10)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"id": "U1"}
+
+    results = await asyncio.gather(*(cache.get_or_load("U1", loader) for _ in range(50)))
+
+    assert calls == 1
+    assert all(result == {"id": "U1"} for result in results)
+    assert await cache.get_or_load("U1", loader) == {"id": "U1"}
+    stats = cache.stats()
+    assert (stats["misses"], stats["coalesced"], stats["hits"], stats["loads"]) == (1, 49, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_load_error_reaches_every_waiter_and_is_not_cached():
+    cache = TTLCache("test", ttl=60, maxsize=10)
+    calls = 0
+
+    async def failing_loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("users.info failed")
+
+    results = await asyncio.gather(*(cache.get_or_load("U1", failing_loader) for _ in range(5)), return_exceptions=True)
+
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.get("U1") is None
+    assert cache.stats()["load_errors"] == 1
+
+    async def loader():
+        return {"id": "U1"}
+
+    # 실패는 캐시하지 않으므로 다음 호출이 다시 조회합니다.
+    assert await cache.get_or_load("U1", loader) == {"id": "U1"}
+
+
+@pytest.mark.asyncio
+async def test_waiters_reload_when_the_leading_load_is_cancelled():
+    cache = TTLCache("test", ttl=60, maxsize=10)
+    started = asyncio.Event()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            started.set()
+            await asyncio.sleep(10)
+        return {"id": "U1"}
+
+    leader = asyncio.create_task(cache.get_or_load("U1", loader))
+    await started.wait()
+    waiters = [asyncio.create_task(cache.get_or_load("U1", loader)) for _ in range(3)]
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await asyncio.gather(*waiters) == [{"id": "U1"}] * 3
+    assert calls == 2
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_the_load():
+    cache = TTLCache("test", ttl=60, maxsize=10)
+    release = asyncio.Event()
+
+    async def loader():
+        await release.wait()
+        return {"id": "U1"}
+
+    leader = asyncio.create_task(cache.get_or_load("U1", loader))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_load("U1", loader))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert await leader == {"id": "U1"}
+
+
+def test_expired_and_least_recently_used_entries_are_dropped():
+    cache = TTLCache("test", ttl=0, maxsize=10)
+    cache.put("U1", {"id": "U1"})
+    assert cache.get("U1") is None
+
+    cache = TTLCache("test", ttl=60, maxsize=2)
+    cache.put("U1", 1)
+    cache.put("U2", 2)
+    cache.get("U1")
+    cache.put("U3", 3)
+
+    assert cache.get("U2") is None
+    assert cache.get("U1") == 1
+    assert cache.stats()["evictions"] == 1
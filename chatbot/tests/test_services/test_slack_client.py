@@ -0,0 +1,47 @@
+import pytest
+
+import main
+from services import mcp_service, slack_service
+from services.slack_service import SlackService, close_slack_client, get_slack_client
+from utils.config import get_settings
+
+
+@pytest.mark.asyncio
+async def test_slack_client_is_shared_until_closed():
+    client = get_slack_client()
+    session = client.session
+
+    assert get_slack_client() is client
+    assert SlackService().client is client
+    assert not session.closed
+    assert session.connector.limit == get_settings().SLACK_HTTP_MAX_CONNECTIONS
+
+    await close_slack_client()
+    assert session.closed
+
+    # 닫힌 뒤에 호출하면 새 세션으로 다시 만듭니다.
+    reopened = get_slack_client()
+    assert reopened is not client
+    assert not reopened.session.closed
+    await close_slack_client()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_creates_and_closes_shared_clients(monkeypatch):
+    prefetched = []
+    monkeypatch.setattr(main.user_prefetcher, "start", prefetched.append)
+
+    async with main.lifespan(main.app):
+        mcp_client = mcp_service._client
+        slack_client = slack_service._client
+        assert mcp_client is not None and not mcp_client.is_closed
+        assert slack_client is not None and not slack_client.session.closed
+        # 요청 처리 중에는 lifespan이 만든 클라이언트를 그대로 사용합니다.
+        assert mcp_service.get_mcp_client() is mcp_client
+        assert SlackService().client is slack_client
+        assert prefetched == ([slack_client] if get_settings().SLACK_USER_PREFETCH else [])
+
+    assert mcp_client.is_closed
+    assert slack_client.session.closed
+    assert mcp_service._client is None
+    assert slack_service._client is None
@@ -1,7 +1,15 @@
 import os
 from contextlib import contextmanager
-from sqlalchemy import create_engine
+from typing import AsyncIterator, Iterator, List, Optional
+from fastapi import Request
+from sqlalchemy import Select, create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from config.pool_metrics import PoolMetrics
+from config.replica import PrimaryStickiness, ReplicaSelector, is_connection_error
+from config.request_metrics import request_metrics
 
 # 데이터베이스 연결 설정
 DB_HOST = os.environ.get("DB_HOST", "localhost")
@@ -10,16 +18,69 @@ DB_USER = os.environ.get("DB_USER", "fms_user")
 DB_PASSWORD = os.environ.get("DB_PASSWORD", "fms_password")
 DB_NAME = os.environ.get("DB_NAME", "fms")
 
+# 읽기 전용 복제본 설정 (예: "replica1:5432,replica2:5433"). 비어 있으면 모든 요청이 primary를 사용합니다.
+DB_REPLICA_HOSTS = [host.strip() for host in os.environ.get("DB_REPLICA_HOSTS", "").split(",") if host.strip()]
+DB_REPLICA_COOLDOWN_SECONDS = float(os.environ.get("DB_REPLICA_COOLDOWN_SECONDS", "30"))
+DB_READ_YOUR_WRITES_SECONDS = float(os.environ.get("DB_READ_YOUR_WRITES_SECONDS", "5"))
+
+# 커넥션 풀 설정 (엔진마다 적용됩니다. 복제본 엔진도 같은 값을 사용합니다.)
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+# 풀이 가득 찼을 때 커넥션을 기다리는 최대 시간(초). 초과하면 요청이 실패합니다.
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", "30"))
+# 이 시간(초)보다 오래된 커넥션은 다시 연결합니다. (-1이면 사용하지 않음)
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "-1"))
+# 세션 단위 PostgreSQL 타임아웃 (밀리초, 0이면 사용하지 않음)
+DB_STATEMENT_TIMEOUT_MS = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", "0"))
+DB_IDLE_IN_TRANSACTION_TIMEOUT_MS = int(os.environ.get("DB_IDLE_IN_TRANSACTION_TIMEOUT_MS", "0"))
+
+SERVER_SETTINGS = {
+    name: str(value)
+    for name, value in (
+        ("statement_timeout", DB_STATEMENT_TIMEOUT_MS),
+        ("idle_in_transaction_session_timeout", DB_IDLE_IN_TRANSACTION_TIMEOUT_MS),
+    )
+    if value > 0
+}
+
 # 데이터베이스 URL 생성
 DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+ASYNC_DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+
+# 엔진별 풀 계측 (GET /fms/internal/pool)
+pool_metrics: List[PoolMetrics] = []
+
+def _create_instrumented_engine(create, name: str, pool_class, **kwargs):
+    """설정된 풀 크기/타임아웃으로 엔진을 만들고 풀 계측과 SQL 실행 계측(GET /metrics)을 등록합니다."""
+    metrics = PoolMetrics(name)
+    created = create(
+        poolclass=metrics.pool_class(pool_class),
+        pool_pre_ping=True,  # 연결 유효성 검사
+        pool_size=DB_POOL_SIZE,  # 커넥션 풀 크기
+        max_overflow=DB_MAX_OVERFLOW,  # 최대 추가 연결 수
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        **kwargs,
+    )
+    metrics.instrument(created)
+    request_metrics.instrument(created)
+    pool_metrics.append(metrics)
+    return created
+
+def _create_async_engine(url: str, name: str):
+    return _create_instrumented_engine(
+        create_async_engine, name, AsyncAdaptedQueuePool,
+        url=url,
+        echo=False,
+        connect_args={"server_settings": SERVER_SETTINGS} if SERVER_SETTINGS else {},
+    )
 
 # 엔진 생성
-engine = create_engine(
+engine = _create_instrumented_engine(
+    create_engine, "primary_sync", QueuePool,
     url=DATABASE_URL,
     echo=False,  # SQL 쿼리 로깅 비활성화
-    pool_pre_ping=True,  # 연결 유효성 검사
-    pool_size=5,  # 커넥션 풀 크기
-    max_overflow=10  # 최대 추가 연결 수
+    connect_args={"options": " ".join(f"-c {name}={value}" for name, value in SERVER_SETTINGS.items())} if SERVER_SETTINGS else {},
 )
 
 # 세션 팩토리 생성
@@ -30,17 +91,93 @@ SessionLocal = sessionmaker(
     expire_on_commit=False
 )
 
-def get_db_session() -> Session:
+# asyncpg 기반 비동기 엔진 생성 (이벤트 루프를 블로킹하지 않음)
+async_engine = _create_async_engine(ASYNC_DATABASE_URL, "primary")
+
+# 읽기 전용 복제본 엔진 생성
+replica_engines = [
+    _create_async_engine(
+        f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{host if ':' in host else f'{host}:{DB_PORT}'}/{DB_NAME}",
+        f"replica:{host}",
+    )
+    for host in DB_REPLICA_HOSTS
+]
+replica_selector = ReplicaSelector(replica_engines, cooldown=DB_REPLICA_COOLDOWN_SECONDS)
+primary_stickiness = PrimaryStickiness(window=DB_READ_YOUR_WRITES_SECONDS)
+
+class RoutingSession(Session):
     """
-    데이터베이스 세션을 생성하고 반환합니다.
+    읽기 전용 세션(info["read_only"])의 SELECT는 복제본으로, 그 외의 모든 문장은 primary로 보냅니다.
+    한 번이라도 쓰기를 한 세션은 이후 조회도 primary를 사용합니다.
     """
-    session = SessionLocal()
+    def get_bind(self, mapper=None, clause=None, bind=None, **kw):
+        if bind is not None:
+            return bind
+        if (
+            self.info.get("read_only")
+            and not self.info.get("wrote")
+            and not self._flushing
+            and isinstance(clause, Select)
+        ):
+            replica = replica_selector.choose()
+            if replica is not None:
+                return replica.sync_engine
+        return async_engine.sync_engine
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_wrote_after_flush(session, flush_context):
+    session.info["wrote"] = True
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _mark_wrote_on_dml(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _retry_replica_read_on_primary(orm_execute_state):
+    """
+    복제본으로 보낸 조회가 연결 오류로 실패하면 primary에서 한 번 다시 실행합니다.
+    실패한 복제본은 ReplicaSelector가 cooldown 동안 제외하므로 이후 조회는 다른 복제본이나 primary를 사용합니다.
+    """
+    if not replica_engines or not orm_execute_state.is_select or "bind" in orm_execute_state.bind_arguments:
+        return None
+    session = orm_execute_state.session
+    bind = session.get_bind(mapper=orm_execute_state.bind_mapper, clause=orm_execute_state.statement)
+    if bind is async_engine.sync_engine:
+        return None
     try:
-        return session
+        return orm_execute_state.invoke_statement(bind_arguments={"bind": bind})
     except Exception as e:
-        print(f"Error creating database session: {e}")
-        session.close()
+        if not is_connection_error(e):
+            raise
+        # 연결 단계의 오류는 handle_error 이벤트를 거치지 않으므로 여기서도 제외합니다.
+        for replica in replica_engines:
+            if replica.sync_engine is bind:
+                replica_selector.mark_unhealthy(replica)
+        print(f"Replica read failed, retrying on primary: {e}")
+        return orm_execute_state.invoke_statement(bind_arguments={"bind": async_engine.sync_engine})
+
+# 비동기 세션 팩토리 생성
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    sync_session_class=RoutingSession,
+    autoflush=True,
+    expire_on_commit=False
+)
+
+def get_db_session() -> Iterator[Session]:
+    """
+    요청 단위의 데이터베이스 세션을 생성하고, 요청이 끝나면 닫아 커넥션을 풀에 반납합니다.
+    FastAPI 의존성(Depends)으로 사용합니다. 처리 중 예외가 나면 롤백합니다.
+    """
+    session = SessionLocal()
+    try:
+        yield session
+    except Exception:
+        session.rollback()
         raise
+    finally:
+        session.close()
 
 @contextmanager
 def get_db_session_context():
@@ -51,14 +188,49 @@ def get_db_session_context():
         # 데이터베이스 작업 수행
         session.commit()
     """
-    session = SessionLocal()
-    try:
-        yield session
-    except Exception as e:
-        session.rollback()
-        raise
-    finally:
-        session.close()
+    yield from get_db_session()
+
+def client_key(request: Request) -> Optional[str]:
+    """read-your-own-writes 판단에 사용할 클라이언트 식별자 (토큰, 없으면 접속 주소)"""
+    return request.headers.get("authorization") or (request.client.host if request.client else None)
+
+def async_read_session(request: Request) -> AsyncSession:
+    """
+    조회 전용 비동기 세션을 생성합니다. (async with 와 함께 사용)
+    최근에 쓰기를 한 클라이언트라면 복제 지연을 피하기 위해 primary를 사용합니다.
+    """
+    read_only = not primary_stickiness.is_sticky(client_key(request))
+    return AsyncSessionLocal(info={"read_only": read_only})
+
+def may_read_replica(session: AsyncSession) -> bool:
+    """세션의 SELECT가 복제본으로 갈 수 있는지 여부 (복제 지연으로 최근 쓰기가 보이지 않을 수 있음)"""
+    info = session.sync_session.info
+    return bool(replica_engines) and info.get("read_only", False) and not info.get("wrote", False)
+
+async def get_async_db_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """
+    요청 단위의 비동기 데이터베이스 세션을 생성하고, 요청이 끝나면 닫습니다.
+    FastAPI 의존성(Depends)으로 사용합니다.
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+        if session.sync_session.info.get("wrote"):
+            primary_stickiness.mark(client_key(request))
+
+async def get_async_read_db_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """
+    조회 전용 엔드포인트용 세션 의존성. SELECT는 복제본(설정된 경우)으로 라우팅됩니다.
+    """
+    async with async_read_session(request) as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
 
 # def get_db_connection():
 #     conn = None
@@ -0,0 +1,155 @@
+import bisect
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence, Type
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool
+
+# 히스토그램 버킷 상한 (밀리초)
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+HOLD_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램. snapshot()은 Prometheus와 같이 상한(le) 이하 누적 개수를 반환합니다.
+    호출 측(PoolMetrics)의 잠금 안에서만 갱신합니다.
+    """
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets, cumulative = [], 0
+        for bound, count in zip(self.bounds + ("+Inf",), self.counts):
+            cumulative += count
+            buckets.append({"le": bound, "count": cumulative})
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 3),
+            "avg": round(self.sum / self.count, 3) if self.count else 0.0,
+            "max": round(self.max, 3),
+            "buckets": buckets,
+        }
+
+
+class PoolMetrics:
+    """
+    커넥션 풀 하나의 계측 값.
+    - wait_ms: 풀에서 커넥션을 얻기까지 기다린 시간 (pool_class()로 만든 풀 클래스가 기록)
+    - hold_ms: 커넥션을 빌려 간 뒤 반납할 때까지의 시간 (checkout/checkin 이벤트)
+    - connection_age_seconds: 현재 열려 있는 DB 커넥션이 생성된 뒤 지난 시간
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self.engine = None
+        self.wait_ms = Histogram(WAIT_BUCKETS_MS)
+        self.hold_ms = Histogram(HOLD_BUCKETS_MS)
+        self.timeouts = 0
+        self.checkouts = 0
+        self.connects = 0
+        self._connected_at: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def pool_class(self, base: Type[Pool]) -> Type[Pool]:
+        """
+        대기 시간을 기록하는 base의 하위 클래스를 만듭니다. (create_engine의 poolclass로 사용)
+        엔진이 dispose/재연결로 풀을 다시 만들 때도 같은 클래스를 사용하므로 계측이 유지됩니다.
+        """
+        metrics = self
+
+        def _do_get(pool):
+            started = time.perf_counter()
+            try:
+                connection = base._do_get(pool)
+            except PoolTimeoutError:
+                metrics._record_wait(started, timed_out=True)
+                raise
+            metrics._record_wait(started)
+            return connection
+
+        return type(f"Instrumented{base.__name__}", (base,), {"_do_get": _do_get})
+
+    def instrument(self, engine):
+        """엔진(동기/비동기)의 풀 이벤트를 등록합니다."""
+        self.engine = getattr(engine, "sync_engine", engine)
+        event.listen(self.engine, "connect", self._on_connect)
+        event.listen(self.engine, "close", self._on_close)
+        event.listen(self.engine, "close_detached", self._on_close_detached)
+        event.listen(self.engine, "checkout", self._on_checkout)
+        event.listen(self.engine, "checkin", self._on_checkin)
+        return engine
+
+    def _record_wait(self, started: float, timed_out: bool = False):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.wait_ms.observe(elapsed_ms)
+            if timed_out:
+                self.timeouts += 1
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+            self._connected_at[id(dbapi_connection)] = time.monotonic()
+
+    def _on_close(self, dbapi_connection, connection_record):
+        with self._lock:
+            self._connected_at.pop(id(dbapi_connection), None)
+
+    def _on_close_detached(self, dbapi_connection):
+        with self._lock:
+            self._connected_at.pop(id(dbapi_connection), None)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        with self._lock:
+            self.checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        checked_out_at: Optional[float] = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is None:
+            return
+        with self._lock:
+            self.hold_ms.observe((time.perf_counter() - checked_out_at) * 1000)
+
+    def stats(self) -> Dict[str, Any]:
+        pool = self.engine.pool if self.engine is not None else None
+        now = time.monotonic()
+        with self._lock:
+            ages = [now - connected_at for connected_at in self._connected_at.values()]
+            stats = {
+                "name": self.name,
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "timeouts": self.timeouts,
+                "wait_ms": self.wait_ms.snapshot(),
+                "hold_ms": self.hold_ms.snapshot(),
+            }
+        stats["connection_age_seconds"] = {
+            "count": len(ages),
+            "min": round(min(ages), 3) if ages else 0.0,
+            "avg": round(sum(ages) / len(ages), 3) if ages else 0.0,
+            "max": round(max(ages), 3) if ages else 0.0,
+        }
+        # QueuePool 계열만 크기/오버플로 정보를 제공합니다.
+        if pool is not None and hasattr(pool, "checkedout"):
+            stats.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                # 풀이 size보다 적게 열려 있으면 음수이므로 0으로 보고합니다.
+                "overflow": max(pool.overflow(), 0),
+                "status": pool.status(),
+            })
+        return stats
@@ -0,0 +1,99 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """연결 실패/끊김으로 인한 오류인지 여부 (다른 엔진에서 다시 실행해도 되는 오류)"""
+    if isinstance(exc, DBAPIError):
+        return exc.connection_invalidated or isinstance(exc.orig, (OSError, ConnectionError))
+    return isinstance(exc, (OSError, ConnectionError))
+
+
+class ReplicaSelector:
+    """
+    읽기 전용 복제본 엔진을 라운드 로빈으로 선택합니다.
+    연결 오류가 난 복제본은 cooldown 초 동안 선택에서 제외하고, 사용할 복제본이 없으면 None을 반환합니다.
+    """
+    def __init__(self, engines: List[AsyncEngine], cooldown: float = 30.0):
+        self.engines = engines
+        self.cooldown = cooldown
+        self._unhealthy_until = {id(engine): 0.0 for engine in engines}
+        self._next = 0
+        self._lock = threading.Lock()
+
+        for replica in engines:
+            event.listen(replica.sync_engine, "handle_error", self._make_error_handler(replica))
+
+    def _make_error_handler(self, replica: AsyncEngine):
+        def handle_error(context):
+            if context.is_disconnect or isinstance(context.original_exception, (OSError, ConnectionError)):
+                self.mark_unhealthy(replica)
+        return handle_error
+
+    def mark_unhealthy(self, replica: AsyncEngine):
+        with self._lock:
+            self._unhealthy_until[id(replica)] = time.monotonic() + self.cooldown
+        print(f"Replica {replica.url.host}:{replica.url.port} marked unhealthy for {self.cooldown}s")
+
+    def healthy_engines(self) -> List[AsyncEngine]:
+        now = time.monotonic()
+        return [replica for replica in self.engines if self._unhealthy_until[id(replica)] <= now]
+
+    def choose(self) -> Optional[AsyncEngine]:
+        if not self.engines:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.engines)):
+                replica = self.engines[self._next % len(self.engines)]
+                self._next += 1
+                if self._unhealthy_until[id(replica)] <= now:
+                    return replica
+        return None
+
+
+class PrimaryStickiness:
+    """
+    최근에 쓰기를 한 클라이언트의 읽기를 window 초 동안 primary로 보내기 위한 기록.
+    복제 지연 때문에 방금 쓴 데이터가 복제본에서 보이지 않는 문제(read-your-own-writes)를 막습니다.
+    클라이언트 키(Authorization 헤더 등)는 해시로만 보관합니다.
+    """
+    def __init__(self, window: float = 5.0, max_clients: int = 10000):
+        self.window = window
+        self.max_clients = max_clients
+        self._expires: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(client_key: str) -> str:
+        return hashlib.sha256(client_key.encode()).hexdigest()
+
+    def mark(self, client_key: Optional[str]):
+        if not client_key or self.window <= 0:
+            return
+        key = self._key(client_key)
+        with self._lock:
+            self._expires[key] = time.monotonic() + self.window
+            self._expires.move_to_end(key)
+            while len(self._expires) > self.max_clients:
+                self._expires.popitem(last=False)
+
+    def is_sticky(self, client_key: Optional[str]) -> bool:
+        if not client_key:
+            return False
+        key = self._key(client_key)
+        with self._lock:
+            expires = self._expires.get(key)
+            if expires is None:
+                return False
+            if expires <= time.monotonic():
+                del self._expires[key]
+                return False
+            return True
@@ -0,0 +1,302 @@
+import os
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+
+from config.pool_metrics import Histogram, PoolMetrics
+
+# 히스토그램 버킷 상한
+LATENCY_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SQL_BUCKETS_SECONDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+STATEMENT_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+# 느린 쿼리 샘플에 남기는 SQL 문의 최대 길이
+MAX_STATEMENT_LENGTH = 1000
+
+
+def parameter_shape(parameters, executemany: bool = False) -> Any:
+    """
+    바인딩 파라미터의 값 대신 형태(타입, 목록 길이)를 반환합니다. 느린 쿼리 샘플에 개인정보가 남지 않게 합니다.
+    예: {"id_1": "UUID", "ids": "list[3]"}, ["UUID", "str"], {"executemany": 100, "row": [...]}
+    """
+    if executemany and isinstance(parameters, (list, tuple)):
+        return {"executemany": len(parameters), "row": parameter_shape(parameters[0]) if parameters else None}
+    if isinstance(parameters, dict):
+        return {key: _value_shape(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_value_shape(value) for value in parameters]
+    return _value_shape(parameters)
+
+
+def _value_shape(value) -> str:
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def _statement_kind(statement: str) -> str:
+    """SELECT/INSERT/UPDATE/DELETE/OTHER (WITH ... 로 시작하는 문장은 WITH)"""
+    kind = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return kind if kind in ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH") else "OTHER"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[Any]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+def _histogram_lines(name: str, label_names: Sequence[str], histograms: Dict[Tuple, Histogram]) -> List[str]:
+    lines = []
+    for label_values, histogram in sorted(histograms.items()):
+        cumulative = 0
+        for bound, count in zip(histogram.bounds + ("+Inf",), histogram.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels((*label_names, 'le'), (*label_values, bound))} {cumulative}")
+        lines.append(f"{name}_sum{_labels(label_names, label_values)} {histogram.sum}")
+        lines.append(f"{name}_count{_labels(label_names, label_values)} {histogram.count}")
+    return lines
+
+
+class _RequestSql:
+    """요청 하나에서 실행된 SQL 집계 (contextvar로 요청 처리 코드와 엔진 이벤트가 공유)"""
+    __slots__ = ("scope", "statements", "seconds", "repeated")
+
+    def __init__(self, scope, track_repeats: bool):
+        self.scope = scope
+        self.statements = 0
+        self.seconds = 0.0
+        # N+1 감지용 문장별 실행 횟수 (로깅이 꺼져 있으면 집계하지 않음)
+        self.repeated: Optional[Counter] = Counter() if track_repeats else None
+
+
+_current_request: ContextVar[Optional[_RequestSql]] = ContextVar("fms_current_request_sql", default=None)
+
+
+def route_label(scope) -> str:
+    """라우팅된 경로 템플릿 (예: /fms/routes/{route_id}). 매칭되지 않은 요청은 경로별 시계열이 늘지 않도록 하나로 묶습니다."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class RequestMetrics:
+    """
+    엔드포인트별 지연 시간과 요청당 SQL 실행 수/시간, 느린 쿼리 샘플을 기록합니다.
+    - RequestMetricsMiddleware가 요청 시작/끝을 기록합니다.
+    - instrument(engine)가 등록한 커서 실행 이벤트가 SQL 문마다 시간을 재고 현재 요청에 더합니다.
+    동기 엔진은 스레드 풀에서도 실행되므로 잠금 안에서 갱신합니다.
+    """
+    def __init__(
+        self,
+        slow_query_seconds: float = 0.2,
+        slow_query_samples: int = 50,
+        log_n_plus_one: bool = False,
+        n_plus_one_threshold: int = 5,
+    ):
+        self.slow_query_seconds = slow_query_seconds
+        self.log_n_plus_one = log_n_plus_one
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        # (method, route) -> Histogram
+        self.latency: Dict[Tuple, Histogram] = {}
+        # (method, route, status) -> count
+        self.requests: Counter = Counter()
+        # (route,) -> Histogram
+        self.request_statements: Dict[Tuple, Histogram] = {}
+        self.request_sql_seconds: Dict[Tuple, Histogram] = {}
+        # (kind,) -> Histogram
+        self.statement_seconds: Dict[Tuple, Histogram] = {}
+        self.sql_errors = 0
+        self.slow_statements = 0
+        self.n_plus_one_requests = 0
+        self.slow_queries: deque = deque(maxlen=slow_query_samples)
+
+    # --- 요청 (RequestMetricsMiddleware) ---
+
+    def start_request(self, scope) -> Tuple[float, Any]:
+        with self._lock:
+            self.in_flight += 1
+        token = _current_request.set(_RequestSql(scope, self.log_n_plus_one))
+        return time.perf_counter(), token
+
+    def finish_request(self, scope, started: float, token, status: int):
+        elapsed = time.perf_counter() - started
+        request_sql = _current_request.get()
+        _current_request.reset(token)
+        method, route = scope.get("method", ""), route_label(scope)
+        with self._lock:
+            self.in_flight -= 1
+            self.requests[(method, route, str(status))] += 1
+            self._observe(self.latency, (method, route), LATENCY_BUCKETS_SECONDS, elapsed)
+            if request_sql is not None:
+                self._observe(self.request_statements, (route,), STATEMENT_COUNT_BUCKETS, request_sql.statements)
+                self._observe(self.request_sql_seconds, (route,), LATENCY_BUCKETS_SECONDS, request_sql.seconds)
+        if request_sql is not None and request_sql.repeated:
+            self._report_n_plus_one(method, route, request_sql.repeated)
+
+    def _report_n_plus_one(self, method: str, route: str, repeated: Counter):
+        suspects = [(statement, count) for statement, count in repeated.items() if count >= self.n_plus_one_threshold]
+        if not suspects:
+            return
+        with self._lock:
+            self.n_plus_one_requests += 1
+        for statement, count in suspects:
+            print(f"N+1 suspected: {method} {route} executed {count}x: {' '.join(statement.split())[:MAX_STATEMENT_LENGTH]}")
+
+    @staticmethod
+    def _observe(histograms: Dict[Tuple, Histogram], key: Tuple, bounds: Sequence[float], value: float):
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(bounds)
+        histogram.observe(value)
+
+    # --- SQL (엔진 이벤트) ---
+
+    def instrument(self, engine):
+        """엔진(동기/비동기)의 커서 실행 이벤트를 등록합니다."""
+        sync_engine = getattr(engine, "sync_engine", engine)
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(sync_engine, "handle_error", self._handle_error)
+        return engine
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        elapsed = time.perf_counter() - started
+        request_sql = _current_request.get()
+        if request_sql is not None:
+            request_sql.statements += 1
+            request_sql.seconds += elapsed
+            if request_sql.repeated is not None:
+                request_sql.repeated[statement] += 1
+
+        slow = elapsed >= self.slow_query_seconds
+        with self._lock:
+            self._observe(self.statement_seconds, (_statement_kind(statement),), SQL_BUCKETS_SECONDS, elapsed)
+            if slow:
+                self.slow_statements += 1
+        if slow:
+            self.slow_queries.append({
+                "at": datetime.now().isoformat(timespec="seconds"),
+                "duration_ms": round(elapsed * 1000, 3),
+                "route": route_label(request_sql.scope) if request_sql is not None else None,
+                "statement": statement[:MAX_STATEMENT_LENGTH],
+                "parameters": parameter_shape(parameters, executemany),
+            })
+
+    def _handle_error(self, exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_started"):
+            connection.info["query_started"].pop()
+        with self._lock:
+            self.sql_errors += 1
+
+    # --- 노출 ---
+
+    def slow_query_samples(self) -> List[Dict[str, Any]]:
+        """최근 느린 쿼리 샘플 (최신 순)"""
+        return list(reversed(self.slow_queries))
+
+    def render_prometheus(self, pool_metrics: Iterable[PoolMetrics] = ()) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        with self._lock:
+            lines = [
+                "# HELP fms_http_requests_in_flight Requests currently being served.",
+                "# TYPE fms_http_requests_in_flight gauge",
+                f"fms_http_requests_in_flight {self.in_flight}",
+                "# HELP fms_http_requests_total Completed requests by route template and status code.",
+                "# TYPE fms_http_requests_total counter",
+                *(
+                    f"fms_http_requests_total{_labels(('method', 'route', 'status'), key)} {count}"
+                    for key, count in sorted(self.requests.items())
+                ),
+                "# HELP fms_http_request_duration_seconds Request latency by route template.",
+                "# TYPE fms_http_request_duration_seconds histogram",
+                *_histogram_lines("fms_http_request_duration_seconds", ("method", "route"), self.latency),
+                "# HELP fms_http_request_sql_statements SQL statements executed per request.",
+                "# TYPE fms_http_request_sql_statements histogram",
+                *_histogram_lines("fms_http_request_sql_statements", ("route",), self.request_statements),
+                "# HELP fms_http_request_sql_duration_seconds Time spent executing SQL per request.",
+                "# TYPE fms_http_request_sql_duration_seconds histogram",
+                *_histogram_lines("fms_http_request_sql_duration_seconds", ("route",), self.request_sql_seconds),
+                "# HELP fms_sql_statement_duration_seconds SQL statement latency by statement kind.",
+                "# TYPE fms_sql_statement_duration_seconds histogram",
+                *_histogram_lines("fms_sql_statement_duration_seconds", ("kind",), self.statement_seconds),
+                "# HELP fms_sql_slow_statements_total Statements slower than the slow query threshold.",
+                "# TYPE fms_sql_slow_statements_total counter",
+                f"fms_sql_slow_statements_total {self.slow_statements}",
+                "# HELP fms_sql_errors_total Statements that raised a database error.",
+                "# TYPE fms_sql_errors_total counter",
+                f"fms_sql_errors_total {self.sql_errors}",
+                "# HELP fms_sql_n_plus_one_requests_total Requests that repeated one statement at least the N+1 threshold.",
+                "# TYPE fms_sql_n_plus_one_requests_total counter",
+                f"fms_sql_n_plus_one_requests_total {self.n_plus_one_requests}",
+            ]
+
+        pool_metrics = list(pool_metrics)
+        pools = [metrics.stats() for metrics in pool_metrics]
+        lines += [
+            "# HELP fms_db_pool_checked_out Connections currently checked out of the pool.",
+            "# TYPE fms_db_pool_checked_out gauge",
+            *(f"fms_db_pool_checked_out{_labels(('pool',), (pool['name'],))} {pool.get('checked_out', 0)}" for pool in pools),
+            "# HELP fms_db_pool_overflow Connections opened beyond pool_size.",
+            "# TYPE fms_db_pool_overflow gauge",
+            *(f"fms_db_pool_overflow{_labels(('pool',), (pool['name'],))} {pool.get('overflow', 0)}" for pool in pools),
+            "# HELP fms_db_pool_timeouts_total Checkouts that timed out waiting for a connection.",
+            "# TYPE fms_db_pool_timeouts_total counter",
+            *(f"fms_db_pool_timeouts_total{_labels(('pool',), (pool['name'],))} {pool['timeouts']}" for pool in pools),
+            "# HELP fms_db_pool_wait_milliseconds Time spent waiting for a pooled connection.",
+            "# TYPE fms_db_pool_wait_milliseconds histogram",
+            *_histogram_lines("fms_db_pool_wait_milliseconds", ("pool",), {(metrics.name,): metrics.wait_ms for metrics in pool_metrics}),
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class RequestMetricsMiddleware:
+    """
+    HTTP 요청마다 RequestMetrics에 지연 시간/상태 코드/SQL 집계를 기록하는 ASGI 미들웨어.
+    응답 본문을 감싸지 않으므로 스트리밍 응답도 그대로 전달됩니다. (지연 시간은 응답이 끝날 때까지)
+    """
+    def __init__(self, app, metrics: "RequestMetrics"):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started, token = self.metrics.start_request(scope)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.metrics.finish_request(scope, started, token, status)
+
+
+request_metrics = RequestMetrics(
+    slow_query_seconds=float(os.environ.get("SQL_SLOW_QUERY_MS", "200")) / 1000,
+    slow_query_samples=int(os.environ.get("SQL_SLOW_QUERY_SAMPLES", "50")),
+    log_n_plus_one=os.environ.get("SQL_LOG_N_PLUS_ONE", "").lower() in ("1", "true", "yes"),
+    n_plus_one_threshold=int(os.environ.get("SQL_N_PLUS_ONE_THRESHOLD", "5")),
+)
@@ -1,19 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 
-from config.database import get_db_session
-from services.auth_service import AuthService
+from config.database import get_async_db_session
+from services.async_auth_service import AsyncAuthService
 from controllers.dto.request_dto import RequestToken
 
 router = APIRouter(prefix="/fms/auth")
 
-def get_auth_service(db_session: Session = Depends(get_db_session)):
-    return AuthService(session=db_session)
+def get_auth_service(db_session: AsyncSession = Depends(get_async_db_session)):
+    return AsyncAuthService(session=db_session)
 
 @router.post("/token")
-async def login_for_access_token(request_token: RequestToken, auth_service: AuthService = Depends(get_auth_service)):
-    user = auth_service.authenticate_user(request_token.nickname, request_token.password)
+async def login_for_access_token(request_token: RequestToken, auth_service: AsyncAuthService = Depends(get_auth_service)):
+    user = await auth_service.authenticate_user(request_token.nickname, request_token.password)
     if not user:
         raise HTTPException(
             status_code=401,
@@ -0,0 +1,50 @@
+import os
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from services.change_feed import ChangeFilter, change_feed
+from utils.security import get_token_payload
+
+# 이 시간(초) 동안 보낼 변경이 없으면 SSE 주석을 보내 프록시가 연결을 끊지 않게 하고, 끊긴 클라이언트를 감지합니다.
+CHANGE_FEED_HEARTBEAT_SECONDS = float(os.environ.get("CHANGE_FEED_HEARTBEAT_SECONDS", "15"))
+
+
+router = APIRouter(prefix="/fms/changes")
+
+
+@router.get("/stream", status_code=200)
+async def stream_changes(
+    payload: dict = Depends(get_token_payload),
+    entity: Optional[str] = Query(None, pattern="^(route|trip)$"),
+    ride_route_id: Optional[UUID] = Query(None),
+    passenger_id: Optional[UUID] = Query(None),
+    location: Optional[str] = Query(None, description="출발지/목적지/승차 위치 장소명 (정규화하여 비교)"),
+):
+    """
+    경로/여정 변경을 Server-Sent Events로 전달합니다. (event: change, data: 변경 JSON)
+    지정한 조건을 모두 만족하는 변경만 보내며, 다음 경우에는 목록 API로 상태를 다시 조회해야 합니다.
+    - event: resync — 서버가 변경 수신을 (다시) 시작함. 그 전의 변경은 전달되지 않았을 수 있음
+    - event: lagged — 클라이언트가 느려 버퍼가 넘쳐 변경을 버림 (data의 dropped)
+    """
+    subscription = change_feed.subscribe(ChangeFilter.of(entity, ride_route_id, passenger_id, location))
+    if subscription is None:
+        raise HTTPException(status_code=503, detail="Too many change feed subscribers")
+
+    async def events():
+        try:
+            yield b": connected\n\n"
+            while True:
+                message = await subscription.get(CHANGE_FEED_HEARTBEAT_SECONDS)
+                yield message.sse() if message is not None else b": keepalive\n\n"
+        finally:
+            # 클라이언트가 연결을 끊으면 제너레이터가 취소되어 구독이 해제됩니다.
+            change_feed.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from uuid import UUID
 
 class RequestCreatePassenger(BaseModel):
@@ -17,10 +17,19 @@ class RequestCreateRoute(BaseModel):
     departure_location_name: str
     departure_time: datetime
     destination_location_name: str
-
+    # 좌표를 생략하면 장소명으로 오프라인 사전(utils.gazetteer)에서 찾습니다.
+    departure_lat: Optional[float] = Field(None, ge=-90, le=90)
+    departure_lon: Optional[float] = Field(None, ge=-180, le=180)
+    destination_lat: Optional[float] = Field(None, ge=-90, le=90)
+    destination_lon: Optional[float] = Field(None, ge=-180, le=180)
+    seat_capacity: int = Field(4, ge=1, le=100)
 
     model_config = ConfigDict(from_attributes=True)
 
+class RequestBulkRoute(RequestCreateRoute):
+    # id가 주어지면 기존 경로를 갱신하고, 없으면 새 경로로 추가합니다.
+    id: Optional[UUID] = None
+
 
 # class RequestCreatePassengerRoute(BaseModel):
 #     # driver_id: UUID
@@ -53,9 +62,28 @@ class RequestCreateTrip(BaseModel):
     passenger_id: UUID
     pickup_request_location_name: str
     pickup_time: datetime
+    pickup_lat: Optional[float] = Field(None, ge=-90, le=90)
+    pickup_lon: Optional[float] = Field(None, ge=-180, le=180)
 
     model_config = ConfigDict(from_attributes=True)
 
+class RequestCreateTrips(BaseModel):
+    trips: List[RequestCreateTrip] = Field(min_length=1, max_length=1000)
+
+class RequestApproveTrips(BaseModel):
+    ids: List[UUID] = Field(min_length=1, max_length=1000)
+
+class RequestRunMatching(BaseModel):
+    # 승차 시간이 이 범위에 있는 승인 대기 여정을 배정합니다.
+    start_time: datetime
+    end_time: datetime
+    # 승차 시간과 경로 출발 시간의 허용 차이 (분)
+    time_window_minutes: float = Field(30, gt=0, le=24 * 60)
+    # 승차 위치와 경로 출발지의 허용 거리 (m, 좌표가 없으면 정규화된 장소명이 같아야 함)
+    max_distance_m: float = Field(2000, gt=0, le=100_000)
+    # true이면 배정 결과대로 여정의 경로를 바꾸고 승인합니다.
+    apply: bool = False
+
 class RequestToken(BaseModel):
     nickname: str
     password: str
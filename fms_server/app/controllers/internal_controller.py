@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends
+
+from config.database import (
+    DB_IDLE_IN_TRANSACTION_TIMEOUT_MS,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_STATEMENT_TIMEOUT_MS,
+    pool_metrics,
+)
+from config.request_metrics import request_metrics
+from services.change_feed import change_feed
+from services.profile_cache import profile_cache
+from services.route_cache import route_cache
+from utils.security import require_operator_token
+from utils.token_cache import token_cache
+
+
+# 운영 통계(SQL 문 포함) 엔드포인트이므로 /metrics와 같이 운영자 토큰(OPERATOR_TOKEN)을 요구합니다.
+router = APIRouter(prefix="/fms/internal", dependencies=[Depends(require_operator_token)])
+
+
+@router.get("/cache", status_code=200)
+async def get_cache_stats():
+    """경로 검색, 인증 토큰, 승객 프로필(/my-info) 캐시의 크기와 적중률 등 카운터를 반환합니다."""
+    return {
+        "route_cache": route_cache.stats(),
+        "token_cache": token_cache.stats(),
+        "profile_cache": profile_cache.stats(),
+    }
+
+
+@router.get("/pool", status_code=200)
+async def get_pool_stats():
+    """
+    엔진별 커넥션 풀 상태를 반환합니다.
+    사용/대기 중인 커넥션 수와 오버플로, 커넥션 대기/점유 시간 히스토그램(ms), 열린 커넥션의 나이(초).
+    """
+    return {
+        "settings": {
+            "pool_size": DB_POOL_SIZE,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "pool_timeout": DB_POOL_TIMEOUT,
+            "pool_recycle": DB_POOL_RECYCLE,
+            "statement_timeout_ms": DB_STATEMENT_TIMEOUT_MS,
+            "idle_in_transaction_timeout_ms": DB_IDLE_IN_TRANSACTION_TIMEOUT_MS,
+        },
+        "pools": [metrics.stats() for metrics in pool_metrics],
+    }
+
+
+@router.get("/changes", status_code=200)
+async def get_change_feed_stats():
+    """
+    변경 알림 스트림 상태를 반환합니다.
+    LISTEN 연결 여부와 재연결 횟수, 구독자 수, 받은 알림 수, 구독자에게 전달/버퍼 초과로 버린 메시지 수.
+    """
+    return change_feed.stats()
+
+
+@router.get("/slow-queries", status_code=200)
+async def get_slow_queries():
+    """
+    SQL_SLOW_QUERY_MS보다 오래 걸린 최근 SQL 문 샘플을 최신 순으로 반환합니다.
+    바인딩 파라미터는 값 대신 타입과 목록 길이만 기록합니다.
+    """
+    return {
+        "threshold_ms": round(request_metrics.slow_query_seconds * 1000, 3),
+        "samples": request_metrics.slow_query_samples(),
+    }
+
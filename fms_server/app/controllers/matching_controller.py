@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.database import get_async_db_session
+from controllers.dto.request_dto import RequestRunMatching
+from domains.matching import MatchingResult
+from services.matching_service import MatchingService
+from utils.security import get_token_payload
+
+
+router = APIRouter(prefix="/fms/matching")
+
+def get_matching_service(db_session: AsyncSession = Depends(get_async_db_session)):
+    return MatchingService(session=db_session)
+
+
+@router.post("/run", response_model=MatchingResult, status_code=200)
+async def run_matching(
+    request_matching: RequestRunMatching,
+    matching_service: MatchingService = Depends(get_matching_service),
+    payload: dict = Depends(get_token_payload)):
+    """
+    승차 시간이 [start_time, end_time]인 승인 대기 여정을 시간/위치/남은 좌석을 고려해 경로에 배정합니다.
+    apply=false이면 배정 결과만 반환하고, true이면 여정의 경로를 바꾸고 승인합니다.
+    """
+    if request_matching.end_time < request_matching.start_time:
+        raise HTTPException(status_code=400, detail="end_time must not be before start_time")
+    result = await matching_service.run(request_matching)
+    if result is None:
+        raise HTTPException(status_code=500, detail="Matching failed")
+    return result
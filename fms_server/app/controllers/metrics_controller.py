@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+
+from config.database import pool_metrics
+from config.request_metrics import request_metrics
+from utils.security import require_operator_token
+
+
+# 엔드포인트별 지연 시간과 느린 쿼리 수를 노출하므로 /fms/internal/*와 같이 운영자 토큰을 요구합니다.
+router = APIRouter(dependencies=[Depends(require_operator_token)])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", status_code=200)
+async def get_metrics():
+    """
+    Prometheus 텍스트 형식의 계측 값을 반환합니다.
+    엔드포인트(경로 템플릿)별 요청 수와 지연 시간, 요청당 SQL 실행 수/시간, SQL 문 종류별 지연 시간,
+    느린 쿼리/DB 오류/N+1 의심 요청 수, 엔진별 커넥션 풀 상태.
+    """
+    return Response(content=request_metrics.render_prometheus(pool_metrics), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,46 +1,51 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
 from uuid import UUID, uuid4
 from datetime import datetime
 from typing import Optional
 from pydantic import model_validator
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from config.database import get_db_session
+from config.database import get_async_db_session, get_async_read_db_session
 from domains.passenger import Passenger, ResponsePassenger
 from domains.route import Route
 from domains.trip import Trip
 from controllers.dto.request_dto import RequestCreatePassenger 
-from services.fms_service import FmsService
-from services.passenger_service import PassengerService
+from services.async_fms_service import AsyncFmsService
+from services.async_passenger_service import AsyncPassengerService
+from services.profile_cache import etag_matches
 from utils.security import get_token_payload
 
 
 router = APIRouter(prefix="/fms/passenger")
 
-def get_fms_service(db_session: Session = Depends(get_db_session)):
-    return FmsService(session=db_session)
+def get_fms_service(db_session: AsyncSession = Depends(get_async_db_session)):
+    return AsyncFmsService(session=db_session)
 
-def get_passenger_service(db_session: Session = Depends(get_db_session)):
-    return PassengerService(session=db_session)
+def get_passenger_service(db_session: AsyncSession = Depends(get_async_read_db_session)):
+    return AsyncPassengerService(session=db_session)
 
 
 @router.post("/",  status_code=201)
 async def create_passenger(request_passenger: RequestCreatePassenger, 
-                           fms_service: FmsService = Depends(get_fms_service)):
+                           fms_service: AsyncFmsService = Depends(get_fms_service)):
     
     passenger_data: Passenger = Passenger.model_validate(request_passenger)
 
-    return fms_service.create_passenger(passenger_data)
+    return await fms_service.create_passenger(passenger_data)
 
-@router.get("/my-info", status_code=200)
-async def get_passenger(passenger_service:PassengerService = Depends(get_passenger_service), 
+@router.get("/my-info", status_code=200, response_model=ResponsePassenger)
+async def get_passenger(request: Request,
+                        passenger_service:AsyncPassengerService = Depends(get_passenger_service), 
                         payload: dict = Depends(get_token_payload)):
     nickname = payload.get("sub")
-    passenger_data: Passenger = passenger_service.find_by_nickname(nickname)
-    if passenger_data is None:
+    profile = await passenger_service.get_profile(nickname)
+    if profile is None:
         raise HTTPException(status_code=404, detail="Passenger not found")
-    
-    
-    return ResponsePassenger.model_validate(passenger_data)
+
+    # 클라이언트가 가진 응답과 같으면 본문 없이 304를 반환합니다. 매번 다시 검증하도록 no-cache로 응답합니다.
+    headers = {"ETag": profile.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), profile.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=profile.body, media_type="application/json", headers=headers)
 
@@ -1,55 +1,138 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from uuid import UUID, uuid4
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import model_validator
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from config.database import get_db_session
+from config.database import async_read_session, get_async_db_session, get_async_read_db_session
 from domains.passenger import Passenger
-from domains.route import Route
+from domains.route import NearbyRoute, Route, RoutePage, RouteImportResult
 from domains.trip import Trip
 from controllers.dto.request_dto import RequestCreateRoute, RequestCreateTrip
-from services.fms_service import FmsService
-from services.passenger_service import PassengerService
+from services.async_fms_service import AsyncFmsService
+from services.listing_service import ListingService
+from services.bulk_import_service import BulkImportService
+from utils.gazetteer import gazetteer
 from utils.security import get_token_payload
 
 
 router = APIRouter(prefix="/fms/routes")
 
-def get_fms_service(db_session: Session = Depends(get_db_session)):
-    return FmsService(session=db_session)
+def get_fms_service(db_session: AsyncSession = Depends(get_async_db_session)):
+    return AsyncFmsService(session=db_session)
 
+def get_listing_service(db_session: AsyncSession = Depends(get_async_read_db_session)):
+    return ListingService(session=db_session)
 
-@router.get("/", status_code=200)
+def get_bulk_import_service(db_session: AsyncSession = Depends(get_async_db_session)):
+    return BulkImportService(session=db_session)
+
+
+@router.get("/", response_model=RoutePage, status_code=200)
 async def find_ride_routes(
+    request: Request,
     payload: dict = Depends(get_token_payload),
     start_time: Optional[datetime] = Query(None),
     end_time: Optional[datetime] = Query(None),
     departure_location_name: Optional[str] = Query(None),
     destination_location_name: Optional[str] = Query(None),
-    fms_service: FmsService = Depends(get_fms_service),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(100, ge=1, le=1000),
+    stream: bool = Query(False, description="true이면 전체 결과를 NDJSON으로 스트리밍"),
+    match: str = Query("exact", pattern="^(exact|fuzzy)$", description="fuzzy이면 장소명 유사도 순으로 상위 limit개 반환 (stream, cursor와 함께 쓸 수 없음)"),
+    listing_service: ListingService = Depends(get_listing_service),
     
 ):
-    return fms_service.find_ride_routes(
+    filters = dict(
         start_time=start_time,
         end_time=end_time,
         departure_location_name=departure_location_name,
         destination_location_name=destination_location_name,
     )
 
+    if match == "fuzzy":
+        # 유사도 검색은 상위 limit개 한 페이지만 반환하므로 스트리밍/커서를 지원하지 않습니다.
+        if stream or cursor is not None:
+            raise HTTPException(status_code=400, detail="match=fuzzy cannot be combined with stream or cursor")
+        try:
+            body = await listing_service.route_fuzzy_json(limit=limit, **filters)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Fuzzy search requires a location name")
+        return Response(content=body, media_type="application/json")
+
+    if stream:
+        # yield 의존성의 세션은 응답 본문 전송 전에 닫히므로, 스트리밍은 전용 세션을 사용합니다.
+        async def ndjson_lines():
+            async with async_read_session(request) as session:
+                async for chunk in ListingService(session=session).stream_routes_ndjson(**filters):
+                    yield chunk
+
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+    try:
+        body = await listing_service.route_page_json(cursor=cursor, limit=limit, **filters)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    # 이미 직렬화된 바이트를 그대로 반환하여 response_model 재검증/재직렬화를 건너뜁니다.
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/nearby", response_model=List[NearbyRoute], status_code=200)
+async def find_nearby_routes(
+    payload: dict = Depends(get_token_payload),
+    lat: Optional[float] = Query(None, ge=-90, le=90),
+    lon: Optional[float] = Query(None, ge=-180, le=180),
+    near: Optional[str] = Query(None, description="좌표 대신 사용할 장소명 (오프라인 사전에서 조회)"),
+    radius_m: float = Query(500, gt=0, le=50_000),
+    endpoint: str = Query("departure", pattern="^(departure|destination|any)$"),
+    start_time: Optional[datetime] = Query(None),
+    end_time: Optional[datetime] = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+    listing_service: ListingService = Depends(get_listing_service),
+):
+    """끝점이 지정한 지점에서 radius_m 이내인 경로를 가까운 순으로 반환합니다."""
+    if lat is None or lon is None:
+        point = gazetteer.lookup(near)
+        if point is None:
+            raise HTTPException(status_code=400, detail="lat/lon or a known location name (near) is required")
+        lat, lon = point
+
+    body = await listing_service.nearby_routes_json(
+        lat, lon, radius_m, endpoint=endpoint, start_time=start_time, end_time=end_time, limit=limit
+    )
+    return Response(content=body, media_type="application/json")
+
 
 @router.post("/", response_model=Route, status_code=200)
 async def create_route(
     request_route: RequestCreateRoute, 
-    fms_service: FmsService = Depends(get_fms_service), 
+    fms_service: AsyncFmsService = Depends(get_fms_service), 
     payload: dict = Depends(get_token_payload)):
     route_data: Route = Route.model_validate(request_route)
     
-    return fms_service.create_route(route_data)
+    return await fms_service.create_route(route_data)
 
 
+@router.post("/bulk", response_model=RouteImportResult, status_code=200)
+async def bulk_import_routes(
+    request: Request,
+    bulk_import_service: BulkImportService = Depends(get_bulk_import_service),
+    payload: dict = Depends(get_token_payload)):
+    """
+    CSV(text/csv) 또는 NDJSON(application/x-ndjson) 본문의 경로를 일괄 등록합니다.
+    id가 있는 행은 기존 경로를 갱신하며, 검증에 실패한 행은 errors에 줄 번호와 함께 반환됩니다.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    try:
+        result = await bulk_import_service.import_routes(request.stream(), content_type)
+    except ValueError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    if result is None:
+        raise HTTPException(status_code=500, detail="Bulk import failed")
+    return result
+
 
 # @router.put("/{route_id}/involve_driver", response_model=Route, status_code=200)
 # async def involve_driver_to_route(route_id: UUID, request_involve_driver: RequestInvolveDriverToRoute, fms_service: FmsService = Depends(get_fms_service)):
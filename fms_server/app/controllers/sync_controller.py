@@ -0,0 +1,50 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.database import get_async_read_db_session
+from domains.route import RouteSyncPage
+from domains.trip import TripSyncPage
+from services.listing_service import ListingService
+from utils.security import get_token_payload
+
+
+router = APIRouter(prefix="/fms/sync")
+
+def get_listing_service(db_session: AsyncSession = Depends(get_async_read_db_session)):
+    return ListingService(session=db_session)
+
+
+@router.get("/routes", response_model=RouteSyncPage, status_code=200)
+async def sync_routes(
+    payload: dict = Depends(get_token_payload),
+    since: Optional[str] = Query(None, description="이전 응답의 next_cursor (없으면 처음부터)"),
+    limit: int = Query(1000, ge=1, le=10000),
+    listing_service: ListingService = Depends(get_listing_service),
+):
+    """
+    since 이후에 바뀐 경로(items)와 삭제된 경로 ID(deleted_ids)를 변경 순서대로 반환합니다.
+    응답의 next_cursor를 저장해 두고 다음 요청의 since로 사용하며, has_more가 true이면 바로 다시 요청합니다.
+    """
+    try:
+        body = await listing_service.route_sync_json(since=since, limit=limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/trips", response_model=TripSyncPage, status_code=200)
+async def sync_trips(
+    payload: dict = Depends(get_token_payload),
+    since: Optional[str] = Query(None, description="이전 응답의 next_cursor (없으면 처음부터)"),
+    limit: int = Query(1000, ge=1, le=10000),
+    listing_service: ListingService = Depends(get_listing_service),
+):
+    """since 이후에 생성/승인/경로 변경된 여정을 변경 순서대로 반환합니다. (커서 사용법은 /fms/sync/routes와 같음)"""
+    try:
+        body = await listing_service.trip_sync_json(since=since, limit=limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return Response(content=body, media_type="application/json")
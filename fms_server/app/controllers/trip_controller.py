@@ -0,0 +1,86 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
+from uuid import UUID
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.database import get_async_db_session, get_async_read_db_session
+from controllers.dto.request_dto import RequestApproveTrips, RequestCreateTrips
+from domains.trip import Trip, TripBatchApproveResult, TripBatchCreateResult, TripDetailPage
+from services.async_fms_service import AsyncFmsService
+from services.listing_service import ListingService
+from utils.security import get_token_payload
+
+
+router = APIRouter(prefix="/fms/trips")
+
+def get_fms_service(db_session: AsyncSession = Depends(get_async_db_session)):
+    return AsyncFmsService(session=db_session)
+
+def get_listing_service(db_session: AsyncSession = Depends(get_async_read_db_session)):
+    return ListingService(session=db_session)
+
+
+@router.get("/", response_model=List[Trip], status_code=200)
+async def find_trips(
+    payload: dict = Depends(get_token_payload),
+    ride_route_id: Optional[UUID] = Query(None),
+    passenger_id: Optional[UUID] = Query(None),
+    is_approved: Optional[bool] = Query(None),
+    listing_service: ListingService = Depends(get_listing_service),
+):
+    body = await listing_service.trips_json(
+        ride_route_id=ride_route_id,
+        passenger_id=passenger_id,
+        is_approved=is_approved,
+    )
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/details", response_model=TripDetailPage, status_code=200)
+async def find_trip_details(
+    payload: dict = Depends(get_token_payload),
+    ride_route_id: Optional[UUID] = Query(None),
+    passenger_id: Optional[UUID] = Query(None),
+    is_approved: Optional[bool] = Query(None),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(100, ge=1, le=1000),
+    listing_service: ListingService = Depends(get_listing_service),
+):
+    """경로/승객 요약을 포함한 여정 목록 (승차 시간 순). 운전자의 승차 목록을 한 번의 요청으로 조회합니다."""
+    try:
+        body = await listing_service.trip_detail_page_json(
+            ride_route_id=ride_route_id,
+            passenger_id=passenger_id,
+            is_approved=is_approved,
+            cursor=cursor,
+            limit=limit,
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return Response(content=body, media_type="application/json")
+
+
+@router.post("/batch", response_model=TripBatchCreateResult, status_code=201)
+async def create_trips(
+    request_trips: RequestCreateTrips,
+    fms_service: AsyncFmsService = Depends(get_fms_service),
+    payload: dict = Depends(get_token_payload),
+):
+    trips = [Trip.model_validate(request_trip) for request_trip in request_trips.trips]
+    result = await fms_service.create_trips(trips)
+    if result is None:
+        raise HTTPException(status_code=500, detail="Failed to create trips")
+    return result
+
+
+@router.post("/approve", response_model=TripBatchApproveResult, status_code=200)
+async def approve_trips(
+    request_approve: RequestApproveTrips,
+    fms_service: AsyncFmsService = Depends(get_fms_service),
+    payload: dict = Depends(get_token_payload),
+):
+    result = await fms_service.approve_trips(request_approve.ids)
+    if result is None:
+        raise HTTPException(status_code=500, detail="Failed to approve trips")
+    return result
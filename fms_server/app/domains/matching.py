@@ -0,0 +1,18 @@
+from typing import List
+from pydantic import BaseModel
+from uuid import UUID
+
+class TripAssignment(BaseModel):
+    trip_id: UUID
+    route_id: UUID
+    # 여정이 처음 요청한 경로 (route_id와 다르면 다른 경로로 배정된 것)
+    requested_route_id: UUID
+    cost: float
+
+class MatchingResult(BaseModel):
+    assignments: List[TripAssignment] = []
+    unmatched_trip_ids: List[UUID] = []
+    trip_count: int = 0
+    route_count: int = 0
+    applied: bool = False
+    elapsed_ms: float = 0.0
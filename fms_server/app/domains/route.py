@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 from datetime import datetime
@@ -12,6 +12,34 @@ class Route(BaseModel):
     departure_location_name: Optional[str] = None
     departure_time: Optional[datetime] = None
     destination_location_name: Optional[str] = None
+    departure_lat: Optional[float] = None
+    departure_lon: Optional[float] = None
+    destination_lat: Optional[float] = None
+    destination_lon: Optional[float] = None
+    seat_capacity: Optional[int] = None
     
     model_config = ConfigDict(from_attributes=True)
 
+class NearbyRoute(Route):
+    # 검색 지점에서 가장 가까운 끝점(출발지/목적지)까지의 거리
+    distance_m: float
+
+class RoutePage(BaseModel):
+    items: List[Route]
+    next_cursor: Optional[str] = None
+
+class RouteImportError(BaseModel):
+    line: int
+    error: str
+
+class RouteImportResult(BaseModel):
+    inserted: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: List[RouteImportError] = []
+
+class RouteSyncPage(BaseModel):
+    items: List[Route]
+    deleted_ids: List[UUID] = []
+    next_cursor: Optional[str] = None
+    has_more: bool = False
@@ -1,3 +1,4 @@
+from typing import List, Optional
 from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 from datetime import datetime
@@ -9,5 +10,48 @@ class Trip(BaseModel):
     pickup_request_location_name: str
     pickup_time: datetime
     is_approved: bool = False
+    pickup_lat: Optional[float] = None
+    pickup_lon: Optional[float] = None
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class TripBatchCreateResult(BaseModel):
+    created: List[Trip] = []
+    missing_route_ids: List[UUID] = []
+    missing_passenger_ids: List[UUID] = []
+
+class TripBatchApproveResult(BaseModel):
+    approved: List[Trip] = []
+    missing_ids: List[UUID] = []
+    # 경로에 남은 좌석이 없는 여정
+    full_ids: List[UUID] = []
+    # 다른 승인 요청이 처리 중이어서 건너뛴 여정 (다시 요청하면 됨)
+    busy_ids: List[UUID] = []
+
+class TripRouteSummary(BaseModel):
+    id: UUID
+    driver_id: Optional[UUID] = None
+    car_plate_number: Optional[str] = None
+    departure_location_name: Optional[str] = None
+    departure_time: Optional[datetime] = None
+    destination_location_name: Optional[str] = None
+
+class TripPassengerSummary(BaseModel):
+    id: UUID
+    name: Optional[str] = None
+    nickname: Optional[str] = None
+    contact_info: Optional[str] = None
+
+class TripDetail(Trip):
+    """경로/승객 요약을 포함한 여정 (운전자의 승차 목록 등)"""
+    route: Optional[TripRouteSummary] = None
+    passenger: Optional[TripPassengerSummary] = None
+
+class TripDetailPage(BaseModel):
+    items: List[TripDetail]
+    next_cursor: Optional[str] = None
+
+class TripSyncPage(BaseModel):
+    items: List[Trip]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
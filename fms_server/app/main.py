@@ -1,17 +1,43 @@
 # 서버의 시작점
 
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 from controllers import route_controller
 from controllers import passenger_controller
 from controllers import auth_controller
+from controllers import trip_controller
+from controllers import internal_controller
+from controllers import matching_controller
+from controllers import change_controller
+from controllers import sync_controller
+from controllers import metrics_controller
+from config.request_metrics import RequestMetricsMiddleware, request_metrics
+from services.change_feed import change_feed
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # 변경 알림 LISTEN 커넥션은 첫 구독 시 열리며, 종료 시 닫습니다.
+    await change_feed.close()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
+# 엔드포인트별 지연 시간과 요청당 SQL 실행 수/시간 (GET /metrics)
+app.add_middleware(RequestMetricsMiddleware, metrics=request_metrics)
 
 app.include_router(route_controller.router)
 app.include_router(passenger_controller.router)
 app.include_router(auth_controller.router)
+app.include_router(trip_controller.router)
+app.include_router(internal_controller.router)
+app.include_router(matching_controller.router)
+app.include_router(change_controller.router)
+app.include_router(sync_controller.router)
+app.include_router(metrics_controller.router)
 
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8001, reload=True)
\ No newline at end of file
@@ -1,11 +1,44 @@
-from sqlalchemy import Column, UUID, String, DateTime, Boolean
+from sqlalchemy import BigInteger, CheckConstraint, Column, DDL, ForeignKey, UUID, String, DateTime, Boolean, Float, Index, Integer, event, text
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 from datetime import datetime
 
+from utils.gazetteer import gazetteer
+from utils.geohash import geohash_encode
+from utils.location import normalize_location_name
+
 Base = declarative_base()
 
+def pg_trgm_available(ddl, target, bind, **kw) -> bool:
+    """
+    Base.metadata.create_all 시 pg_trgm 확장을 쓸 수 있는 서버인지 확인합니다.
+    확장이 없는 서버(예: 테스트용 PostgreSQL)에서는 유사도 검색 인덱스만 빼고 나머지 스키마를 만듭니다.
+    (마이그레이션 b71e4a90c2d5는 확장이 반드시 필요합니다.)
+    """
+    if bind is None:
+        return True
+    query = text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    return bind.execute(query).first() is not None
+
+# 유사도 검색 인덱스(gin_trgm_ops)는 pg_trgm 확장이 필요합니다. (Base.metadata.create_all 사용 시, 마이그레이션은 b71e4a90c2d5)
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql", callable_=pg_trgm_available),
+)
+
+DEFAULT_SEAT_CAPACITY = 4
+
+# 행을 마지막으로 쓴 트랜잭션의 ID (64비트, wraparound 없이 증가). 동기화 API(GET /fms/sync)의 변경 순서로 사용합니다.
+# 원시 SQL로 행을 갱신할 때는 change_xid = DEFAULT로 함께 갱신해야 합니다.
+CURRENT_XACT_ID = text("(pg_current_xact_id()::text)::bigint")
+
 class PassengerDB(Base):
     __tablename__ = "passenger"
+    __table_args__ = (
+        # 로그인(find_by_nickname, authenticate_user) 조회용, 닉네임 중복 방지
+        Index("ux_passenger_nickname", "nickname", unique=True),
+    )
 
     id = Column(UUID, primary_key=True, index=True)
     password = Column(String)
@@ -17,25 +50,115 @@ class PassengerDB(Base):
 
 class RouteDB(Base):
     __tablename__ = "route"
+    __table_args__ = (
+        # 출발 시간 범위 검색 및 (departure_time, id) 정렬
+        Index("ix_route_departure_time_id", "departure_time", "id"),
+        # 출발지/목적지(정규화된 이름) + 출발 시간 범위 검색
+        Index("ix_route_departure_destination_norm_time", "departure_location_norm", "destination_location_norm", "departure_time"),
+        Index("ix_route_destination_norm_time", "destination_location_norm", "departure_time"),
+        # 유사도(pg_trgm) 검색
+        Index("ix_route_departure_location_norm_trgm", "departure_location_norm",
+              postgresql_using="gin", postgresql_ops={"departure_location_norm": "gin_trgm_ops"}
+              ).ddl_if(callable_=pg_trgm_available),
+        Index("ix_route_destination_location_norm_trgm", "destination_location_norm",
+              postgresql_using="gin", postgresql_ops={"destination_location_norm": "gin_trgm_ops"}
+              ).ddl_if(callable_=pg_trgm_available),
+        # 운전자가 배정되지 않은 경로 검색
+        Index("ix_route_unassigned_departure_time", "departure_time", postgresql_where=text("driver_id IS NULL")),
+        # 주변 경로 검색 (geohash 접두사 범위 + 출발 시간)
+        Index("ix_route_departure_cell_time", "departure_cell", "departure_time"),
+        Index("ix_route_destination_cell_time", "destination_cell", "departure_time"),
+        # 승인된 여정 수(seats_reserved)는 정원을 넘을 수 없습니다. (services.seat_reservation)
+        CheckConstraint("seats_reserved >= 0 AND seats_reserved <= seat_capacity", name="ck_route_seats_reserved"),
+        # 변경 순서 조회 (GET /fms/sync/routes)
+        Index("ix_route_change_xid_id", "change_xid", "id"),
+    )
 
     id = Column(UUID, primary_key=True, index=True)
     driver_id = Column(UUID, server_default=None, nullable=True)
     car_plate_number = Column(String, server_default="", nullable=True)
     departure_location_name = Column(String, server_default="", nullable=True)
-    departure_time = Column(DateTime, server_default="", nullable=True)
+    departure_time = Column(DateTime, nullable=True)
     destination_location_name = Column(String, server_default="", nullable=True)
+    # 검색용으로 정규화한 장소명 (utils.location.normalize_location_name, 저장 시 자동 계산)
+    departure_location_norm = Column(String, nullable=True)
+    destination_location_norm = Column(String, nullable=True)
+    # 좌표 (없으면 저장 시 utils.gazetteer로 장소명에서 채움)와 geohash 셀
+    # 셀은 접두사 범위 비교가 geohash 순서와 같도록 "C" collation을 사용합니다.
+    departure_lat = Column(Float, nullable=True)
+    departure_lon = Column(Float, nullable=True)
+    destination_lat = Column(Float, nullable=True)
+    destination_lon = Column(Float, nullable=True)
+    departure_cell = Column(String(12, collation="C"), nullable=True)
+    destination_cell = Column(String(12, collation="C"), nullable=True)
+    seat_capacity = Column(Integer, nullable=False, default=DEFAULT_SEAT_CAPACITY, server_default=text(str(DEFAULT_SEAT_CAPACITY)))
+    seats_reserved = Column(Integer, nullable=False, default=0, server_default=text("0"))
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    # 좌석 예약(seats_reserved)만 바뀔 때는 갱신하지 않습니다. (Route 도메인에 없는 값)
+    change_xid = Column(BigInteger, nullable=False, server_default=CURRENT_XACT_ID, onupdate=CURRENT_XACT_ID)
+
+@event.listens_for(RouteDB, "before_insert")
+@event.listens_for(RouteDB, "before_update")
+def _fill_route_search_columns(mapper, connection, target):
+    target.departure_location_norm = normalize_location_name(target.departure_location_name)
+    target.destination_location_norm = normalize_location_name(target.destination_location_name)
+
+    target.departure_lat, target.departure_lon = gazetteer.resolve(
+        target.departure_location_name, target.departure_lat, target.departure_lon
+    )
+    target.destination_lat, target.destination_lon = gazetteer.resolve(
+        target.destination_location_name, target.destination_lat, target.destination_lon
+    )
+    target.departure_cell = geohash_encode(target.departure_lat, target.departure_lon)
+    target.destination_cell = geohash_encode(target.destination_lat, target.destination_lon)
+
+class RouteTombstoneDB(Base):
+    """삭제된 경로의 기록. 동기화 API가 삭제를 전달하는 데 사용합니다."""
+    __tablename__ = "route_tombstone"
+    __table_args__ = (
+        Index("ix_route_tombstone_change_xid_id", "change_xid", "id"),
+    )
+
+    id = Column(UUID, primary_key=True)
+    change_xid = Column(BigInteger, nullable=False, server_default=CURRENT_XACT_ID)
+    deleted_at = Column(DateTime, nullable=False, server_default=text("now()"))
 
     
 class TripDB(Base):
     __tablename__ = "trip"
+    __table_args__ = (
+        Index("ix_trip_ride_route_approved", "ride_route_id", "is_approved"),
+        Index("ix_trip_passenger_approved", "passenger_id", "is_approved"),
+        # 경로별 승인 대기 요청 조회
+        Index("ix_trip_pending_ride_route", "ride_route_id", "pickup_time", postgresql_where=text("NOT is_approved")),
+        Index("ix_trip_pickup_cell", "pickup_cell"),
+        # 변경 순서 조회 (GET /fms/sync/trips)
+        Index("ix_trip_change_xid_id", "change_xid", "id"),
+    )
 
     id = Column(UUID, primary_key=True, index=True)
-    ride_route_id = Column(UUID)
-    passenger_id = Column(UUID)
+    # 경로/승객 삭제 시 여정을 함께 지우거나 비우지 않습니다. (참조하는 여정이 있으면 삭제 실패)
+    ride_route_id = Column(UUID, ForeignKey("route.id", name="fk_trip_ride_route_id"))
+    passenger_id = Column(UUID, ForeignKey("passenger.id", name="fk_trip_passenger_id"))
     pickup_request_location_name = Column(String)
     pickup_time = Column(DateTime)
     is_approved = Column(Boolean, default=False)
+    pickup_lat = Column(Float, nullable=True)
+    pickup_lon = Column(Float, nullable=True)
+    pickup_cell = Column(String(12, collation="C"), nullable=True)
     created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
\ No newline at end of file
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    change_xid = Column(BigInteger, nullable=False, server_default=CURRENT_XACT_ID, onupdate=CURRENT_XACT_ID)
+
+    # 지연 로딩은 여정마다 쿼리를 보내므로(N+1) 막아 둡니다. joinedload/selectinload 또는 조인으로 함께 조회합니다.
+    route = relationship(RouteDB, lazy="raise")
+    passenger = relationship(PassengerDB, lazy="raise")
+
+@event.listens_for(TripDB, "before_insert")
+@event.listens_for(TripDB, "before_update")
+def _locate_trip_pickup(mapper, connection, target):
+    target.pickup_lat, target.pickup_lon = gazetteer.resolve(
+        target.pickup_request_location_name, target.pickup_lat, target.pickup_lon
+    )
+    target.pickup_cell = geohash_encode(target.pickup_lat, target.pickup_lon)
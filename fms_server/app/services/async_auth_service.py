@@ -0,0 +1,41 @@
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.model import PassengerDB
+
+from services.auth_service import AuthService
+from utils.password import verify_password_async
+
+class AsyncAuthService(AuthService):
+    """
+    AuthService의 비동기 버전.
+    토큰 발급/검증은 DB를 사용하지 않으므로 AuthService의 구현을 그대로 사용합니다.
+    비밀번호 검증(PBKDF2)은 CPU를 오래 쓰므로 해시 전용 스레드 풀에서 실행합니다.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def authenticate_user(self, nickname: str, password: str) -> Optional[PassengerDB]:
+        stmt = select(PassengerDB).where(PassengerDB.nickname == nickname).limit(1)
+        user = await self.session.scalar(stmt)
+
+        if not user:
+            return None
+
+        verified, new_hash = await verify_password_async(password, user.password)
+        if not verified:
+            return None
+
+        if new_hash:
+            await self.rehash_password(user, new_hash)
+
+        return user
+
+    async def rehash_password(self, user: PassengerDB, new_hash: str):
+        try:
+            user.password = new_hash
+            await self.session.commit()
+        except Exception as e:
+            print(f"Error rehashing password: {e}")
+            await self.session.rollback()
@@ -0,0 +1,348 @@
+from sqlalchemy import any_, bindparam, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Optional, List
+from uuid import UUID, uuid4
+
+from config.database import may_read_replica
+from domains.passenger import Passenger
+from domains.route import Route
+from domains.trip import Trip, TripBatchApproveResult, TripBatchCreateResult
+from models.model import DEFAULT_SEAT_CAPACITY, PassengerDB, RouteDB, TripDB
+from services.change_feed import notify_changes, route_change, trip_change
+from services.route_query import TRIP_COLUMNS, route_search_conditions, tombstone_route, trip_search_conditions
+from services.profile_cache import profile_cache
+from services.route_cache import RouteSnapshot, route_cache, route_filter
+from services.seat_reservation import RESERVE_AND_APPROVE, lock_pending_trips
+from utils.gazetteer import gazetteer
+from utils.geohash import geohash_encode
+from utils.password import hash_password_async
+
+class AsyncFmsService:
+    """
+    FmsService의 비동기 버전.
+    asyncpg 기반 AsyncSession을 사용하므로 쿼리 대기 중에도 이벤트 루프를 점유하지 않습니다.
+    """
+    def __init__(self, session: AsyncSession):
+        self.session: AsyncSession = session
+
+    async def create_passenger(self, passenger: Passenger) -> Passenger:
+        try:
+            hashed_password = await hash_password_async(passenger.password)
+            passenger_db = PassengerDB(
+                id = uuid4(),
+                password = hashed_password,
+                name = passenger.name,
+                nickname = passenger.nickname,
+                contact_info = passenger.contact_info
+            )
+
+            self.session.add(passenger_db)
+            await self.session.commit()
+            profile_cache.invalidate(passenger_db.nickname)
+            # expire_on_commit=False 이므로 refresh 없이 속성을 그대로 사용합니다.
+            return Passenger.model_validate(passenger_db)
+        except Exception as e:
+            print(f"Error creating passenger: {e}")
+            await self.session.rollback()
+            return None
+
+    async def create_route(self, route: Route) -> Route:
+        try:
+            route_db = RouteDB(
+                id=uuid4(),
+                departure_location_name=route.departure_location_name,
+                departure_time=route.departure_time,
+                destination_location_name=route.destination_location_name,
+                departure_lat=route.departure_lat,
+                departure_lon=route.departure_lon,
+                destination_lat=route.destination_lat,
+                destination_lon=route.destination_lon,
+                seat_capacity=route.seat_capacity if route.seat_capacity is not None else DEFAULT_SEAT_CAPACITY,
+            )
+            self.session.add(route_db)
+            # 기본값(seat_capacity 등)이 채워진 뒤 알림을 만듭니다.
+            await self.session.flush()
+            await notify_changes(self.session, [route_change("created", route_db)])
+            await self.session.commit()
+            route_cache.invalidate_route(route_db.id, RouteSnapshot.of(route_db))
+
+            return Route.model_validate(route_db)
+        except Exception as e:
+            print(f"Error creating ride route: {e}")
+            await self.session.rollback()
+            return None
+
+    async def get_ride_route(self, route_id: UUID) -> Optional[Route]:
+        cache_key = ("route", route_id)
+        cached = route_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        token = route_cache.begin_fill()
+        try:
+            route_db = await self.session.get(RouteDB, route_id)
+            if route_db:
+                route = Route.model_validate(route_db)
+                route_cache.set(cache_key, route, route_id=route_id, token=token, replica=may_read_replica(self.session))
+                return route
+            return None
+        except Exception as e:
+            print(f"Error getting ride route: {e}")
+            return None
+
+    def _route_search_stmt(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        departure_location_name: Optional[str] = None,
+        destination_location_name: Optional[str] = None,
+    ):
+        return select(RouteDB).where(
+            *route_search_conditions(start_time, end_time, departure_location_name, destination_location_name)
+        )
+
+    async def find_ride_routes(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        departure_location_name: Optional[str] = None,
+        destination_location_name: Optional[str] = None,
+    ) -> List[Route]:
+        search_filter = route_filter(start_time, end_time, departure_location_name, destination_location_name)
+        cache_key = ("list", search_filter)
+        cached = route_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        token = route_cache.begin_fill()
+        try:
+            stmt = self._route_search_stmt(*search_filter)
+            routes_db = await self.session.scalars(stmt)
+            routes = [Route.model_validate(route) for route in routes_db]
+            route_cache.set(cache_key, routes, route_filter=search_filter, token=token, replica=may_read_replica(self.session))
+            return list(routes)
+        except Exception as e:
+            print(f"Error finding ride routes: {e}")
+            return []
+
+    async def update_ride_route(self, route_id: UUID, route: Route) -> Optional[Route]:
+        try:
+            route_db = await self.session.get(RouteDB, route_id)
+            if route_db:
+                before = RouteSnapshot.of(route_db)
+                route_db.car_plate_number = route.car_plate_number
+                route_db.departure_location_name = route.departure_location_name
+                route_db.departure_time = route.departure_time
+                route_db.destination_location_name = route.destination_location_name
+                # 좌표가 없으면 저장 시 바뀐 장소명으로 다시 찾습니다.
+                route_db.departure_lat = route.departure_lat
+                route_db.departure_lon = route.departure_lon
+                route_db.destination_lat = route.destination_lat
+                route_db.destination_lon = route.destination_lon
+                # 이미 예약된 좌석보다 줄이면 ck_route_seats_reserved 위반으로 실패합니다.
+                if route.seat_capacity is not None:
+                    route_db.seat_capacity = route.seat_capacity
+
+                await notify_changes(self.session, [route_change("updated", route_db, before)])
+                await self.session.commit()
+                route_cache.invalidate_route(route_id, before, RouteSnapshot.of(route_db))
+
+                return Route.model_validate(route_db)
+            return None
+        except Exception as e:
+            print(f"Error updating ride route: {e}")
+            await self.session.rollback()
+            return None
+
+    async def delete_ride_route(self, route_id: UUID) -> bool:
+        """
+        경로를 삭제하고 삭제 여부를 반환합니다.
+        경로가 없거나, 여정이 아직 참조하고 있으면(fk_trip_ride_route_id) 삭제하지 않고 False를 반환합니다.
+        """
+        try:
+            route_db = await self.session.get(RouteDB, route_id)
+            if route_db is None:
+                return False
+            before = RouteSnapshot.of(route_db)
+            await self.session.delete(route_db)
+            await self.session.execute(tombstone_route(route_id))
+            await notify_changes(self.session, [route_change("deleted", route_db)])
+            await self.session.commit()
+            route_cache.invalidate_route(route_id, before)
+            return True
+        except IntegrityError:
+            print(f"Route {route_id} is still referenced by trips, not deleting")
+            await self.session.rollback()
+            return False
+        except Exception as e:
+            print(f"Error deleting ride route: {e}")
+            await self.session.rollback()
+            return False
+
+    async def create_trip(self, trip: Trip) -> Trip:
+        try:
+            trip_db = TripDB(
+                id=trip.id,
+                ride_route_id=trip.ride_route_id,
+                passenger_id=trip.passenger_id,
+                pickup_request_location_name=trip.pickup_request_location_name,
+                pickup_time=trip.pickup_time,
+                is_approved=trip.is_approved,
+                pickup_lat=trip.pickup_lat,
+                pickup_lon=trip.pickup_lon,
+            )
+            self.session.add(trip_db)
+            await notify_changes(self.session, [trip_change("created", trip_db)])
+            await self.session.commit()
+            return trip
+        except Exception as e:
+            print(f"Error creating trip: {e}")
+            await self.session.rollback()
+            return None
+
+    async def get_trip(self, request_id: UUID) -> Optional[Trip]:
+        try:
+            trip_db = await self.session.get(TripDB, request_id)
+            if trip_db:
+                return Trip.model_validate(trip_db)
+            return None
+        except Exception as e:
+            print(f"Error getting trip: {e}")
+            return None
+
+    async def find_trips(
+        self,
+        ride_route_id: Optional[UUID] = None,
+        passenger_id: Optional[UUID] = None,
+        is_approved: Optional[bool] = None,
+    ) -> List[Trip]:
+        try:
+            stmt = select(TripDB).where(*trip_search_conditions(ride_route_id, passenger_id, is_approved))
+            trips_db = await self.session.scalars(stmt)
+            return [Trip.model_validate(trip) for trip in trips_db]
+        except Exception as e:
+            print(f"Error finding trips: {e}")
+            return []
+
+    async def approve_trip(self, request_id: UUID) -> Optional[Trip]:
+        """
+        경로 좌석을 예약하고 여정을 승인합니다.
+        여정이 없거나, 좌석이 없거나, 다른 요청이 같은 여정을 승인 중이면 None을 반환합니다.
+        """
+        result = await self.approve_trips([request_id])
+        if result is None or not result.approved:
+            return None
+        return result.approved[0]
+
+    async def create_trips(self, trips: List[Trip]) -> Optional[TripBatchCreateResult]:
+        """
+        여러 여정을 한 트랜잭션에서 생성합니다.
+        경로/승객 존재 확인 각 1회 + 다중 행 INSERT 1회로, 요청 수와 무관하게 왕복 횟수가 일정합니다.
+        존재하지 않는 경로/승객을 가리키는 여정은 생성하지 않고 missing_route_ids/missing_passenger_ids로 보고합니다.
+        """
+        if not trips:
+            return TripBatchCreateResult()
+        try:
+            route_ids = {trip.ride_route_id for trip in trips}
+            existing_route_ids = set(
+                await self.session.scalars(select(RouteDB.id).where(RouteDB.id.in_(route_ids)))
+            )
+            passenger_ids = {trip.passenger_id for trip in trips}
+            existing_passenger_ids = set(
+                await self.session.scalars(select(PassengerDB.id).where(PassengerDB.id.in_(passenger_ids)))
+            )
+
+            now = datetime.now()
+            rows = []
+            for trip in trips:
+                if trip.ride_route_id not in existing_route_ids or trip.passenger_id not in existing_passenger_ids:
+                    continue
+                # Core INSERT는 ORM 이벤트를 거치지 않으므로 좌표/셀을 직접 채웁니다.
+                pickup_lat, pickup_lon = gazetteer.resolve(trip.pickup_request_location_name, trip.pickup_lat, trip.pickup_lon)
+                rows.append({
+                    "id": trip.id or uuid4(),
+                    "ride_route_id": trip.ride_route_id,
+                    "passenger_id": trip.passenger_id,
+                    "pickup_request_location_name": trip.pickup_request_location_name,
+                    "pickup_time": trip.pickup_time,
+                    "is_approved": trip.is_approved,
+                    "pickup_lat": pickup_lat,
+                    "pickup_lon": pickup_lon,
+                    "pickup_cell": geohash_encode(pickup_lat, pickup_lon),
+                    "created_at": now,
+                    "updated_at": now,
+                })
+
+            created = []
+            if rows:
+                stmt = insert(TripDB).values(rows).on_conflict_do_nothing(index_elements=[TripDB.id]).returning(*TRIP_COLUMNS)
+                created = [Trip.model_validate(dict(row._mapping)) for row in await self.session.execute(stmt)]
+                await notify_changes(self.session, [trip_change("created", trip) for trip in created])
+            await self.session.commit()
+
+            return TripBatchCreateResult(
+                created=created,
+                missing_route_ids=sorted(route_ids - existing_route_ids, key=str),
+                missing_passenger_ids=sorted(passenger_ids - existing_passenger_ids, key=str),
+            )
+        except Exception as e:
+            print(f"Error creating trips: {e}")
+            await self.session.rollback()
+            return None
+
+    async def approve_trips(self, request_ids: List[UUID]) -> Optional[TripBatchApproveResult]:
+        """
+        여러 여정을 경로 좌석 예약과 함께 한 트랜잭션에서 승인합니다. (services.seat_reservation)
+        경로별로 먼저 요청된(created_at) 여정부터 남은 좌석만큼 승인하며, 이미 승인된 여정은 approved에 포함합니다.
+        좌석이 없는 여정은 full_ids, 다른 요청이 승인 중이어서 건너뛴 여정은 busy_ids, 없는 ID는 missing_ids로 보고합니다.
+        """
+        if not request_ids:
+            return TripBatchApproveResult()
+        try:
+            locked = (await self.session.execute(lock_pending_trips(request_ids))).all()
+            approved = []
+            if locked:
+                rows = await self.session.execute(
+                    RESERVE_AND_APPROVE,
+                    {"trip_ids": [row.id for row in locked], "route_ids": [row.ride_route_id for row in locked]},
+                )
+                approved = [Trip.model_validate(dict(row._mapping)) for row in rows]
+                await notify_changes(self.session, [trip_change("approved", trip) for trip in approved])
+
+            approved_ids = {trip.id for trip in approved}
+            rest = [request_id for request_id in dict.fromkeys(request_ids) if request_id not in approved_ids]
+            current = {}
+            if rest:
+                stmt = select(*TRIP_COLUMNS).where(
+                    TripDB.id == any_(bindparam("ids", rest, type_=ARRAY(TripDB.id.type)))
+                )
+                current = {row.id: row for row in await self.session.execute(stmt)}
+            await self.session.commit()
+
+            result = TripBatchApproveResult(approved=approved)
+            locked_ids = {row.id for row in locked}
+            for request_id in rest:
+                row = current.get(request_id)
+                if row is None:
+                    result.missing_ids.append(request_id)
+                elif row.is_approved:
+                    result.approved.append(Trip.model_validate(dict(row._mapping)))
+                elif request_id in locked_ids:
+                    result.full_ids.append(request_id)
+                else:
+                    result.busy_ids.append(request_id)
+            return result
+        except Exception as e:
+            print(f"Error approving trips: {e}")
+            await self.session.rollback()
+            return None
+
+    async def find_passenger(self, passenger_id: str):
+        try:
+            passenger_db = await self.session.get(PassengerDB, passenger_id)
+            return Passenger.model_validate(passenger_db)
+        except Exception as e:
+            print(f"Error create passenger:{e}")
+            await self.session.rollback()
+            return None
@@ -0,0 +1,64 @@
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import uuid4
+
+from domains.passenger import Passenger, ResponsePassenger
+from models.model import PassengerDB
+from services.profile_cache import PassengerProfile, profile_cache
+from utils.password import hash_password_async
+
+class AsyncPassengerService:
+    """PassengerService의 비동기 버전"""
+    def __init__(self, session: AsyncSession):
+        self.session: AsyncSession = session
+
+    async def create_passenger(self, passenger: Passenger) -> Passenger:
+        try:
+            hashed_password = await hash_password_async(passenger.password)
+            passenger_db = PassengerDB(
+                id = uuid4(),
+                password = hashed_password,
+                name = passenger.name,
+                nickname = passenger.nickname,
+                contact_info = passenger.contact_info
+            )
+
+            self.session.add(passenger_db)
+            await self.session.commit()
+            profile_cache.invalidate(passenger_db.nickname)
+            return Passenger.model_validate(passenger_db)
+        except Exception as e:
+            print(f"Error creating passenger: {e}")
+            await self.session.rollback()
+            return None
+
+    async def find_by_id(self, passenger_id: str):
+        passenger_db: PassengerDB = await self.session.get(PassengerDB, passenger_id)
+        if passenger_db is None:
+            return None
+        return Passenger.model_validate(passenger_db)
+
+    async def find_by_nickname(self, nickname: str):
+        stmt = select(PassengerDB).where(PassengerDB.nickname == nickname).limit(1)
+        passenger_db: PassengerDB = await self.session.scalar(stmt)
+        if passenger_db is None:
+            return None
+        return Passenger.model_validate(passenger_db)
+
+    async def get_profile(self, nickname: str) -> Optional[PassengerProfile]:
+        """
+        /my-info 응답(직렬화된 본문과 ETag)을 반환합니다. 캐시에 있으면 DB를 조회하지 않습니다.
+        ORM 객체에서 ResponsePassenger를 바로 만들어 한 번만 검증/직렬화합니다.
+        """
+        profile = profile_cache.get(nickname)
+        if profile is not None:
+            return profile
+        stmt = select(PassengerDB).where(PassengerDB.nickname == nickname).limit(1)
+        passenger_db: PassengerDB = await self.session.scalar(stmt)
+        if passenger_db is None:
+            return None
+        profile = PassengerProfile.of(ResponsePassenger.model_validate(passenger_db).model_dump_json().encode())
+        profile_cache.set(nickname, profile)
+        return profile
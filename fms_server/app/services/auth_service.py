@@ -1,12 +1,11 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import jwt
-from passlib.context import CryptContext
-from passlib.hash import pbkdf2_sha256
 from sqlalchemy.orm import Session
 from models.model import PassengerDB
 
 from domains.passenger import Passenger
+from utils.password import verify_password
 
 class AuthService:
     SECRET_KEY = "your-secret-key"  # 실제 환경에서는 환경 변수 등으로 관리해야 합니다.
@@ -18,7 +17,7 @@ class AuthService:
         
 
     def verify_password(self, plain_password, hashed_password):
-        return pbkdf2_sha256.verify(plain_password, hashed_password)
+        return verify_password(plain_password, hashed_password)[0]
 
     def authenticate_user(self, nickname: str, password: str) -> Optional[PassengerDB]:
         user = self.session.query(PassengerDB).filter(PassengerDB.nickname == nickname).first()
@@ -26,11 +25,24 @@ class AuthService:
         if not user:
             return None
         
-        if not self.verify_password(password, user.password):
+        verified, new_hash = verify_password(password, user.password)
+        if not verified:
             return None
+
+        if new_hash:
+            self.rehash_password(user, new_hash)
         
         return user
 
+    def rehash_password(self, user: PassengerDB, new_hash: str):
+        """PASSWORD_HASH_ROUNDS가 바뀐 뒤 로그인한 사용자의 해시를 새 반복 횟수로 교체합니다. 실패해도 로그인은 유지합니다."""
+        try:
+            user.password = new_hash
+            self.session.commit()
+        except Exception as e:
+            print(f"Error rehashing password: {e}")
+            self.session.rollback()
+
     def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None):
         to_encode = data.copy()
         if expires_delta:
@@ -0,0 +1,250 @@
+import codecs
+import csv
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+from uuid import uuid4
+
+from pydantic import ValidationError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from controllers.dto.request_dto import RequestBulkRoute
+from domains.route import RouteImportError, RouteImportResult
+from services.change_feed import notify_changes, routes_imported_change
+from services.route_cache import route_cache
+from utils.gazetteer import gazetteer
+from utils.geohash import geohash_encode
+from utils.location import normalize_location_name
+
+CSV_CONTENT_TYPES = ("text/csv",)
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+# 응답에 포함할 오류 행의 최대 개수 (전체 실패 수는 failed로 따로 집계)
+MAX_REPORTED_ERRORS = 1000
+
+ROUTE_IMPORT_COLUMNS = [
+    "line_no",
+    "id",
+    "driver_id",
+    "car_plate_number",
+    "departure_location_name",
+    "departure_time",
+    "destination_location_name",
+    "departure_location_norm",
+    "destination_location_norm",
+    "departure_lat",
+    "departure_lon",
+    "destination_lat",
+    "destination_lon",
+    "departure_cell",
+    "destination_cell",
+    "seat_capacity",
+]
+
+CREATE_STAGING_SQL = """
+CREATE TEMP TABLE route_import (
+    line_no bigint,
+    id uuid,
+    driver_id uuid,
+    car_plate_number varchar,
+    departure_location_name varchar,
+    departure_time timestamp,
+    destination_location_name varchar,
+    departure_location_norm varchar,
+    destination_location_norm varchar,
+    departure_lat double precision,
+    departure_lon double precision,
+    destination_lat double precision,
+    destination_lon double precision,
+    departure_cell varchar,
+    destination_cell varchar,
+    seat_capacity integer
+) ON COMMIT DROP
+"""
+
+# 같은 id가 여러 번 나오면 마지막 행을 사용합니다. (ON CONFLICT는 한 행을 두 번 갱신할 수 없음)
+MERGE_SQL = """
+WITH merged AS (
+    INSERT INTO route (id, driver_id, car_plate_number, departure_location_name, departure_time,
+                       destination_location_name, departure_location_norm, destination_location_norm,
+                       departure_lat, departure_lon, destination_lat, destination_lon,
+                       departure_cell, destination_cell, seat_capacity, created_at, updated_at)
+    SELECT DISTINCT ON (id) id, driver_id, car_plate_number, departure_location_name, departure_time,
+           destination_location_name, departure_location_norm, destination_location_norm,
+           departure_lat, departure_lon, destination_lat, destination_lon,
+           departure_cell, destination_cell, seat_capacity, now(), now()
+    FROM route_import
+    ORDER BY id, line_no DESC
+    ON CONFLICT (id) DO UPDATE SET
+        driver_id = EXCLUDED.driver_id,
+        car_plate_number = EXCLUDED.car_plate_number,
+        departure_location_name = EXCLUDED.departure_location_name,
+        departure_time = EXCLUDED.departure_time,
+        destination_location_name = EXCLUDED.destination_location_name,
+        departure_location_norm = EXCLUDED.departure_location_norm,
+        destination_location_norm = EXCLUDED.destination_location_norm,
+        departure_lat = EXCLUDED.departure_lat,
+        departure_lon = EXCLUDED.departure_lon,
+        destination_lat = EXCLUDED.destination_lat,
+        destination_lon = EXCLUDED.destination_lon,
+        departure_cell = EXCLUDED.departure_cell,
+        destination_cell = EXCLUDED.destination_cell,
+        -- 이미 예약된 좌석 수보다 줄이지 않습니다.
+        seat_capacity = GREATEST(EXCLUDED.seat_capacity, route.seats_reserved),
+        updated_at = now(),
+        change_xid = DEFAULT
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM merged
+"""
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """바이트 청크 스트림을 (줄 번호, 줄) 단위로 나눕니다. 빈 줄은 건너뜁니다."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    line_no = 0
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                yield line_no, line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer.strip():
+        yield line_no + 1, buffer.rstrip("\r")
+
+
+def format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in detail['loc']) or 'row'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+def to_naive(value: Optional[datetime]) -> Optional[datetime]:
+    # route.departure_time은 timestamp(without time zone) 컬럼이므로 로컬 시간으로 맞춥니다.
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone().replace(tzinfo=None)
+    return value
+
+
+class BulkImportService:
+    """
+    CSV/NDJSON 스트림으로 받은 경로를 COPY로 임시 테이블에 적재한 뒤 한 트랜잭션에서 route에 병합합니다.
+    행 단위로 검증하며 스트리밍하므로 요청 크기와 무관하게 메모리 사용량이 일정합니다.
+    CSV는 첫 줄을 헤더로 사용하며, 줄바꿈을 포함한 필드는 지원하지 않습니다.
+    """
+    def __init__(self, session: AsyncSession):
+        self.session: AsyncSession = session
+
+    async def _parse(self, chunks: AsyncIterator[bytes], content_type: str) -> AsyncIterator[Tuple[int, object]]:
+        """(줄 번호, RequestBulkRoute 또는 오류 메시지)를 생성합니다."""
+        if content_type in NDJSON_CONTENT_TYPES:
+            async for line_no, line in iter_lines(chunks):
+                try:
+                    yield line_no, RequestBulkRoute.model_validate_json(line)
+                except ValidationError as e:
+                    yield line_no, format_validation_error(e)
+            return
+
+        header = None
+        # 줄 단위로 읽으므로 여러 줄에 걸친 따옴표 필드는 지원하지 않습니다.
+        # 잘린 값이나 나머지 줄이 별도 행으로 등록되지 않도록, 필드가 닫히는 줄까지 모두 오류로 처리합니다.
+        open_quote_line = None
+        async for line_no, line in iter_lines(chunks):
+            if open_quote_line is not None:
+                yield line_no, f"quoted field from line {open_quote_line} spans lines (not supported)"
+                if line.count('"') % 2 == 1:
+                    open_quote_line = None
+                continue
+            try:
+                values = next(csv.reader([line], strict=True))
+            except csv.Error as e:
+                if line.count('"') % 2 == 1:
+                    open_quote_line = line_no
+                    yield line_no, "quoted field spans lines (not supported)"
+                else:
+                    yield line_no, f"invalid CSV row: {e}"
+                continue
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+            if len(values) != len(header):
+                yield line_no, f"expected {len(header)} columns, got {len(values)}"
+                continue
+            row = {name: (value if value != "" else None) for name, value in zip(header, values)}
+            try:
+                yield line_no, RequestBulkRoute.model_validate(row)
+            except ValidationError as e:
+                yield line_no, format_validation_error(e)
+
+    async def import_routes(self, chunks: AsyncIterator[bytes], content_type: str) -> Optional[RouteImportResult]:
+        """
+        경로를 일괄 등록/갱신하고 행별 오류를 포함한 결과를 반환합니다.
+        지원하지 않는 content_type은 ValueError를 발생시키고, DB 오류 시에는 None을 반환합니다.
+        """
+        if content_type not in CSV_CONTENT_TYPES + NDJSON_CONTENT_TYPES:
+            raise ValueError(f"Unsupported content type: {content_type}")
+
+        result = RouteImportResult()
+        errors: List[RouteImportError] = []
+
+        async def records():
+            async for line_no, parsed in self._parse(chunks, content_type):
+                if isinstance(parsed, str):
+                    result.failed += 1
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append(RouteImportError(line=line_no, error=parsed))
+                    continue
+                departure_lat, departure_lon = gazetteer.resolve(
+                    parsed.departure_location_name, parsed.departure_lat, parsed.departure_lon
+                )
+                destination_lat, destination_lon = gazetteer.resolve(
+                    parsed.destination_location_name, parsed.destination_lat, parsed.destination_lon
+                )
+                yield (
+                    line_no,
+                    parsed.id or uuid4(),
+                    parsed.driver_id,
+                    parsed.car_plate_number,
+                    parsed.departure_location_name,
+                    to_naive(parsed.departure_time),
+                    parsed.destination_location_name,
+                    # COPY/원시 SQL은 ORM 이벤트를 거치지 않으므로 정규화 값/좌표/셀을 직접 채웁니다.
+                    normalize_location_name(parsed.departure_location_name),
+                    normalize_location_name(parsed.destination_location_name),
+                    departure_lat,
+                    departure_lon,
+                    destination_lat,
+                    destination_lon,
+                    geohash_encode(departure_lat, departure_lon),
+                    geohash_encode(destination_lat, destination_lon),
+                    parsed.seat_capacity,
+                )
+
+        try:
+            await self.session.execute(text(CREATE_STAGING_SQL))
+            connection = await self.session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                "route_import", records=records(), columns=ROUTE_IMPORT_COLUMNS
+            )
+
+            inserted, updated = (await self.session.execute(text(MERGE_SQL))).one()
+            if inserted or updated:
+                await notify_changes(self.session, [routes_imported_change(inserted, updated)])
+            await self.session.commit()
+            # 변경된 경로가 많으므로 행별 판단 대신 캐시 전체를 비웁니다.
+            if inserted or updated:
+                route_cache.clear()
+        except Exception as e:
+            print(f"Error importing routes: {e}")
+            await self.session.rollback()
+            return None
+
+        result.inserted = inserted
+        result.updated = updated
+        result.errors = errors
+        return result
@@ -0,0 +1,350 @@
+import asyncio
+import json
+import os
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.types import Text
+
+from config.database import DB_HOST, DB_NAME, DB_PASSWORD, DB_PORT, DB_USER
+from services.route_cache import RouteSnapshot
+from utils.location import normalize_location_name
+
+# 경로/여정 변경 알림 흐름
+# 1. 쓰기 경로(FmsService, AsyncFmsService, BulkImportService, MatchingService)가 커밋 직전에
+#    같은 트랜잭션에서 pg_notify를 호출합니다. 알림은 커밋될 때만 전달되고 롤백되면 사라집니다.
+# 2. 워커마다 하나의 ChangeFeed가 전용 커넥션 하나로 LISTEN하고, 받은 알림을 한 번만 파싱하여
+#    필터가 일치하는 구독자(GET /fms/changes/stream)의 버퍼에 넣습니다.
+# 알림은 저장되지 않으므로 연결이 끊긴 동안의 변경은 전달되지 않습니다. 이때 구독자에게 resync를 보냅니다.
+
+CHANGE_CHANNEL = os.environ.get("CHANGE_FEED_CHANNEL", "fms_changes")
+
+NOTIFY_CHANGES = text(
+    "SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"
+).bindparams(bindparam("payloads", type_=ARRAY(Text)))
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _str(value: Optional[UUID]) -> Optional[str]:
+    return str(value) if value is not None else None
+
+
+def route_change(op: str, route, *snapshots: Optional[RouteSnapshot]) -> Dict[str, Any]:
+    """
+    경로 변경 알림. (op: created/updated/deleted)
+    locations에는 변경 전/후의 정규화된 출발지·목적지를 모두 넣어, 장소를 떠난 경로도 그 장소의 구독자에게 전달합니다.
+    """
+    snapshots = [RouteSnapshot.of(route), *(snapshot for snapshot in snapshots if snapshot is not None)]
+    locations = {name for snapshot in snapshots for name in snapshot[1:] if name}
+    return {
+        "entity": "route",
+        "op": op,
+        "id": _str(route.id),
+        "departure_location_name": route.departure_location_name,
+        "departure_time": _iso(route.departure_time),
+        "destination_location_name": route.destination_location_name,
+        "seat_capacity": route.seat_capacity,
+        "locations": sorted(locations),
+    }
+
+
+def routes_imported_change(inserted: int, updated: int) -> Dict[str, Any]:
+    """일괄 등록 알림. 개별 경로 대신 건수만 보내며, 경로/장소 필터를 사용하는 구독자 모두에게 전달됩니다."""
+    return {"entity": "route", "op": "imported", "inserted": inserted, "updated": updated}
+
+
+def trip_change(op: str, trip) -> Dict[str, Any]:
+    """여정 변경 알림. (op: created/approved)"""
+    location = normalize_location_name(trip.pickup_request_location_name)
+    return {
+        "entity": "trip",
+        "op": op,
+        "id": _str(trip.id),
+        "ride_route_id": _str(trip.ride_route_id),
+        "passenger_id": _str(trip.passenger_id),
+        "pickup_request_location_name": trip.pickup_request_location_name,
+        "pickup_time": _iso(trip.pickup_time),
+        "is_approved": bool(trip.is_approved),
+        "locations": [location] if location else [],
+    }
+
+
+def _notify_params(changes: Iterable[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    payloads = [json.dumps(change, ensure_ascii=False, separators=(",", ":")) for change in changes]
+    if not payloads:
+        return None
+    return {"channel": CHANGE_CHANNEL, "payloads": payloads}
+
+
+async def notify_changes(session: AsyncSession, changes: Iterable[Dict[str, Any]]):
+    """변경 알림을 현재 트랜잭션에 추가합니다. 커밋 전에 호출해야 하며, 알림 수와 무관하게 한 번 왕복합니다."""
+    params = _notify_params(changes)
+    if params is not None:
+        await session.execute(NOTIFY_CHANGES, params)
+
+
+def notify_changes_sync(session: Session, changes: Iterable[Dict[str, Any]]):
+    """notify_changes의 동기 세션 버전"""
+    params = _notify_params(changes)
+    if params is not None:
+        session.execute(NOTIFY_CHANGES, params)
+
+
+class Change(NamedTuple):
+    """LISTEN으로 받은 알림 (필터 비교에 필요한 필드와 원문 payload)"""
+    entity: Optional[str]
+    route_id: Optional[str]
+    passenger_id: Optional[str]
+    locations: FrozenSet[str]
+    bulk: bool
+    payload: str
+
+    @classmethod
+    def parse(cls, payload: str) -> "Change":
+        """payload가 JSON 객체가 아니면 ValueError"""
+        data = json.loads(payload)
+        if not isinstance(data, dict):
+            raise ValueError("change payload must be a JSON object")
+        entity = data.get("entity")
+        return cls(
+            entity=entity,
+            route_id=data.get("id") if entity == "route" else data.get("ride_route_id"),
+            passenger_id=data.get("passenger_id"),
+            locations=frozenset(data.get("locations") or ()),
+            bulk=data.get("op") == "imported",
+            payload=payload,
+        )
+
+
+class ChangeFilter(NamedTuple):
+    """구독 조건. 지정한 조건을 모두 만족하는 변경만 전달합니다."""
+    entity: Optional[str] = None
+    route_id: Optional[str] = None
+    passenger_id: Optional[str] = None
+    location: Optional[str] = None
+
+    @classmethod
+    def of(
+        cls,
+        entity: Optional[str] = None,
+        route_id: Optional[UUID] = None,
+        passenger_id: Optional[UUID] = None,
+        location: Optional[str] = None,
+    ) -> "ChangeFilter":
+        return cls(entity, _str(route_id), _str(passenger_id), normalize_location_name(location))
+
+    def matches(self, change: Change) -> bool:
+        if self.entity is not None and self.entity != change.entity:
+            return False
+        if change.bulk:
+            # 어떤 경로가 바뀌었는지 알 수 없으므로 승객 조건이 없으면 전달합니다.
+            return self.passenger_id is None
+        if self.route_id is not None and self.route_id != change.route_id:
+            return False
+        if self.passenger_id is not None and self.passenger_id != change.passenger_id:
+            return False
+        if self.location is not None and self.location not in change.locations:
+            return False
+        return True
+
+
+class ChangeMessage(NamedTuple):
+    """구독자에게 전달하는 메시지 (SSE의 event/data)"""
+    event: str
+    data: str
+
+    def sse(self) -> bytes:
+        return f"event: {self.event}\ndata: {self.data}\n\n".encode()
+
+
+class Subscription:
+    """
+    구독자 한 명의 필터와 크기 제한 버퍼.
+    버퍼가 가득 차면(느린 구독자) 쌓인 메시지를 버리고 lagged 메시지 하나로 바꿉니다.
+    구독자는 lagged를 받으면 목록 API로 상태를 다시 조회해야 합니다.
+    """
+    def __init__(self, change_filter: ChangeFilter, maxsize: int):
+        self.filter = change_filter
+        self._queue: "asyncio.Queue[ChangeMessage]" = asyncio.Queue(maxsize=max(maxsize, 1))
+        self.dropped = 0
+
+    def offer(self, message: ChangeMessage) -> int:
+        """메시지를 버퍼에 넣고, 버퍼가 가득 차 버린 메시지 수를 반환합니다. (넣었으면 0)"""
+        try:
+            self._queue.put_nowait(message)
+            return 0
+        except asyncio.QueueFull:
+            pass
+        discarded = 1
+        while not self._queue.empty():
+            if self._queue.get_nowait().event != "lagged":
+                discarded += 1
+        self.dropped += discarded
+        self._queue.put_nowait(ChangeMessage("lagged", json.dumps({"dropped": self.dropped})))
+        return discarded
+
+    async def get(self, timeout: float) -> Optional[ChangeMessage]:
+        """다음 메시지. timeout 초 안에 없으면 None (연결 유지 신호를 보낼 시점)"""
+        try:
+            message = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if message.event == "lagged":
+            self.dropped = 0
+        return message
+
+
+class ChangeFeed:
+    """
+    워커(프로세스)당 하나의 LISTEN 커넥션으로 받은 변경 알림을 여러 구독자에게 나눠 줍니다.
+    첫 구독 시 리스너를 시작하고, 연결이 끊기면 지연 시간을 늘려 가며 다시 연결합니다.
+    connect는 LISTEN에 사용할 asyncpg 커넥션을 만드는 코루틴 함수입니다. (커넥션 풀과 별도)
+    """
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[Any]],
+        channel: str = CHANGE_CHANNEL,
+        buffer_size: int = 256,
+        max_subscribers: int = 0,
+        health_check_interval: float = 30.0,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        self._connect = connect
+        self.channel = channel
+        self.buffer_size = buffer_size
+        # 0이면 제한하지 않습니다.
+        self.max_subscribers = max_subscribers
+        self.health_check_interval = health_check_interval
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._subscriptions: List[Subscription] = []
+        self._task: Optional[asyncio.Task] = None
+        self.listening = False
+        self.notifications = 0
+        self.malformed = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.reconnects = 0
+
+    def subscribe(self, change_filter: ChangeFilter) -> Optional[Subscription]:
+        """구독을 등록합니다. 구독자 수 제한을 넘으면 None."""
+        if self.max_subscribers and len(self._subscriptions) >= self.max_subscribers:
+            return None
+        subscription = Subscription(change_filter, self.buffer_size)
+        # 전달 중에 목록을 복사하지 않도록 새 목록으로 바꿉니다.
+        self._subscriptions = self._subscriptions + [subscription]
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._listen_forever())
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscriptions = [s for s in self._subscriptions if s is not subscription]
+
+    def publish(self, payload: str):
+        """알림 하나를 필터가 일치하는 구독자에게 전달합니다."""
+        self.notifications += 1
+        try:
+            change = Change.parse(payload)
+        except ValueError:
+            self.malformed += 1
+            return
+        message = ChangeMessage("change", change.payload)
+        for subscription in self._subscriptions:
+            if subscription.filter.matches(change):
+                discarded = subscription.offer(message)
+                if discarded:
+                    self.dropped += discarded
+                else:
+                    self.delivered += 1
+
+    def _broadcast(self, message: ChangeMessage):
+        for subscription in self._subscriptions:
+            subscription.offer(message)
+
+    def _on_notification(self, connection, pid, channel, payload):
+        self.publish(payload)
+
+    async def _listen_once(self):
+        connection = await self._connect()
+        try:
+            terminated = asyncio.Event()
+            connection.add_termination_listener(lambda _: terminated.set())
+            await connection.add_listener(self.channel, self._on_notification)
+            self.listening = True
+            # LISTEN 전/연결이 끊긴 동안의 변경은 받지 못했으므로 다시 조회하도록 알립니다.
+            self._broadcast(ChangeMessage("resync", json.dumps({"reason": "listening"})))
+            while not terminated.is_set():
+                try:
+                    await asyncio.wait_for(terminated.wait(), self.health_check_interval)
+                except asyncio.TimeoutError:
+                    # 조용히 끊긴 연결(네트워크 단절)을 감지합니다.
+                    await asyncio.wait_for(connection.fetchval("SELECT 1"), self.health_check_interval)
+        finally:
+            self.listening = False
+            if not connection.is_closed():
+                await connection.close(timeout=5)
+
+    async def _listen_forever(self):
+        delay = self.reconnect_delay
+        while True:
+            started = asyncio.get_running_loop().time()
+            try:
+                await self._listen_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Change feed listener error: {e}")
+            # 한동안 정상적으로 수신했다면 지연 시간을 처음 값으로 되돌립니다.
+            if asyncio.get_running_loop().time() - started > self.max_reconnect_delay:
+                delay = self.reconnect_delay
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def close(self):
+        """리스너를 멈춥니다. (애플리케이션 종료 시)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "channel": self.channel,
+            "listening": self.listening,
+            "subscribers": len(self._subscriptions),
+            "buffer_size": self.buffer_size,
+            "max_subscribers": self.max_subscribers,
+            "notifications": self.notifications,
+            "malformed": self.malformed,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "reconnects": self.reconnects,
+        }
+
+
+async def _connect_listener():
+    return await asyncpg.connect(
+        host=DB_HOST, port=int(DB_PORT), user=DB_USER, password=DB_PASSWORD, database=DB_NAME
+    )
+
+
+change_feed = ChangeFeed(
+    _connect_listener,
+    buffer_size=int(os.environ.get("CHANGE_FEED_BUFFER_SIZE", "256")),
+    max_subscribers=int(os.environ.get("CHANGE_FEED_MAX_SUBSCRIBERS", "0")),
+    health_check_interval=float(os.environ.get("CHANGE_FEED_HEALTH_CHECK_SECONDS", "30")),
+)
@@ -1,16 +1,21 @@
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from uuid import UUID
 from datetime import datetime
 from typing import Optional, List
 from uuid import UUID, uuid4
 
-from passlib.hash import pbkdf2_sha256
-
 from domains.passenger import Passenger, ResponsePassenger
 from domains.route import Route
 from domains.trip import Trip
 from controllers.dto.request_dto import RequestCreatePassenger
 from models.model import PassengerDB, RouteDB, TripDB
+from services.change_feed import notify_changes_sync, route_change, trip_change
+from services.profile_cache import profile_cache
+from services.route_cache import RouteSnapshot, route_cache
+from services.route_query import tombstone_route
+from services.seat_reservation import RESERVE_AND_APPROVE, lock_pending_trips
+from utils.password import hash_password
 
 class FmsService:
     def __init__(self, session: Session):
@@ -18,7 +23,7 @@ class FmsService:
 
     def create_passenger(self, passenger: Passenger) -> Passenger:
         try:
-            hashed_password = pbkdf2_sha256.hash(passenger.password)
+            hashed_password = hash_password(passenger.password)
             passenger_db = PassengerDB(
                 id = uuid4(),
                 password = hashed_password,
@@ -30,6 +35,7 @@ class FmsService:
             self.session.add(passenger_db)
             self.session.commit()
             self.session.refresh(passenger_db)
+            profile_cache.invalidate(passenger_db.nickname)
             return Passenger.model_validate(passenger_db)
         except Exception as e:
             print(f"Error creating passenger: {e}")
@@ -45,8 +51,12 @@ class FmsService:
                 destination_location_name=route.destination_location_name
             )
             self.session.add(route_db)
+            # 기본값(seat_capacity 등)이 채워진 뒤 알림을 만듭니다.
+            self.session.flush()
+            notify_changes_sync(self.session, [route_change("created", route_db)])
             self.session.commit()
             self.session.refresh(route_db)
+            route_cache.invalidate_route(route_db.id, RouteSnapshot.of(route_db))
             
             return Route.model_validate(route_db)
         except Exception as e:
@@ -100,13 +110,16 @@ class FmsService:
         try:
             route_db = self.session.query(RouteDB).filter(RouteDB.id == route_id).first()
             if route_db:
+                before = RouteSnapshot.of(route_db)
                 route_db.car_plate_number = route.car_plate_number
                 route_db.departure_location_name = route.departure_location_name
                 route_db.departure_time = route.departure_time
                 route_db.destination_location_name = route.destination_location_name
                 
+                notify_changes_sync(self.session, [route_change("updated", route_db, before)])
                 self.session.commit()
                 self.session.refresh(route_db)
+                route_cache.invalidate_route(route_id, before, RouteSnapshot.of(route_db))
                 
                 return Route(
                     id=route_db.id,
@@ -122,15 +135,27 @@ class FmsService:
             self.session.rollback()
             return None
 
-    def delete_ride_route(self, route_id: UUID):
+    def delete_ride_route(self, route_id: UUID) -> bool:
+        """경로를 삭제하고 삭제 여부를 반환합니다. (AsyncFmsService.delete_ride_route와 같음)"""
         try:
             route_db = self.session.query(RouteDB).filter(RouteDB.id == route_id).first()
-            if route_db:
-                self.session.delete(route_db)
-                self.session.commit()
+            if route_db is None:
+                return False
+            before = RouteSnapshot.of(route_db)
+            self.session.delete(route_db)
+            self.session.execute(tombstone_route(route_id))
+            notify_changes_sync(self.session, [route_change("deleted", route_db)])
+            self.session.commit()
+            route_cache.invalidate_route(route_id, before)
+            return True
+        except IntegrityError:
+            print(f"Route {route_id} is still referenced by trips, not deleting")
+            self.session.rollback()
+            return False
         except Exception as e:
             print(f"Error deleting ride route: {e}")
             self.session.rollback()
+            return False
 
     def create_trip(self, trip: Trip) -> Trip:
         try:
@@ -143,6 +168,7 @@ class FmsService:
                 is_approved=trip.is_approved
             )
             self.session.add(trip_db)
+            notify_changes_sync(self.session, [trip_change("created", trip_db)])
             self.session.commit()
             self.session.refresh(trip_db)
             return trip
@@ -198,21 +224,24 @@ class FmsService:
             return []
 
     def approve_trip(self, request_id: UUID) -> Optional[Trip]:
+        """경로 좌석을 예약하고 승인합니다. (AsyncFmsService.approve_trips와 같은 services.seat_reservation 사용)"""
         try:
-            trip_db = self.session.query(TripDB).filter(TripDB.id == request_id).first()
-            if trip_db:
-                trip_db.is_approved = True
+            locked = self.session.execute(lock_pending_trips([request_id])).first()
+            if locked:
+                row = self.session.execute(
+                    RESERVE_AND_APPROVE, {"trip_ids": [locked.id], "route_ids": [locked.ride_route_id]}
+                ).first()
+                if row:
+                    notify_changes_sync(self.session, [trip_change("approved", row)])
                 self.session.commit()
-                self.session.refresh(trip_db)
-                
-                return Trip(
-                    id=trip_db.id,
-                    ride_route_id=trip_db.ride_route_id,
-                    passenger_id=trip_db.passenger_id,
-                    pickup_request_location_name=trip_db.pickup_request_location_name,
-                    pickup_time=trip_db.pickup_time,
-                    is_approved=trip_db.is_approved
-                )
+                # 좌석이 없으면 승인되지 않습니다.
+                return Trip.model_validate(dict(row._mapping)) if row else None
+
+            # 없는 여정, 이미 승인된 여정, 또는 다른 요청이 승인 중인 여정
+            trip_db = self.session.get(TripDB, request_id)
+            self.session.commit()
+            if trip_db and trip_db.is_approved:
+                return Trip.model_validate(trip_db)
             return None
         except Exception as e:
             print(f"Error approving trip: {e}")
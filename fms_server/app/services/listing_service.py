@@ -0,0 +1,427 @@
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+from uuid import UUID
+
+import numpy as np
+from pydantic import TypeAdapter
+# pydantic은 Python 3.12 미만에서 typing.TypedDict를 지원하지 않습니다.
+from typing_extensions import TypedDict
+from sqlalchemy import cast, false, null, select, true, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 캐시된 TypeAdapter(pydantic-core)로 직렬화합니다.
+    orjson = None
+
+from config.database import may_read_replica
+from models.model import RouteDB, RouteTombstoneDB, TripDB
+from services.route_query import (
+    ROUTE_COLUMNS,
+    ROUTE_ENDPOINTS,
+    TRIP_COLUMNS,
+    TRIP_PASSENGER_SUMMARY_COLUMNS,
+    TRIP_ROUTE_SUMMARY_COLUMNS,
+    route_fuzzy_search,
+    route_nearby_condition,
+    route_search_conditions,
+    sync_conditions,
+    time_window_conditions,
+    trip_search_conditions,
+)
+from services.route_cache import route_cache, route_filter
+from utils.distance import haversine_m
+from utils.pagination import encode_cursor, decode_cursor, decode_sync_cursor, encode_sync_cursor
+
+
+class RouteRow(TypedDict):
+    id: UUID
+    driver_id: Optional[UUID]
+    car_plate_number: Optional[str]
+    departure_location_name: Optional[str]
+    departure_time: Optional[datetime]
+    destination_location_name: Optional[str]
+    departure_lat: Optional[float]
+    departure_lon: Optional[float]
+    destination_lat: Optional[float]
+    destination_lon: Optional[float]
+    seat_capacity: int
+
+
+class NearbyRouteRow(RouteRow):
+    distance_m: float
+
+
+class RoutePageRow(TypedDict):
+    items: List[RouteRow]
+    next_cursor: Optional[str]
+
+
+class TripRow(TypedDict):
+    id: UUID
+    ride_route_id: UUID
+    passenger_id: UUID
+    pickup_request_location_name: str
+    pickup_time: datetime
+    is_approved: bool
+    pickup_lat: Optional[float]
+    pickup_lon: Optional[float]
+
+
+class TripRouteSummaryRow(TypedDict):
+    id: UUID
+    driver_id: Optional[UUID]
+    car_plate_number: Optional[str]
+    departure_location_name: Optional[str]
+    departure_time: Optional[datetime]
+    destination_location_name: Optional[str]
+
+
+class TripPassengerSummaryRow(TypedDict):
+    id: UUID
+    name: Optional[str]
+    nickname: Optional[str]
+    contact_info: Optional[str]
+
+
+class TripDetailRow(TripRow):
+    route: Optional[TripRouteSummaryRow]
+    passenger: Optional[TripPassengerSummaryRow]
+
+
+class TripDetailPageRow(TypedDict):
+    items: List[TripDetailRow]
+    next_cursor: Optional[str]
+
+
+class RouteSyncPageRow(TypedDict):
+    items: List[RouteRow]
+    deleted_ids: List[UUID]
+    next_cursor: Optional[str]
+    has_more: bool
+
+
+class TripSyncPageRow(TypedDict):
+    items: List[TripRow]
+    next_cursor: Optional[str]
+    has_more: bool
+
+
+# TypeAdapter 생성은 스키마 컴파일 비용이 크므로 모듈 로드 시 한 번만 만듭니다.
+ROUTE_ROW_ADAPTER = TypeAdapter(RouteRow)
+ROUTE_PAGE_ADAPTER = TypeAdapter(RoutePageRow)
+NEARBY_ROUTES_ADAPTER = TypeAdapter(List[NearbyRouteRow])
+TRIP_ROWS_ADAPTER = TypeAdapter(List[TripRow])
+TRIP_DETAIL_PAGE_ADAPTER = TypeAdapter(TripDetailPageRow)
+ROUTE_SYNC_PAGE_ADAPTER = TypeAdapter(RouteSyncPageRow)
+TRIP_SYNC_PAGE_ADAPTER = TypeAdapter(TripSyncPageRow)
+
+# 조인한 요약 컬럼의 레이블 접두사 (여정 컬럼 이름과 겹치지 않도록 __ 사용)
+_ROUTE_PREFIX = "route__"
+_PASSENGER_PREFIX = "passenger__"
+
+
+def _summary(row, prefix: str, columns) -> Optional[dict]:
+    """조인 결과 행에서 접두사가 붙은 컬럼을 모아 요약 dict로 만듭니다. (조인 대상이 없으면 None)"""
+    if row[f"{prefix}id"] is None:
+        return None
+    return {column.key: row[f"{prefix}{column.key}"] for column in columns}
+
+
+def _orjson_default(value):
+    # asyncpg는 uuid.UUID의 하위 클래스를 반환하는데, orjson은 정확히 uuid.UUID인 값만 직렬화합니다.
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dump_json(adapter: TypeAdapter, value) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=_orjson_default)
+    return adapter.dump_json(value)
+
+
+class ListingService:
+    """
+    경로/여정 목록 조회 전용 읽기 경로.
+    ORM 엔티티 대신 필요한 컬럼만 SQLAlchemy Core로 조회하여 identity map 관리와
+    Pydantic 모델 생성을 건너뛰고, 조회 결과를 바로 JSON 바이트로 직렬화합니다.
+    """
+    def __init__(self, session: AsyncSession):
+        self.session: AsyncSession = session
+
+    async def route_page_json(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        departure_location_name: Optional[str] = None,
+        destination_location_name: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> bytes:
+        """
+        (departure_time, id) 키셋 페이지를 {"items": [...], "next_cursor": ...} JSON 바이트로 반환합니다.
+        출발 시간이 없는 경로는 시간 범위 조건이 없을 때 마지막에(NULLS LAST) id 순으로 포함됩니다.
+        잘못된 cursor는 ValueError를 발생시킵니다.
+        """
+        search_filter = route_filter(start_time, end_time, departure_location_name, destination_location_name)
+        cache_key = ("page", search_filter, cursor, limit)
+        cached = route_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        token = route_cache.begin_fill()
+
+        stmt = select(*ROUTE_COLUMNS).where(*route_search_conditions(*search_filter))
+        untimed = RouteDB.departure_time.is_(None)
+        cursor_time, cursor_id = decode_cursor(cursor) if cursor is not None else (None, None)
+
+        # 다음 페이지 존재 여부를 알기 위해 한 행을 더 조회합니다.
+        if cursor_time is not None:
+            # 행 값 비교는 NULL을 건너뛰므로, 시간 키셋 구간과 NULL 구간을 각각 인덱스 순서로 조회해 합칩니다.
+            timed = (
+                stmt.where(tuple_(RouteDB.departure_time, RouteDB.id) > tuple_(cursor_time, cursor_id))
+                .order_by(RouteDB.departure_time, RouteDB.id)
+                .limit(limit + 1)
+            )
+            nulls = stmt.where(untimed).order_by(RouteDB.id).limit(limit + 1)
+            page = union_all(timed.subquery().select(), nulls.subquery().select()).subquery()
+            stmt = select(page).order_by(page.c.departure_time.asc().nulls_last(), page.c.id).limit(limit + 1)
+        else:
+            if cursor_id is not None:
+                # 출발 시간이 있는 경로는 모두 지나왔으므로 NULL 구간만 id 순으로 이어서 조회합니다.
+                stmt = stmt.where(untimed, RouteDB.id > cursor_id)
+            stmt = stmt.order_by(RouteDB.departure_time.asc().nulls_last(), RouteDB.id).limit(limit + 1)
+
+        rows = (await self.session.execute(stmt)).mappings().all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["departure_time"], rows[-1]["id"])
+        body = dump_json(ROUTE_PAGE_ADAPTER, {"items": [dict(row) for row in rows], "next_cursor": next_cursor})
+        route_cache.set(cache_key, body, route_filter=search_filter, token=token, replica=may_read_replica(self.session))
+        return body
+
+    async def route_fuzzy_json(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        departure_location_name: Optional[str] = None,
+        destination_location_name: Optional[str] = None,
+        limit: int = 100,
+    ) -> bytes:
+        """
+        장소명 유사도(pg_trgm) 검색 결과를 유사도 높은 순으로 {"items": [...], "next_cursor": null} JSON 바이트로 반환합니다.
+        유사도 순 정렬은 키셋 페이지네이션을 지원하지 않으므로 상위 limit개만 반환합니다.
+        장소명이 하나도 없으면 ValueError를 발생시킵니다.
+        """
+        conditions, score = route_fuzzy_search(departure_location_name, destination_location_name)
+        if score is None:
+            raise ValueError("Fuzzy search requires a departure or destination location name")
+
+        # 유사 장소명은 어떤 값에도 걸릴 수 있으므로 시간 범위만으로 무효화 대상을 판단합니다.
+        search_filter = route_filter(start_time, end_time, departure_location_name, destination_location_name)
+        cache_key = ("fuzzy", search_filter, limit)
+        cached = route_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        token = route_cache.begin_fill()
+
+        stmt = (
+            select(*ROUTE_COLUMNS)
+            .where(*conditions, *time_window_conditions(start_time, end_time))
+            .order_by(score.desc(), RouteDB.departure_time, RouteDB.id)
+            .limit(limit)
+        )
+        rows = (await self.session.execute(stmt)).mappings().all()
+
+        body = dump_json(ROUTE_PAGE_ADAPTER, {"items": [dict(row) for row in rows], "next_cursor": None})
+        route_cache.set(cache_key, body, route_filter=route_filter(start_time, end_time), token=token, replica=may_read_replica(self.session))
+        return body
+
+    async def nearby_routes_json(
+        self,
+        lat: float,
+        lon: float,
+        radius_m: float,
+        endpoint: str = "departure",
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> bytes:
+        """
+        끝점(endpoint: departure / destination / any)이 (lat, lon)에서 radius_m 이내인 경로를
+        가까운 순으로 JSON 배열 바이트로 반환합니다.
+        geohash 셀 인덱스로 후보를 좁힌 뒤, 후보 전체의 거리를 NumPy로 한 번에 계산하여 거르고 정렬합니다.
+        """
+        stmt = select(*ROUTE_COLUMNS).where(
+            route_nearby_condition(lat, lon, radius_m, endpoint),
+            *time_window_conditions(start_time, end_time),
+        )
+        rows = (await self.session.execute(stmt)).mappings().all()
+        if not rows:
+            return dump_json(NEARBY_ROUTES_ADAPTER, [])
+
+        # 좌표가 없는 끝점(None)은 NaN이 되어 fmin에서 다른 끝점의 거리가 사용됩니다.
+        distances = None
+        for lat_column, lon_column, _ in ROUTE_ENDPOINTS[endpoint]:
+            lats = np.array([row[lat_column.key] for row in rows], dtype=float)
+            lons = np.array([row[lon_column.key] for row in rows], dtype=float)
+            endpoint_distances = haversine_m(lat, lon, lats, lons)
+            distances = endpoint_distances if distances is None else np.fmin(distances, endpoint_distances)
+
+        within = np.flatnonzero(distances <= radius_m)
+        nearest = within[np.argsort(distances[within], kind="stable")[:limit]]
+        return dump_json(
+            NEARBY_ROUTES_ADAPTER,
+            [{**rows[i], "distance_m": round(float(distances[i]), 1)} for i in nearest],
+        )
+
+    async def stream_routes_ndjson(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        departure_location_name: Optional[str] = None,
+        destination_location_name: Optional[str] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[bytes]:
+        """
+        검색 결과를 NDJSON(한 줄에 경로 하나) 바이트로 스트리밍합니다.
+        서버 사이드 커서(yield_per)로 batch_size 행씩 가져오므로 결과 크기와 무관하게 메모리 사용량이 일정합니다.
+        """
+        stmt = (
+            select(*ROUTE_COLUMNS)
+            .where(*route_search_conditions(*route_filter(start_time, end_time, departure_location_name, destination_location_name)))
+            .order_by(RouteDB.departure_time, RouteDB.id)
+            .execution_options(yield_per=batch_size)
+        )
+
+        result = await self.session.stream(stmt)
+        async for partition in result.mappings().partitions():
+            yield b"".join(dump_json(ROUTE_ROW_ADAPTER, dict(row)) + b"\n" for row in partition)
+
+    async def trips_json(
+        self,
+        ride_route_id: Optional[UUID] = None,
+        passenger_id: Optional[UUID] = None,
+        is_approved: Optional[bool] = None,
+    ) -> bytes:
+        """find_trips와 같은 조건의 여정 목록을 JSON 배열 바이트로 반환합니다."""
+        stmt = select(*TRIP_COLUMNS).where(*trip_search_conditions(ride_route_id, passenger_id, is_approved))
+        rows = (await self.session.execute(stmt)).mappings().all()
+        return dump_json(TRIP_ROWS_ADAPTER, [dict(row) for row in rows])
+
+    async def trip_detail_page_json(
+        self,
+        ride_route_id: Optional[UUID] = None,
+        passenger_id: Optional[UUID] = None,
+        is_approved: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> bytes:
+        """
+        경로/승객 요약을 포함한 여정의 (pickup_time, id) 키셋 페이지를 {"items": [...], "next_cursor": ...} JSON 바이트로 반환합니다.
+        여정/경로/승객을 한 번의 조인 쿼리로 조회하므로 페이지 크기와 무관하게 왕복 횟수가 1회입니다.
+        잘못된 cursor는 ValueError를 발생시킵니다.
+        """
+        stmt = (
+            select(
+                *TRIP_COLUMNS,
+                *(column.label(f"{_ROUTE_PREFIX}{column.key}") for column in TRIP_ROUTE_SUMMARY_COLUMNS),
+                *(column.label(f"{_PASSENGER_PREFIX}{column.key}") for column in TRIP_PASSENGER_SUMMARY_COLUMNS),
+            )
+            .select_from(TripDB)
+            # 외래 키 추가 전의 데이터에는 참조 대상이 없는 여정이 있을 수 있으므로 외부 조인합니다.
+            .outerjoin(TripDB.route)
+            .outerjoin(TripDB.passenger)
+            .where(
+                *trip_search_conditions(ride_route_id, passenger_id, is_approved),
+                TripDB.pickup_time.is_not(None),
+            )
+        )
+        if cursor is not None:
+            cursor_time, cursor_id = decode_cursor(cursor)
+            # 탑승 시간이 없는 여정은 페이지에 포함하지 않으므로 NULL 구간 커서는 받지 않습니다.
+            if cursor_time is None:
+                raise ValueError(f"Invalid cursor: {cursor}")
+            stmt = stmt.where(tuple_(TripDB.pickup_time, TripDB.id) > tuple_(cursor_time, cursor_id))
+        stmt = stmt.order_by(TripDB.pickup_time, TripDB.id).limit(limit + 1)
+
+        rows = (await self.session.execute(stmt)).mappings().all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["pickup_time"], rows[-1]["id"])
+        items = [
+            {
+                **{column.key: row[column.key] for column in TRIP_COLUMNS},
+                "route": _summary(row, _ROUTE_PREFIX, TRIP_ROUTE_SUMMARY_COLUMNS),
+                "passenger": _summary(row, _PASSENGER_PREFIX, TRIP_PASSENGER_SUMMARY_COLUMNS),
+            }
+            for row in rows
+        ]
+        return dump_json(TRIP_DETAIL_PAGE_ADAPTER, {"items": items, "next_cursor": next_cursor})
+
+    async def route_sync_json(self, since: Optional[str] = None, limit: int = 1000) -> bytes:
+        """
+        since 커서 이후에 생성/수정/삭제된 경로를 변경 순서((change_xid, id))대로 반환합니다.
+        {"items": [...], "deleted_ids": [...], "next_cursor": ..., "has_more": ...} JSON 바이트.
+        한 페이지 안에서는 deleted_ids를 먼저, items를 나중에 적용하면 됩니다. (삭제된 경로는 items에 나올 수 없음)
+        잘못된 since는 ValueError를 발생시킵니다.
+        """
+        position = decode_sync_cursor(since) if since is not None else None
+        upserts = (
+            select(RouteDB.change_xid, false().label("deleted"), *ROUTE_COLUMNS)
+            .where(*sync_conditions(RouteDB, position))
+            .order_by(RouteDB.change_xid, RouteDB.id)
+            .limit(limit + 1)
+        )
+        tombstones = (
+            select(
+                RouteTombstoneDB.change_xid,
+                true().label("deleted"),
+                RouteTombstoneDB.id,
+                *(cast(null(), column.type).label(column.key) for column in ROUTE_COLUMNS[1:]),
+            )
+            .where(*sync_conditions(RouteTombstoneDB, position))
+            .order_by(RouteTombstoneDB.change_xid, RouteTombstoneDB.id)
+            .limit(limit + 1)
+        )
+        # 두 키셋 조회를 한 문장으로 실행하여 같은 스냅샷(같은 SYNC_HORIZON)을 사용합니다.
+        changes = union_all(upserts.subquery().select(), tombstones.subquery().select()).subquery()
+        stmt = select(changes).order_by(changes.c.change_xid, changes.c.id).limit(limit + 1)
+
+        rows = (await self.session.execute(stmt)).mappings().all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        body = {
+            "items": [{column.key: row[column.key] for column in ROUTE_COLUMNS} for row in rows if not row["deleted"]],
+            "deleted_ids": [row["id"] for row in rows if row["deleted"]],
+            "next_cursor": encode_sync_cursor(rows[-1]["change_xid"], rows[-1]["id"]) if rows else since,
+            "has_more": has_more,
+        }
+        return dump_json(ROUTE_SYNC_PAGE_ADAPTER, body)
+
+    async def trip_sync_json(self, since: Optional[str] = None, limit: int = 1000) -> bytes:
+        """
+        since 커서 이후에 생성/수정(승인, 경로 배정)된 여정을 변경 순서대로
+        {"items": [...], "next_cursor": ..., "has_more": ...} JSON 바이트로 반환합니다.
+        잘못된 since는 ValueError를 발생시킵니다.
+        """
+        position = decode_sync_cursor(since) if since is not None else None
+        stmt = (
+            select(TripDB.change_xid, *TRIP_COLUMNS)
+            .where(*sync_conditions(TripDB, position))
+            .order_by(TripDB.change_xid, TripDB.id)
+            .limit(limit + 1)
+        )
+        rows = (await self.session.execute(stmt)).mappings().all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        body = {
+            "items": [{column.key: row[column.key] for column in TRIP_COLUMNS} for row in rows],
+            "next_cursor": encode_sync_cursor(rows[-1]["change_xid"], rows[-1]["id"]) if rows else since,
+            "has_more": has_more,
+        }
+        return dump_json(TRIP_SYNC_PAGE_ADAPTER, body)
@@ -0,0 +1,282 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from controllers.dto.request_dto import RequestRunMatching
+from domains.matching import MatchingResult, TripAssignment
+from models.model import RouteDB, TripDB
+from services.change_feed import notify_changes, trip_change
+from services.seat_reservation import RESERVE_AND_APPROVE, lock_pending_trips
+from utils.distance import haversine_m
+from utils.location import normalize_location_name
+
+
+class MatchingParams(NamedTuple):
+    time_window_minutes: float = 30.0
+    max_distance_m: float = 2000.0
+    # 비용 가중치 (각 항은 0~1로 정규화됨)
+    time_weight: float = 1.0
+    distance_weight: float = 1.0
+    seat_weight: float = 0.2
+    # 여정이 처음 요청한 경로에 주는 비용 감소분
+    requested_route_bonus: float = 0.5
+    # 라운드마다 여정별로 고려하는 가장 싼 경로 수
+    top_k: int = 8
+    # 비용 행렬을 이 행(여정) 수 단위로 나누어 계산하여 메모리 사용량을 제한합니다.
+    chunk_size: int = 1024
+
+
+class TripCandidates(NamedTuple):
+    """승인 대기 여정 (길이 n 배열)"""
+    pickup_minutes: np.ndarray
+    lat: np.ndarray
+    lon: np.ndarray
+    # 정규화된 승차 장소명 코드 (없으면 -1)
+    name_code: np.ndarray
+    # 요청한 경로의 RouteCandidates 인덱스 (범위 밖이면 -1)
+    requested_route: np.ndarray
+
+
+class RouteCandidates(NamedTuple):
+    """배정 가능한 경로 (길이 m 배열)"""
+    departure_minutes: np.ndarray
+    lat: np.ndarray
+    lon: np.ndarray
+    # 정규화된 출발지명 코드 (없으면 -2, 여정의 -1과 일치하지 않도록)
+    name_code: np.ndarray
+    capacity: np.ndarray
+    remaining: np.ndarray
+
+
+def to_minutes(values: List[datetime]) -> np.ndarray:
+    return np.array(values, dtype="datetime64[s]").astype(np.float64) / 60
+
+
+def cost_matrix(
+    trips: TripCandidates,
+    routes: RouteCandidates,
+    trip_rows: np.ndarray,
+    route_cols: np.ndarray,
+    remaining: np.ndarray,
+    params: MatchingParams,
+) -> np.ndarray:
+    """
+    (len(trip_rows), len(route_cols)) 비용 행렬. 배정할 수 없는 쌍은 inf입니다.
+    - 시간: |승차 시간 - 출발 시간| / 허용 차이 (허용 차이 초과는 불가)
+    - 위치: 승차 위치~출발지 거리 / 허용 거리 (좌표가 없으면 장소명이 같을 때만 0, 아니면 불가)
+    - 좌석: 남은 좌석이 적을수록 커지는 항 (좌석이 없는 경로는 호출 측에서 제외)
+    - 요청한 경로이면 requested_route_bonus만큼 감소
+    """
+    slack = np.abs(trips.pickup_minutes[trip_rows, None] - routes.departure_minutes[None, route_cols])
+    cost = params.time_weight * (slack / params.time_window_minutes)
+    cost[slack > params.time_window_minutes] = np.inf
+
+    distance = haversine_m(
+        trips.lat[trip_rows, None], trips.lon[trip_rows, None],
+        routes.lat[None, route_cols], routes.lon[None, route_cols],
+    )
+    same_name = trips.name_code[trip_rows, None] == routes.name_code[None, route_cols]
+    location = np.where(np.isnan(distance), np.where(same_name, 0.0, np.inf), distance / params.max_distance_m)
+    location[distance > params.max_distance_m] = np.inf
+    cost += params.distance_weight * location
+
+    fill = 1.0 - remaining[route_cols] / np.maximum(routes.capacity[route_cols], 1)
+    cost += params.seat_weight * fill[None, :]
+    cost -= params.requested_route_bonus * (trips.requested_route[trip_rows, None] == route_cols[None, :])
+    return cost
+
+
+def solve_matching(
+    trips: TripCandidates, routes: RouteCandidates, params: MatchingParams = MatchingParams()
+) -> List[Tuple[int, int, float]]:
+    """
+    좌석 수 제약이 있는 여정→경로 배정을 구하고 (여정 인덱스, 경로 인덱스, 비용) 목록을 반환합니다.
+
+    라운드마다 배정되지 않은 여정 × 좌석이 남은 경로의 비용 행렬을 벡터 연산으로 계산하고,
+    여정별 가장 싼 top_k 후보를 비용 순으로 한 번 훑으며 탐욕적으로 배정합니다.
+    후보가 모두 다른 여정에 좌석을 빼앗긴 여정만 다음 라운드에서 남은 경로로 다시 시도합니다.
+    """
+    trip_count = len(trips.pickup_minutes)
+    remaining = routes.remaining.astype(np.int64).copy()
+    assigned_route = np.full(trip_count, -1, dtype=np.int64)
+    assigned_cost = np.zeros(trip_count, dtype=np.float64)
+    pending = np.arange(trip_count)
+
+    while pending.size:
+        open_routes = np.flatnonzero(remaining > 0)
+        if not open_routes.size:
+            break
+        k = min(params.top_k, open_routes.size)
+
+        pair_trips, pair_routes, pair_costs, retry = [], [], [], []
+        for start in range(0, pending.size, params.chunk_size):
+            rows = pending[start:start + params.chunk_size]
+            cost = cost_matrix(trips, routes, rows, open_routes, remaining, params)
+            best = np.argpartition(cost, k - 1, axis=1)[:, :k]
+            best_cost = np.take_along_axis(cost, best, axis=1)
+            feasible = np.isfinite(best_cost)
+
+            pair_trips.append(np.broadcast_to(rows[:, None], best.shape)[feasible])
+            pair_routes.append(open_routes[best[feasible]])
+            pair_costs.append(best_cost[feasible])
+            # 후보 k개가 모두 가능했던 여정만 k개 밖에 다른 선택지가 있을 수 있습니다.
+            retry.append(rows[feasible.all(axis=1)])
+
+        pair_trips = np.concatenate(pair_trips)
+        pair_routes = np.concatenate(pair_routes)
+        pair_costs = np.concatenate(pair_costs)
+        order = np.argsort(pair_costs, kind="stable")
+
+        progress = False
+        for trip, route, cost in zip(pair_trips[order].tolist(), pair_routes[order].tolist(), pair_costs[order].tolist()):
+            if assigned_route[trip] < 0 and remaining[route] > 0:
+                assigned_route[trip] = route
+                assigned_cost[trip] = cost
+                remaining[route] -= 1
+                progress = True
+        if not progress:
+            break
+
+        retry = np.concatenate(retry)
+        pending = retry[assigned_route[retry] < 0]
+
+    matched = np.flatnonzero(assigned_route >= 0)
+    return list(zip(matched.tolist(), assigned_route[matched].tolist(), assigned_cost[matched].tolist()))
+
+
+class MatchingService:
+    """
+    승인 대기 여정을 시간 범위 안의 경로에 한 번에 배정하는 매칭 엔진.
+    에이전트가 경로를 검색하고 첫 번째 경로를 고르는 방식 대신, 전체 여정 × 경로 비용을 함께 고려합니다.
+    """
+    def __init__(self, session: AsyncSession):
+        self.session: AsyncSession = session
+
+    async def _load(self, request: RequestRunMatching):
+        window = timedelta(minutes=request.time_window_minutes)
+        trip_rows = (await self.session.execute(
+            select(
+                TripDB.id,
+                TripDB.ride_route_id,
+                TripDB.pickup_time,
+                TripDB.pickup_lat,
+                TripDB.pickup_lon,
+                TripDB.pickup_request_location_name,
+            )
+            .where(
+                TripDB.is_approved.is_(False),
+                TripDB.pickup_time >= request.start_time,
+                TripDB.pickup_time <= request.end_time,
+            )
+            .order_by(TripDB.pickup_time, TripDB.id)
+        )).all()
+
+        route_rows = (await self.session.execute(
+            select(
+                RouteDB.id,
+                RouteDB.departure_time,
+                RouteDB.departure_lat,
+                RouteDB.departure_lon,
+                RouteDB.departure_location_norm,
+                RouteDB.seat_capacity,
+                RouteDB.seats_reserved,
+            )
+            .where(
+                RouteDB.departure_time >= request.start_time - window,
+                RouteDB.departure_time <= request.end_time + window,
+                RouteDB.seats_reserved < RouteDB.seat_capacity,
+            )
+            .order_by(RouteDB.departure_time, RouteDB.id)
+        )).all()
+        return trip_rows, route_rows
+
+    @staticmethod
+    def _candidates(trip_rows, route_rows) -> Tuple[TripCandidates, RouteCandidates]:
+        name_codes = {}
+        route_index = {row.id: i for i, row in enumerate(route_rows)}
+
+        def code(name: Optional[str], missing: int) -> int:
+            if name is None:
+                return missing
+            return name_codes.setdefault(name, len(name_codes))
+
+        capacity = np.array([row.seat_capacity for row in route_rows], dtype=np.int64)
+        routes = RouteCandidates(
+            departure_minutes=to_minutes([row.departure_time for row in route_rows]),
+            lat=np.array([row.departure_lat for row in route_rows], dtype=np.float64),
+            lon=np.array([row.departure_lon for row in route_rows], dtype=np.float64),
+            name_code=np.array([code(row.departure_location_norm, -2) for row in route_rows], dtype=np.int64),
+            capacity=capacity,
+            remaining=np.maximum(capacity - np.array([row.seats_reserved for row in route_rows], dtype=np.int64), 0),
+        )
+        trips = TripCandidates(
+            pickup_minutes=to_minutes([row.pickup_time for row in trip_rows]),
+            lat=np.array([row.pickup_lat for row in trip_rows], dtype=np.float64),
+            lon=np.array([row.pickup_lon for row in trip_rows], dtype=np.float64),
+            name_code=np.array(
+                [code(normalize_location_name(row.pickup_request_location_name), -1) for row in trip_rows], dtype=np.int64
+            ),
+            requested_route=np.array([route_index.get(row.ride_route_id, -1) for row in trip_rows], dtype=np.int64),
+        )
+        return trips, routes
+
+    async def run(self, request: RequestRunMatching) -> Optional[MatchingResult]:
+        """배정 결과를 반환하고, request.apply이면 배정대로 여정을 갱신/승인합니다. DB 오류 시 None을 반환합니다."""
+        started = time.perf_counter()
+        try:
+            trip_rows, route_rows = await self._load(request)
+            result = MatchingResult(trip_count=len(trip_rows), route_count=len(route_rows))
+            if not trip_rows or not route_rows:
+                result.unmatched_trip_ids = [row.id for row in trip_rows]
+                result.elapsed_ms = (time.perf_counter() - started) * 1000
+                return result
+
+            trips, routes = self._candidates(trip_rows, route_rows)
+            params = MatchingParams(
+                time_window_minutes=request.time_window_minutes,
+                max_distance_m=request.max_distance_m,
+            )
+            # CPU 연산이므로 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+            pairs = await asyncio.to_thread(solve_matching, trips, routes, params)
+
+            result.assignments = [
+                TripAssignment(
+                    trip_id=trip_rows[trip].id,
+                    route_id=route_rows[route].id,
+                    requested_route_id=trip_rows[trip].ride_route_id,
+                    cost=round(cost, 4),
+                )
+                for trip, route, cost in pairs
+            ]
+            matched = {trip for trip, _, _ in pairs}
+            result.unmatched_trip_ids = [row.id for i, row in enumerate(trip_rows) if i not in matched]
+
+            if request.apply and result.assignments:
+                # 승인과 같은 좌석 예약 경로를 사용하므로, 조회 이후 다른 요청이 승인한 여정이나
+                # 그 사이 좌석이 찬 경로의 여정은 배정되지 않고 배정 결과에서 unmatched_trip_ids로 옮겨집니다.
+                route_by_trip = {assignment.trip_id: assignment.route_id for assignment in result.assignments}
+                locked = (await self.session.execute(lock_pending_trips(list(route_by_trip)))).all()
+                applied = []
+                if locked:
+                    applied = (await self.session.execute(
+                        RESERVE_AND_APPROVE,
+                        {"trip_ids": [row.id for row in locked], "route_ids": [route_by_trip[row.id] for row in locked]},
+                    )).all()
+                    await notify_changes(self.session, [trip_change("approved", row) for row in applied])
+                await self.session.commit()
+                applied_ids = {row.id for row in applied}
+                result.unmatched_trip_ids += [a.trip_id for a in result.assignments if a.trip_id not in applied_ids]
+                result.assignments = [a for a in result.assignments if a.trip_id in applied_ids]
+                result.applied = True
+
+            result.elapsed_ms = (time.perf_counter() - started) * 1000
+            return result
+        except Exception as e:
+            print(f"Error running matching: {e}")
+            await self.session.rollback()
+            return None
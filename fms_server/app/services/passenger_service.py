@@ -4,13 +4,13 @@ from datetime import datetime
 from typing import Optional, List
 from uuid import UUID, uuid4
 
-from passlib.hash import pbkdf2_sha256
-
 from domains.passenger import Passenger, ResponsePassenger
 from domains.route import Route
 from domains.trip import Trip
 from controllers.dto.request_dto import RequestCreatePassenger
 from models.model import PassengerDB, RouteDB, TripDB
+from services.profile_cache import profile_cache
+from utils.password import hash_password
 
 class PassengerService:
     def __init__(self, session: Session):
@@ -18,7 +18,7 @@ class PassengerService:
 
     def create_passenger(self, passenger: Passenger) -> Passenger:
         try:
-            hashed_password = pbkdf2_sha256.hash(passenger.password)
+            hashed_password = hash_password(passenger.password)
             passenger_db = PassengerDB(
                 id = uuid4(),
                 password = hashed_password,
@@ -30,6 +30,7 @@ class PassengerService:
             self.session.add(passenger_db)
             self.session.commit()
             self.session.refresh(passenger_db)
+            profile_cache.invalidate(passenger_db.nickname)
             return Passenger.model_validate(passenger_db)
         except Exception as e:
             print(f"Error creating passenger: {e}")
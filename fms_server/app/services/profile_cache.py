@@ -0,0 +1,89 @@
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class PassengerProfile(NamedTuple):
+    """직렬화가 끝난 /my-info 응답 본문과 그 ETag"""
+    body: bytes
+    etag: str
+
+    @classmethod
+    def of(cls, body: bytes) -> "PassengerProfile":
+        # 강한 ETag: 본문 바이트가 같을 때만 같은 값
+        return cls(body, f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(쉼표로 구분된 목록 또는 *)가 etag와 일치하는지. (RFC 9110의 약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+class PassengerProfileCache:
+    """
+    승객 닉네임(토큰의 sub)별 /my-info 응답 캐시. 크기 제한(LRU) + TTL.
+    승객 정보를 쓰는 서비스 메서드가 커밋 후 invalidate(nickname)을 호출합니다.
+    프로세스(워커)별 캐시이므로 다른 워커의 쓰기는 TTL이 지나야 반영됩니다.
+    """
+    def __init__(self, maxsize: int = 10000, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def get(self, nickname: str) -> Optional[PassengerProfile]:
+        entry = self._entries.get(nickname)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[nickname]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(nickname)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, nickname: str, profile: PassengerProfile):
+        if self.maxsize <= 0:
+            return
+        self._entries[nickname] = (time.monotonic() + self.ttl, profile)
+        self._entries.move_to_end(nickname)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, nickname: Optional[str]):
+        if nickname is not None and self._entries.pop(nickname, None) is not None:
+            self.invalidations += 1
+
+    def clear(self):
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+        }
+
+
+profile_cache = PassengerProfileCache(
+    maxsize=int(os.environ.get("PROFILE_CACHE_MAXSIZE", "10000")),
+    ttl=float(os.environ.get("PROFILE_CACHE_TTL_SECONDS", "60")),
+)
@@ -0,0 +1,216 @@
+import os
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from utils.location import normalize_location_name
+
+
+class RouteFilter(NamedTuple):
+    """캐시된 검색 결과가 어떤 경로들을 포함할 수 있는지를 나타내는 검색 조건"""
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    departure_location_name: Optional[str] = None
+    destination_location_name: Optional[str] = None
+
+    def matches(
+        self,
+        departure_time: Optional[datetime],
+        departure_location_name: Optional[str],
+        destination_location_name: Optional[str],
+    ) -> bool:
+        """이 조건으로 검색했을 때 주어진 경로가 결과에 포함되는지 여부"""
+        if self.departure_location_name is not None and self.departure_location_name != departure_location_name:
+            return False
+        if self.destination_location_name is not None and self.destination_location_name != destination_location_name:
+            return False
+        if self.start_time is None and self.end_time is None:
+            return True
+        if departure_time is None:
+            return False
+        try:
+            if self.start_time is not None and departure_time < self.start_time:
+                return False
+            if self.end_time is not None and departure_time > self.end_time:
+                return False
+        except TypeError:
+            # naive/aware datetime 비교가 불가능하면 안전하게 겹치는 것으로 봅니다.
+            return True
+        return True
+
+
+def route_filter(
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    departure_location_name: Optional[str] = None,
+    destination_location_name: Optional[str] = None,
+) -> RouteFilter:
+    """검색 조건을 캐시 키로 쓸 수 있도록 장소명을 정규화합니다. (route_search_conditions와 같은 규칙)"""
+    return RouteFilter(
+        start_time,
+        end_time,
+        normalize_location_name(departure_location_name),
+        normalize_location_name(destination_location_name),
+    )
+
+
+class RouteSnapshot(NamedTuple):
+    """쓰기 전/후의 경로 값 (무효화 판단용, 장소명은 정규화된 값)"""
+    departure_time: Optional[datetime]
+    departure_location_name: Optional[str]
+    destination_location_name: Optional[str]
+
+    @classmethod
+    def of(cls, route) -> "RouteSnapshot":
+        return cls(
+            route.departure_time,
+            normalize_location_name(route.departure_location_name),
+            normalize_location_name(route.destination_location_name),
+        )
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    value: Any
+    route_filter: Optional[RouteFilter]
+    route_id: Optional[UUID]
+
+
+class _Invalidation(NamedTuple):
+    """최근 무효화 기록 (snapshots가 None이면 전체 비우기)"""
+    generation: int
+    at: float
+    route_id: Optional[UUID]
+    snapshots: Optional[Tuple[RouteSnapshot, ...]]
+
+    def covers(self, route_filter: Optional[RouteFilter], route_id: Optional[UUID]) -> bool:
+        if self.snapshots is None:
+            return True
+        if self.route_id is not None and route_id == self.route_id:
+            return True
+        return route_filter is not None and any(route_filter.matches(*snapshot) for snapshot in self.snapshots)
+
+
+class FillToken(NamedTuple):
+    """조회 시작 시점의 캐시 세대 (RouteSearchCache.begin_fill)"""
+    generation: int
+    started: float
+
+
+class RouteSearchCache:
+    """
+    경로 검색/조회 결과를 위한 크기 제한(LRU) + TTL 캐시.
+    경로가 생성/수정/삭제되면 그 경로가 결과에 포함될 수 있는 항목(검색 조건이 겹치는 항목)과
+    해당 경로 ID의 단건 조회 항목만 무효화합니다.
+    프로세스(워커)별 캐시이므로 다른 워커의 쓰기는 TTL이 지나야 반영됩니다.
+
+    조회가 시작된 뒤 무효화가 일어나면 그 조회 결과는 무효화 전의 값일 수 있으므로,
+    조회 전에 begin_fill()로 받은 토큰을 set()에 넘기면 그 사이에 겹치는 무효화가 있었던 결과는 저장하지 않습니다.
+    복제본에서 읽은 결과(replica=True)는 조회 시작 전 replica_lag 초 안의 겹치는 무효화도 반영되지 않았다고 보고 저장하지 않습니다.
+    """
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0, replica_lag: float = 5.0, history: int = 256):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.replica_lag = replica_lag
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._generation = 0
+        self._recent: "deque[_Invalidation]" = deque(maxlen=history)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self.stale_fills = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def begin_fill(self) -> FillToken:
+        """조회 전에 호출해 set()에 넘길 토큰을 받습니다."""
+        return FillToken(self._generation, time.monotonic())
+
+    def _is_stale(self, token: FillToken, route_filter: Optional[RouteFilter], route_id: Optional[UUID], replica: bool) -> bool:
+        since = token.started - self.replica_lag if replica else float("inf")
+        if len(self._recent) == self._recent.maxlen:
+            # 기록이 밀려난 구간은 겹치는 무효화가 있었다고 봅니다.
+            oldest = self._recent[0]
+            if oldest.generation > token.generation + 1 or oldest.at > since:
+                return True
+        return any(
+            (invalidation.generation > token.generation or invalidation.at > since)
+            and invalidation.covers(route_filter, route_id)
+            for invalidation in self._recent
+        )
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        route_filter: Optional[RouteFilter] = None,
+        route_id: Optional[UUID] = None,
+        token: Optional[FillToken] = None,
+        replica: bool = False,
+    ):
+        if self.maxsize <= 0:
+            return
+        if token is not None and self._is_stale(token, route_filter, route_id, replica):
+            self.stale_fills += 1
+            return
+        self._entries[key] = _Entry(time.monotonic() + self.ttl, value, route_filter, route_id)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _record(self, route_id: Optional[UUID], snapshots: Optional[Tuple[RouteSnapshot, ...]]) -> _Invalidation:
+        self._generation += 1
+        invalidation = _Invalidation(self._generation, time.monotonic(), route_id, snapshots)
+        self._recent.append(invalidation)
+        return invalidation
+
+    def invalidate_route(self, route_id: Optional[UUID], *snapshots: Optional[RouteSnapshot]):
+        """경로 하나의 변경 전/후 값과 겹치는 항목을 무효화합니다."""
+        invalidation = self._record(route_id, tuple(snapshot for snapshot in snapshots if snapshot is not None))
+        stale = [
+            key for key, entry in self._entries.items()
+            if invalidation.covers(entry.route_filter, entry.route_id)
+        ]
+        for key in stale:
+            del self._entries[key]
+        self.invalidations += len(stale)
+
+    def clear(self):
+        self._record(None, None)
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+            "stale_fills": self.stale_fills,
+        }
+
+
+route_cache = RouteSearchCache(
+    maxsize=int(os.environ.get("ROUTE_CACHE_MAXSIZE", "1024")),
+    ttl=float(os.environ.get("ROUTE_CACHE_TTL_SECONDS", "30")),
+    # 복제본의 최대 복제 지연으로 가정하는 시간(초)
+    replica_lag=float(os.environ.get("ROUTE_CACHE_REPLICA_LAG_SECONDS", "5")),
+)
@@ -0,0 +1,160 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, func, literal_column, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+from models.model import CURRENT_XACT_ID, PassengerDB, RouteDB, RouteTombstoneDB, TripDB
+from utils.geohash import covering_cells
+from utils.location import normalize_location_name
+
+# 응답에 필요한 컬럼만 조회하기 위한 컬럼 목록 (Route / Trip 도메인 필드와 동일)
+ROUTE_COLUMNS = (
+    RouteDB.id,
+    RouteDB.driver_id,
+    RouteDB.car_plate_number,
+    RouteDB.departure_location_name,
+    RouteDB.departure_time,
+    RouteDB.destination_location_name,
+    RouteDB.departure_lat,
+    RouteDB.departure_lon,
+    RouteDB.destination_lat,
+    RouteDB.destination_lon,
+    RouteDB.seat_capacity,
+)
+
+TRIP_COLUMNS = (
+    TripDB.id,
+    TripDB.ride_route_id,
+    TripDB.passenger_id,
+    TripDB.pickup_request_location_name,
+    TripDB.pickup_time,
+    TripDB.is_approved,
+    TripDB.pickup_lat,
+    TripDB.pickup_lon,
+)
+
+# 여정 목록에 포함하는 경로/승객 요약 컬럼 (ListingService.trip_detail_page_json)
+TRIP_ROUTE_SUMMARY_COLUMNS = (
+    RouteDB.id,
+    RouteDB.driver_id,
+    RouteDB.car_plate_number,
+    RouteDB.departure_location_name,
+    RouteDB.departure_time,
+    RouteDB.destination_location_name,
+)
+
+TRIP_PASSENGER_SUMMARY_COLUMNS = (
+    PassengerDB.id,
+    PassengerDB.name,
+    PassengerDB.nickname,
+    PassengerDB.contact_info,
+)
+
+
+def route_search_conditions(
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    departure_location_name: Optional[str] = None,
+    destination_location_name: Optional[str] = None,
+) -> List:
+    """
+    경로 검색 필터를 WHERE 조건 목록으로 변환합니다.
+    장소명은 정규화한 값끼리 비교하므로 "서울역"과 "서울 역 1번 출구"가 같은 장소로 검색됩니다.
+    """
+    conditions = time_window_conditions(start_time, end_time)
+    if departure_location_name is not None:
+        conditions.append(RouteDB.departure_location_norm == normalize_location_name(departure_location_name))
+    if destination_location_name is not None:
+        conditions.append(RouteDB.destination_location_norm == normalize_location_name(destination_location_name))
+    return conditions
+
+
+def time_window_conditions(start_time: Optional[datetime] = None, end_time: Optional[datetime] = None) -> List:
+    conditions = []
+    if start_time is not None:
+        conditions.append(RouteDB.departure_time >= start_time)
+    if end_time is not None:
+        conditions.append(RouteDB.departure_time <= end_time)
+    return conditions
+
+
+def route_fuzzy_search(
+    departure_location_name: Optional[str] = None,
+    destination_location_name: Optional[str] = None,
+):
+    """
+    pg_trgm 유사도 검색용 (WHERE 조건 목록, 정렬용 유사도 식)을 반환합니다.
+    % 연산자는 GIN(gin_trgm_ops) 인덱스를 사용하며 pg_trgm.similarity_threshold(기본 0.3) 이상만 통과시킵니다.
+    """
+    conditions = []
+    scores = []
+    for column, name in (
+        (RouteDB.departure_location_norm, departure_location_name),
+        (RouteDB.destination_location_norm, destination_location_name),
+    ):
+        if name is None:
+            continue
+        normalized = normalize_location_name(name)
+        conditions.append(column.op("%")(normalized))
+        scores.append(func.similarity(column, normalized))
+    score = sum(scores[1:], scores[0]) if scores else None
+    return conditions, score
+
+
+def cell_prefix_condition(column, prefixes: List[str]):
+    """geohash 셀 컬럼이 접두사 중 하나로 시작하는 조건 ("C" collation 범위 비교라 btree 인덱스를 사용합니다)"""
+    # geohash 문자는 모두 "~"보다 작으므로 [prefix, prefix + "~")가 접두사 범위입니다.
+    return or_(*(and_(column >= prefix, column < prefix + "~") for prefix in prefixes))
+
+
+# 주변 검색 대상 끝점: 이름 → ((위도 컬럼, 경도 컬럼, 셀 컬럼), ...)
+ROUTE_ENDPOINTS = {
+    "departure": ((RouteDB.departure_lat, RouteDB.departure_lon, RouteDB.departure_cell),),
+    "destination": ((RouteDB.destination_lat, RouteDB.destination_lon, RouteDB.destination_cell),),
+}
+ROUTE_ENDPOINTS["any"] = ROUTE_ENDPOINTS["departure"] + ROUTE_ENDPOINTS["destination"]
+
+
+def route_nearby_condition(lat: float, lon: float, radius_m: float, endpoint: str = "departure"):
+    """끝점이 반경을 덮는 geohash 셀 안에 있는 경로 후보 조건 (정확한 거리 판정은 호출 측에서 합니다)"""
+    prefixes = covering_cells(lat, lon, radius_m)
+    return or_(*(cell_prefix_condition(cell, prefixes) for _, _, cell in ROUTE_ENDPOINTS[endpoint]))
+
+
+def trip_search_conditions(
+    ride_route_id=None,
+    passenger_id=None,
+    is_approved: Optional[bool] = None,
+) -> List:
+    """여정 검색 필터를 WHERE 조건 목록으로 변환합니다."""
+    conditions = []
+    if ride_route_id:
+        conditions.append(TripDB.ride_route_id == ride_route_id)
+    if passenger_id:
+        conditions.append(TripDB.passenger_id == passenger_id)
+    if is_approved is not None:
+        conditions.append(TripDB.is_approved == is_approved)
+    return conditions
+
+
+# 진행 중인 트랜잭션 중 가장 오래된 것의 ID. change_xid가 이보다 작은 행은 커밋이 끝난 트랜잭션이 쓴 것이므로,
+# 이 경계 아래만 반환하면 늦게 커밋되는 트랜잭션의 행이 이미 지나간 커서 뒤에 끼어드는 일이 없습니다.
+SYNC_HORIZON = select(literal_column("(pg_snapshot_xmin(pg_current_snapshot())::text)::bigint")).scalar_subquery()
+
+
+def sync_conditions(model, since: Optional[Tuple[int, UUID]] = None) -> List:
+    """동기화 API의 (change_xid, id) 키셋 조건 (since 이후, SYNC_HORIZON 미만)"""
+    conditions = [model.change_xid < SYNC_HORIZON]
+    if since is not None:
+        conditions.append(tuple_(model.change_xid, model.id) > tuple_(*since))
+    return conditions
+
+
+def tombstone_route(route_id: UUID):
+    """경로 삭제 기록을 남기는 INSERT. 같은 id가 다시 삭제되면 변경 순서와 삭제 시각을 갱신합니다."""
+    return insert(RouteTombstoneDB).values(id=route_id).on_conflict_do_update(
+        index_elements=[RouteTombstoneDB.id],
+        set_={"change_xid": CURRENT_XACT_ID, "deleted_at": func.now()},
+    )
@@ -0,0 +1,68 @@
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import any_, bindparam, select, text
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from models.model import RouteDB, TripDB
+from services.route_query import TRIP_COLUMNS
+
+# 좌석 예약 후 승인하는 흐름 (한 트랜잭션)
+# 1. lock_pending_trips: 승인 대기 여정을 FOR UPDATE SKIP LOCKED로 잠급니다.
+#    다른 승인 요청이 잡고 있는 여정은 기다리지 않고 건너뛰므로 같은 여정을 두고 대기열이 생기지 않습니다.
+# 2. RESERVE_AND_APPROVE: 경로별로 남은 좌석만큼만 seats_reserved를 올리고, 그만큼의 여정만 승인합니다.
+#    경로 행 잠금은 이 한 문장과 커밋 사이에만 유지되며, 동시에 같은 경로를 예약하면
+#    뒤의 요청이 갱신된 seats_reserved로 남은 좌석을 다시 계산하므로 초과 예약이 생기지 않습니다.
+#    (CHECK 제약 ck_route_seats_reserved가 최종 보장)
+
+
+def lock_pending_trips(trip_ids: List[UUID]):
+    """승인 대기 여정을 요청 순서(created_at)대로 잠그는 SELECT. 이미 잠긴 여정은 건너뜁니다."""
+    return (
+        select(TripDB.id, TripDB.ride_route_id)
+        .where(
+            TripDB.id == any_(bindparam("trip_ids", list(trip_ids), type_=ARRAY(TripDB.id.type))),
+            TripDB.is_approved.is_(False),
+        )
+        .order_by(TripDB.created_at, TripDB.id)
+        .with_for_update(skip_locked=True)
+    )
+
+
+# :trip_ids[i]를 :route_ids[i] 경로에 배정/승인합니다. 경로별로 앞쪽 여정부터 남은 좌석만큼 승인됩니다.
+# 여러 경로를 잠글 때는 id 순서로 잠가 교착 상태를 피합니다.
+RESERVE_AND_APPROVE = text(
+    f"""
+    WITH requested AS (
+        SELECT trip_id, route_id, position
+        FROM unnest(CAST(:trip_ids AS uuid[]), CAST(:route_ids AS uuid[]))
+             WITH ORDINALITY AS r(trip_id, route_id, position)
+    ), demand AS (
+        SELECT route_id, count(*) AS seats FROM requested GROUP BY route_id
+    ), granted AS (
+        SELECT route.id, LEAST(demand.seats, route.seat_capacity - route.seats_reserved) AS seats
+        FROM route JOIN demand ON demand.route_id = route.id
+        WHERE route.seats_reserved < route.seat_capacity
+        ORDER BY route.id
+        FOR UPDATE OF route
+    ), reserved AS (
+        UPDATE route SET seats_reserved = route.seats_reserved + granted.seats
+        FROM granted WHERE route.id = granted.id
+    ), approved AS (
+        SELECT ranked.trip_id, ranked.route_id
+        FROM (
+            SELECT trip_id, route_id, row_number() OVER (PARTITION BY route_id ORDER BY position) AS rank
+            FROM requested
+        ) AS ranked
+        JOIN granted ON granted.id = ranked.route_id
+        WHERE ranked.rank <= granted.seats
+    )
+    UPDATE trip SET ride_route_id = approved.route_id, is_approved = true, updated_at = now(), change_xid = DEFAULT
+    FROM approved
+    WHERE trip.id = approved.trip_id
+    RETURNING {", ".join(f"trip.{column.key}" for column in TRIP_COLUMNS)}
+    """
+).bindparams(
+    bindparam("trip_ids", type_=ARRAY(TripDB.id.type)),
+    bindparam("route_ids", type_=ARRAY(RouteDB.id.type)),
+)
@@ -0,0 +1,16 @@
+import numpy as np
+
+from utils.geohash import EARTH_RADIUS_M
+
+
+def haversine_m(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    한 점에서 여러 점까지의 대원 거리(m)를 한 번에 계산합니다.
+    lats/lons의 NaN(좌표 없음)은 결과도 NaN입니다.
+    """
+    lat1 = np.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlon = np.radians(lons) - np.radians(lon)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
@@ -0,0 +1,44 @@
+import csv
+import os
+from typing import Dict, Optional, Tuple
+
+from utils.location import normalize_location_name
+
+DEFAULT_GAZETTEER_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "gazetteer.csv")
+
+
+class Gazetteer:
+    """
+    장소명 → 좌표 오프라인 사전 (name,lat,lon 헤더의 CSV).
+    외부 지오코딩 서비스 없이 좌표가 없는 경로/여정의 장소명을 좌표로 바꾸는 데 사용합니다.
+    이름은 normalize_location_name으로 정규화하여 비교하므로 "서울역 1번 출구"도 "서울역"으로 찾습니다.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._points: Optional[Dict[str, Tuple[float, float]]] = None
+
+    def _load(self) -> Dict[str, Tuple[float, float]]:
+        points = {}
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8-sig", newline="") as f:
+                for row in csv.DictReader(f):
+                    points[normalize_location_name(row["name"])] = (float(row["lat"]), float(row["lon"]))
+        return points
+
+    def lookup(self, name: Optional[str]) -> Optional[Tuple[float, float]]:
+        if name is None:
+            return None
+        if self._points is None:
+            self._points = self._load()
+        return self._points.get(normalize_location_name(name))
+
+    def resolve(
+        self, name: Optional[str], lat: Optional[float], lon: Optional[float]
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """주어진 좌표를 우선 사용하고, 없으면 장소명으로 사전을 조회합니다."""
+        if lat is not None and lon is not None:
+            return lat, lon
+        return self.lookup(name) or (None, None)
+
+
+gazetteer = Gazetteer(os.environ.get("GAZETTEER_PATH", DEFAULT_GAZETTEER_PATH))
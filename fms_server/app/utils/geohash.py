@@ -0,0 +1,73 @@
+import math
+from typing import List, Optional, Tuple
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# 저장용 셀 정밀도 (9자리 ≈ 4.8m x 4.8m). 검색 시에는 반경에 맞는 길이의 접두사로 범위 조회합니다.
+GEOHASH_PRECISION = 9
+
+EARTH_RADIUS_M = 6_371_008.8
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS_M / 180
+
+
+def geohash_encode(lat: Optional[float], lon: Optional[float], precision: int = GEOHASH_PRECISION) -> Optional[str]:
+    """좌표를 geohash 문자열로 변환합니다. 좌표가 없으면 None을 반환합니다."""
+    if lat is None or lon is None:
+        return None
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    even = True
+    while len(chars) < precision:
+        current, target = (lon_range, lon) if even else (lat_range, lat)
+        mid = (current[0] + current[1]) / 2
+        if target >= mid:
+            value = (value << 1) | 1
+            current[0] = mid
+        else:
+            value <<= 1
+            current[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits = 0
+            value = 0
+    return "".join(chars)
+
+
+def cell_size_degrees(precision: int) -> Tuple[float, float]:
+    """precision 자리 geohash 셀의 (위도 높이, 경도 너비)를 도 단위로 반환합니다."""
+    total_bits = 5 * precision
+    lon_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def covering_cells(lat: float, lon: float, radius_m: float) -> List[str]:
+    """
+    (lat, lon) 중심 반경 radius_m 원을 덮는 geohash 접두사 목록을 반환합니다.
+    셀 높이/너비가 반경 이상인 가장 긴 정밀도를 골라 중심 셀과 주변 8개 셀을 사용합니다.
+    """
+    # 원 안에서 경도 1도의 길이가 가장 짧은 위도 기준으로 셀 너비를 계산합니다.
+    lat_span = radius_m / METERS_PER_DEGREE
+    widest_lat = min(90.0, abs(lat) + lat_span)
+    lon_meters = METERS_PER_DEGREE * max(math.cos(math.radians(widest_lat)), 1e-9)
+
+    precision = GEOHASH_PRECISION
+    while precision > 1:
+        height, width = cell_size_degrees(precision)
+        if height * METERS_PER_DEGREE >= radius_m and width * lon_meters >= radius_m:
+            break
+        precision -= 1
+
+    height, width = cell_size_degrees(precision)
+    cells = set()
+    for dlat in (-height, 0.0, height):
+        for dlon in (-width, 0.0, width):
+            cell_lat = max(-90.0, min(90.0, lat + dlat))
+            cell_lon = (lon + dlon + 180.0) % 360.0 - 180.0
+            cells.add(geohash_encode(cell_lat, cell_lon, precision))
+    return sorted(cells)
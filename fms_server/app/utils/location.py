@@ -0,0 +1,34 @@
+import re
+import unicodedata
+from typing import Optional
+
+# 장소명 끝에 붙는 출구/정류장 표기 (예: "서울역 1번 출구", "시청 앞", "터미널 정류장")
+# 공백으로 분리된 경우에만 제거하여 "서울대입구" 같은 고유 명칭은 그대로 둡니다.
+_SEPARATED_SUFFIX = re.compile(r"\s+(?:\d+\s*번\s*)?(?:출구|출입구|입구|게이트|정류장|정류소|승강장|방면|앞)$")
+# 붙어 있어도 의미가 분명한 출구 번호 표기 (예: "서울역1번출구")
+_ATTACHED_EXIT = re.compile(r"\d+\s*번\s*(?:출구|출입구|게이트)$")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_location_name(name: Optional[str]) -> Optional[str]:
+    """
+    장소명을 비교용 키로 정규화합니다.
+    - NFKC 정규화 (분리된(NFD) 한글 자모를 완성형 음절로, 전각 문자를 반각으로)
+    - 끝에 붙은 출구/정류장 표기 제거
+    - 모든 공백 제거, 소문자화
+    예: "서울역", "서울 역", "서울역 1번 출구" → "서울역"
+    """
+    if name is None:
+        return None
+    text = unicodedata.normalize("NFKC", name)
+    text = _WHITESPACE.sub(" ", text).strip()
+
+    while True:
+        stripped = _SEPARATED_SUFFIX.sub("", text)
+        stripped = _ATTACHED_EXIT.sub("", stripped).strip()
+        # 표기만 남은 경우(예: "정류장")에는 원래 값을 유지합니다.
+        if stripped == text or not stripped:
+            break
+        text = stripped
+
+    return _WHITESPACE.sub("", text).lower()
@@ -0,0 +1,48 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+
+def encode_cursor(departure_time: Optional[datetime], route_id: UUID) -> str:
+    """
+    (departure_time, id) 키셋 위치를 URL-safe 커서 문자열로 인코딩합니다.
+    출발 시간이 없는 경로(NULLS LAST 구간)의 위치는 "t"를 null로 기록합니다.
+    """
+    time = departure_time.isoformat() if departure_time is not None else None
+    raw = json.dumps({"t": time, "id": str(route_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], UUID]:
+    """
+    encode_cursor로 만든 커서를 (departure_time, id)로 복원합니다. "t"가 null이면 departure_time은 None입니다.
+    형식이 잘못된 커서는 ValueError를 발생시킵니다.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        time = datetime.fromisoformat(data["t"]) if data["t"] is not None else None
+        return time, UUID(data["id"])
+    except (TypeError, KeyError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def encode_sync_cursor(change_xid: int, row_id: UUID) -> str:
+    """동기화 API의 (change_xid, id) 위치를 커서 문자열로 인코딩합니다."""
+    raw = json.dumps({"x": change_xid, "id": str(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_sync_cursor(cursor: str) -> Tuple[int, UUID]:
+    """encode_sync_cursor로 만든 커서를 (change_xid, id)로 복원합니다. 형식이 잘못되면 ValueError."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        change_xid = data["x"]
+        if not isinstance(change_xid, int) or isinstance(change_xid, bool):
+            raise TypeError("change_xid must be an integer")
+        return change_xid, UUID(data["id"])
+    except (TypeError, KeyError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
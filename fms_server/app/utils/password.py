@@ -0,0 +1,42 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from passlib.context import CryptContext
+
+# PBKDF2 반복 횟수. 바꾸면 기존 해시는 다음 로그인 때 새 횟수로 다시 해시됩니다.
+PASSWORD_HASH_ROUNDS = int(os.environ.get("PASSWORD_HASH_ROUNDS", "29000"))
+# 해시/검증을 실행하는 스레드 수. 이 수보다 많은 요청은 풀의 대기열에서 기다립니다.
+PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+
+# rounds를 지정하면 횟수가 다른 해시는 needs_update로 판단됩니다. (늘리거나 줄이는 경우 모두)
+password_context = CryptContext(schemes=["pbkdf2_sha256"], pbkdf2_sha256__rounds=PASSWORD_HASH_ROUNDS)
+
+# PBKDF2는 hashlib.pbkdf2_hmac(OpenSSL)이 GIL을 놓고 계산하므로 스레드 풀로도 코어 수만큼 병렬 처리됩니다.
+_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+
+
+def hash_password(password: str) -> str:
+    return password_context.hash(password)
+
+
+def verify_password(password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호를 검증하고 (일치 여부, 새 해시)를 반환합니다.
+    새 해시는 저장된 해시의 반복 횟수가 현재 설정과 다를 때만 만들어지며, 호출 측에서 저장해야 합니다.
+    """
+    try:
+        return password_context.verify_and_update(password, hashed_password)
+    except ValueError:  # 알 수 없는 형식의 해시
+        return False, None
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password를 이벤트 루프 밖(해시 전용 스레드 풀)에서 실행합니다."""
+    return await asyncio.get_running_loop().run_in_executor(_executor, hash_password, password)
+
+
+async def verify_password_async(password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """verify_password를 이벤트 루프 밖(해시 전용 스레드 풀)에서 실행합니다."""
+    return await asyncio.get_running_loop().run_in_executor(_executor, verify_password, password, hashed_password)
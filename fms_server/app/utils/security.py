@@ -1,33 +1,58 @@
+import os
+import secrets
+from typing import Optional
+
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 
 from services.auth_service import AuthService
+from utils.token_cache import token_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
+_auth_service = AuthService(session=None)  # 토큰 검증은 session을 사용하지 않습니다.
+
+# 운영 엔드포인트(/metrics, /fms/internal/*)용 토큰. 설정하지 않으면 운영 엔드포인트는 모든 요청을 거부합니다.
+OPERATOR_TOKEN = os.environ.get("OPERATOR_TOKEN", "")
+
+def verify_token(token: str) -> Optional[dict]:
+    """JWT 서명/만료를 검증하고 sub가 있는 payload를 반환합니다. 유효하지 않으면 None."""
+    try:
+        payload = _auth_service.decode_access_token(token)
+    except (JWTError, ValueError):
+        return None
+    if not payload or not payload.get("sub"):
+        return None
+    return payload
+
 def get_token_payload(token: str = Depends(oauth2_scheme)) -> dict:
     """Decode and validate a Bearer token, returning the JWT payload.
 
     DB 접근을 하지 않습니다. 호출자는 payload["sub"] 등 식별자를 이용해
     필요한 사용자 조회를 별도의 서비스로 수행해야 합니다.
+    검증 결과는 token_cache에 토큰의 exp까지 (거부된 토큰은 잠시) 보관됩니다.
     """
-    credentials_exception = HTTPException(
-        status_code=401,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    payload = token_cache.get_or_verify(token, verify_token)
+    if payload is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return payload
 
-    try:
-        payload = AuthService(session=None).decode_access_token(token)  # session 미사용 경로
-        if not payload:
-            raise credentials_exception
-        sub = payload.get("sub")
-        if not sub:
-            raise credentials_exception
-        return payload
-    except (JWTError, ValueError):
-        raise credentials_exception
+def require_operator_token(token: str = Depends(oauth2_scheme)) -> None:
+    """
+    운영 엔드포인트의 Bearer 토큰이 OPERATOR_TOKEN과 같은지 확인합니다.
+    승객 JWT로는 운영 통계(SQL 문 샘플 포함)를 조회할 수 없습니다.
+    """
+    if not OPERATOR_TOKEN or not secrets.compare_digest(token.encode(), OPERATOR_TOKEN.encode()):
+        raise HTTPException(
+            status_code=403,
+            detail="Operator token required",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
 # Deprecated: 남겨두되 내부적으로 토큰만 검증 후 401을 반환.
 # 컨트롤러에서는 get_token_payload와 PassengerService를 사용해 사용자 로딩 권장.
@@ -0,0 +1,124 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+class VerifiedTokenCache:
+    """
+    검증을 마친 Bearer 토큰의 payload를 토큰의 exp까지 보관하는 크기 제한(LRU) 캐시.
+    토큰 원문 대신 SHA-256 해시를 키로 사용합니다.
+    검증에 실패한 토큰도 negative_ttl 초 동안 기억하며(negative caching), 유효한 토큰과 별도의 LRU에 보관하므로
+    잘못된 토큰이 대량으로 들어와도 유효한 토큰 항목이 밀려나지 않습니다.
+    get_token_payload는 스레드 풀에서 실행되는 동기 의존성이므로 잠금을 사용합니다.
+    """
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        negative_maxsize: int = 1000,
+        negative_ttl: float = 30.0,
+        default_ttl: float = 300.0,
+    ):
+        self.maxsize = maxsize
+        self.negative_maxsize = negative_maxsize
+        self.negative_ttl = negative_ttl
+        # exp가 없는 토큰의 보관 시간
+        self.default_ttl = default_ttl
+        # key -> (만료 시각(epoch 초), payload)
+        self._valid: "OrderedDict[bytes, tuple]" = OrderedDict()
+        # key -> 만료 시각(epoch 초)
+        self._rejected: "OrderedDict[bytes, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get_or_verify(self, token: str, verify: Callable[[str], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 payload를 반환하고, 없으면 verify(token)으로 검증한 결과를 저장합니다.
+        verify는 유효하지 않은 토큰에 대해 None을 반환해야 합니다. 반환하는 payload는 복사본입니다.
+        """
+        key = self._key(token)
+        now = time.time()
+        with self._lock:
+            entry = self._valid.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._valid.move_to_end(key)
+                    self.hits += 1
+                    return dict(entry[1])
+                del self._valid[key]
+            rejected_until = self._rejected.get(key)
+            if rejected_until is not None:
+                if rejected_until > now:
+                    self.negative_hits += 1
+                    return None
+                del self._rejected[key]
+            self.misses += 1
+
+        # 검증은 잠금 밖에서 수행합니다. 같은 토큰이 동시에 검증될 수 있지만 결과는 같습니다.
+        payload = verify(token)
+        if payload is None:
+            self._store_rejected(key, now + self.negative_ttl)
+            return None
+
+        exp = payload.get("exp")
+        expires_at = float(exp) if isinstance(exp, (int, float)) else now + self.default_ttl
+        self._store_valid(key, expires_at, payload)
+        return dict(payload)
+
+    def _store_valid(self, key: bytes, expires_at: float, payload: Dict[str, Any]):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._valid[key] = (expires_at, dict(payload))
+            self._valid.move_to_end(key)
+            while len(self._valid) > self.maxsize:
+                self._valid.popitem(last=False)
+                self.evictions += 1
+
+    def _store_rejected(self, key: bytes, expires_at: float):
+        if self.negative_maxsize <= 0 or self.negative_ttl <= 0:
+            return
+        with self._lock:
+            self._rejected[key] = expires_at
+            self._rejected.move_to_end(key)
+            while len(self._rejected) > self.negative_maxsize:
+                self._rejected.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._valid.clear()
+            self._rejected.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                "size": len(self._valid),
+                "rejected_size": len(self._rejected),
+                "maxsize": self.maxsize,
+                "negative_maxsize": self.negative_maxsize,
+                "negative_ttl": self.negative_ttl,
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+token_cache = VerifiedTokenCache(
+    maxsize=int(os.environ.get("TOKEN_CACHE_MAXSIZE", "10000")),
+    negative_maxsize=int(os.environ.get("TOKEN_CACHE_NEGATIVE_MAXSIZE", "1000")),
+    negative_ttl=float(os.environ.get("TOKEN_CACHE_NEGATIVE_TTL_SECONDS", "30")),
+    default_ttl=float(os.environ.get("TOKEN_CACHE_DEFAULT_TTL_SECONDS", "300")),
+)
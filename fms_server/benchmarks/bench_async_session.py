@@ -0,0 +1,107 @@
+"""
+동기 세션 경로(FmsService)와 asyncpg 기반 비동기 세션 경로(AsyncFmsService)의
+동시 요청 지연 시간(p50/p99)을 비교하는 벤치마크
+
+기존 컨트롤러는 async def 안에서 동기 서비스를 호출했으므로, 동기 경로는
+코루틴 안에서 블로킹 호출을 그대로 수행하는 방식으로 재현합니다.
+
+실행 (fms_server 디렉토리에서, PostgreSQL 필요):
+    python benchmarks/bench_async_session.py --clients 200 --requests 5 --seed 1000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../app'))
+
+from config.database import SessionLocal, AsyncSessionLocal, async_engine
+from models.model import RouteDB
+from services.fms_service import FmsService
+from services.async_fms_service import AsyncFmsService
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def seed_routes(count):
+    base_time = datetime.now().replace(minute=0, second=0, microsecond=0)
+    with SessionLocal() as session:
+        session.add_all([
+            RouteDB(
+                id=uuid4(),
+                departure_location_name=f"bench-departure-{i % 50}",
+                departure_time=base_time + timedelta(minutes=i),
+                destination_location_name=f"bench-destination-{i % 50}",
+            )
+            for i in range(count)
+        ])
+        session.commit()
+
+
+async def sync_client(requests, filters):
+    latencies = []
+    for _ in range(requests):
+        issued = time.perf_counter()
+        # 요청이 도착한 뒤 핸들러가 스케줄링되는 지점을 흉내냅니다.
+        await asyncio.sleep(0)
+        with SessionLocal() as session:
+            FmsService(session).find_ride_routes(**filters)
+        latencies.append(time.perf_counter() - issued)
+    return latencies
+
+
+async def async_client(requests, filters):
+    latencies = []
+    for _ in range(requests):
+        issued = time.perf_counter()
+        await asyncio.sleep(0)
+        async with AsyncSessionLocal() as session:
+            await AsyncFmsService(session).find_ride_routes(**filters)
+        latencies.append(time.perf_counter() - issued)
+    return latencies
+
+
+async def run(client, clients, requests, filters):
+    started = time.perf_counter()
+    results = await asyncio.gather(*[client(requests, filters) for _ in range(clients)])
+    elapsed = time.perf_counter() - started
+    latencies = [latency for result in results for latency in result]
+    return elapsed, latencies
+
+
+def report(name, elapsed, latencies):
+    print(
+        f"{name:<6} requests={len(latencies):<6} "
+        f"throughput={len(latencies) / elapsed:8.1f} req/s  "
+        f"p50={percentile(latencies, 50) * 1000:8.2f} ms  "
+        f"p99={percentile(latencies, 99) * 1000:8.2f} ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=200, help="동시 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=5, help="클라이언트당 요청 수")
+    parser.add_argument("--seed", type=int, default=0, help="벤치마크 전에 생성할 경로 수")
+    args = parser.parse_args()
+
+    if args.seed:
+        seed_routes(args.seed)
+
+    filters = {"departure_location_name": "bench-departure-1"}
+
+    report("sync", *await run(sync_client, args.clients, args.requests, filters))
+    report("async", *await run(async_client, args.clients, args.requests, filters))
+
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+"""
+BulkImportService(COPY + 병합)로 대량의 경로를 적재하는 데 걸리는 시간을 측정하는 벤치마크
+목표: 노트북 급 PostgreSQL에서 100만 건 1분 이내
+
+실행 (fms_server 디렉토리에서, PostgreSQL 필요):
+    python benchmarks/bench_bulk_import.py --rows 1000000 --format ndjson
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../app'))
+
+from sqlalchemy import text
+
+from config.database import AsyncSessionLocal, async_engine
+from services.bulk_import_service import BulkImportService
+
+LOCATION = "bench-bulk"
+
+
+async def generate(rows, fmt, lines_per_chunk=5000):
+    base_time = datetime(2025, 3, 1, 7, 0)
+    lines = []
+    if fmt == "csv":
+        lines.append("departure_location_name,departure_time,destination_location_name,car_plate_number")
+    for i in range(rows):
+        departure_time = (base_time + timedelta(minutes=i % 100000)).isoformat()
+        if fmt == "csv":
+            lines.append(f"{LOCATION},{departure_time},destination-{i % 500},12가{i % 10000:04d}")
+        else:
+            lines.append(json.dumps({
+                "departure_location_name": LOCATION,
+                "departure_time": departure_time,
+                "destination_location_name": f"destination-{i % 500}",
+                "car_plate_number": f"12가{i % 10000:04d}",
+            }, ensure_ascii=False))
+        if len(lines) >= lines_per_chunk:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def cleanup():
+    async with async_engine.begin() as connection:
+        await connection.execute(text("DELETE FROM route WHERE departure_location_name = :location"), {"location": LOCATION})
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="적재할 경로 수")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    args = parser.parse_args()
+
+    content_type = "text/csv" if args.format == "csv" else "application/x-ndjson"
+
+    await cleanup()
+    try:
+        started = time.perf_counter()
+        async with AsyncSessionLocal() as session:
+            result = await BulkImportService(session).import_routes(generate(args.rows, args.format), content_type)
+        elapsed = time.perf_counter() - started
+
+        if result is None:
+            print("import failed")
+            return
+        print(
+            f"format={args.format} rows={args.rows:,} elapsed={elapsed:.1f} s "
+            f"({args.rows / elapsed:,.0f} rows/sec) inserted={result.inserted:,} failed={result.failed:,}"
+        )
+    finally:
+        await cleanup()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+"""
+경로 목록 조회의 ORM 경로와 Core + orjson 읽기 경로의 처리량(rows/sec)을 비교하는 마이크로벤치마크
+
+- orm : AsyncFmsService.find_ride_routes (ORM 엔티티 → Route.model_validate) + FastAPI 기본 직렬화
+- core: ListingService.route_page_json (필요한 컬럼만 Core로 조회 → JSON 바이트)
+
+실행 (fms_server 디렉토리에서, PostgreSQL 13 이상 필요):
+    python benchmarks/bench_listing.py --rows 100000 --repeat 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../app'))
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import text
+
+from config.database import AsyncSessionLocal, async_engine
+from services.async_fms_service import AsyncFmsService
+from services.listing_service import ListingService
+
+LOCATION = "bench-listing"
+
+
+async def seed(rows):
+    async with async_engine.begin() as connection:
+        await connection.execute(
+            text(
+                """
+                INSERT INTO route (id, departure_location_name, departure_time, destination_location_name,
+                                   departure_location_norm, destination_location_norm, created_at, updated_at)
+                SELECT gen_random_uuid(), :location,
+                       timestamp '2025-01-01' + g * interval '1 minute',
+                       'destination-' || (g % 100), :location, 'destination-' || (g % 100), now(), now()
+                FROM generate_series(1, :rows) AS g
+                """
+            ),
+            {"location": LOCATION, "rows": rows},
+        )
+
+
+async def cleanup():
+    async with async_engine.begin() as connection:
+        await connection.execute(text("DELETE FROM route WHERE departure_location_name = :location"), {"location": LOCATION})
+
+
+async def orm_path(rows):
+    async with AsyncSessionLocal() as session:
+        routes = await AsyncFmsService(session).find_ride_routes(departure_location_name=LOCATION)
+        return json.dumps(jsonable_encoder(routes)).encode()
+
+
+async def core_path(rows):
+    async with AsyncSessionLocal() as session:
+        return await ListingService(session).route_page_json(departure_location_name=LOCATION, limit=rows)
+
+
+async def measure(name, path, rows, repeat):
+    await path(rows)  # 워밍업
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = await path(rows)
+        best = min(best, time.perf_counter() - started)
+    print(f"{name:<5} rows={rows:<8} best={best * 1000:9.1f} ms  {rows / best:12,.0f} rows/sec  body={len(body):,} bytes")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="조회할 경로 수")
+    parser.add_argument("--repeat", type=int, default=5, help="경로별 반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    await cleanup()
+    await seed(args.rows)
+    try:
+        await measure("orm", orm_path, args.rows, args.repeat)
+        await measure("core", core_path, args.rows, args.repeat)
+    finally:
+        await cleanup()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""
+장소명 유사도(pg_trgm) 검색 지연 시간을 측정하는 벤치마크
+
+서로 다른 장소명 --names개를 가진 경로를 채운 뒤, 실제 이름에서 한 글자를 뺀 오타 검색어로
+ListingService.route_fuzzy_json을 호출하여 p50/p99를 출력합니다. (캐시는 매번 비웁니다)
+목표: 장소명 100만 개에서 p99 10ms 미만. 마이그레이션 b71e4a90c2d5(pg_trgm, GIN 인덱스)가 적용되어 있어야 합니다.
+
+실행 (fms_server 디렉토리에서, PostgreSQL 필요):
+    python benchmarks/bench_location_search.py --names 1000000 --queries 500
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../app'))
+
+from sqlalchemy import text
+
+from config.database import AsyncSessionLocal, async_engine
+from services.listing_service import ListingService
+from services.route_cache import route_cache
+
+PREFIX = "benchloc"
+
+
+def location_name(i):
+    # 정규화 결과가 자기 자신이 되도록 공백/대문자 없이 만듭니다.
+    return f"{PREFIX}{i:07d}동{i * 7919 % 1000:03d}"
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def seed(names):
+    async with async_engine.begin() as connection:
+        await connection.execute(
+            text(
+                """
+                INSERT INTO route (id, departure_location_name, departure_time, destination_location_name,
+                                   departure_location_norm, destination_location_norm, created_at, updated_at)
+                SELECT gen_random_uuid(), name, timestamp '2025-01-01' + g * interval '1 minute',
+                       'bench-destination', name, 'bench-destination', now(), now()
+                FROM (
+                    SELECT g, :prefix || lpad(g::text, 7, '0') || '동' || lpad((g * 7919 % 1000)::text, 3, '0') AS name
+                    FROM generate_series(0, :names - 1) AS g
+                ) AS names
+                """
+            ),
+            {"prefix": PREFIX, "names": names},
+        )
+        await connection.execute(text("ANALYZE route"))
+
+
+async def cleanup():
+    async with async_engine.begin() as connection:
+        await connection.execute(
+            text("DELETE FROM route WHERE departure_location_norm LIKE :pattern"), {"pattern": f"{PREFIX}%"}
+        )
+
+
+def typo(name):
+    position = random.randrange(len(PREFIX), len(name))
+    return name[:position] + name[position + 1:]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--names", type=int, default=1_000_000, help="서로 다른 장소명 수")
+    parser.add_argument("--queries", type=int, default=500, help="검색 횟수")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    await cleanup()
+    print(f"seeding {args.names} routes ...")
+    await seed(args.names)
+    try:
+        queries = [typo(location_name(random.randrange(args.names))) for _ in range(args.queries)]
+        latencies = []
+        found = 0
+        async with AsyncSessionLocal() as session:
+            service = ListingService(session)
+            await service.route_fuzzy_json(departure_location_name=queries[0], limit=args.limit)  # 워밍업
+            for query in queries:
+                route_cache.clear()
+                started = time.perf_counter()
+                body = await service.route_fuzzy_json(departure_location_name=query, limit=args.limit)
+                latencies.append(time.perf_counter() - started)
+                found += body != b'{"items":[],"next_cursor":null}'
+
+        print(
+            f"names={args.names:,} queries={args.queries} "
+            f"p50={percentile(latencies, 50) * 1000:.2f}ms p99={percentile(latencies, 99) * 1000:.2f}ms "
+            f"with_results={found / len(queries):.0%}"
+        )
+    finally:
+        await cleanup()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""
+로그인 비밀번호 검증 경로 벤치마크 (DB 불필요)
+
+--logins개의 로그인을 동시에 처리하면서, 같은 이벤트 루프에서 돌고 있는 다른 요청이 얼마나 지연되는지 측정합니다.
+- old: 예전처럼 async 엔드포인트 안에서 pbkdf2_sha256.verify를 직접 호출 (이벤트 루프 스레드에서 계산)
+- new: utils.password.verify_password_async (해시 전용 스레드 풀에서 계산)
+
+다른 요청은 --tick-ms 간격으로 깨어나는 코루틴으로 흉내 내며, 예정 시각보다 늦게 깨어난 시간(loop lag)을 기록합니다.
+처리량은 코어당 값도 함께 출력합니다. (new 경로의 스레드 수는 PASSWORD_HASH_WORKERS, 기본 CPU 수)
+
+실행 (fms_server 디렉토리에서):
+    python benchmarks/bench_login.py --logins 400
+    PASSWORD_HASH_ROUNDS=100000 python benchmarks/bench_login.py --logins 200
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../app'))
+
+from passlib.hash import pbkdf2_sha256
+
+from utils.password import PASSWORD_HASH_ROUNDS, PASSWORD_HASH_WORKERS, hash_password, verify_password_async
+
+PASSWORD = "correct horse battery staple"
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def old_login(hashed):
+    await asyncio.sleep(0)  # 사용자 조회 대기
+    return pbkdf2_sha256.verify(PASSWORD, hashed)
+
+
+async def new_login(hashed):
+    await asyncio.sleep(0)  # 사용자 조회 대기
+    verified, _ = await verify_password_async(PASSWORD, hashed)
+    return verified
+
+
+async def ticker(interval, lags, stop):
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def run(login, hashed, logins, tick_ms):
+    lags, stop = [], asyncio.Event()
+    tick = asyncio.create_task(ticker(tick_ms / 1000, lags, stop))
+    await asyncio.sleep(tick_ms / 1000)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(login(hashed) for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await tick
+    assert all(results)
+    return elapsed, lags
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=400, help="동시 로그인 수")
+    parser.add_argument("--tick-ms", type=float, default=10, help="다른 요청(ticker)이 깨어나는 간격")
+    args = parser.parse_args()
+
+    hashed = hash_password(PASSWORD)
+    cores = os.cpu_count() or 1
+    print(f"rounds={PASSWORD_HASH_ROUNDS} workers={PASSWORD_HASH_WORKERS} cores={cores} logins={args.logins}")
+    for name, login in (("old", old_login), ("new", new_login)):
+        elapsed, lags = await run(login, hashed, args.logins, args.tick_ms)
+        throughput = args.logins / elapsed
+        print(
+            f"{name}  {throughput:,.0f} logins/s ({throughput / cores:,.0f}/core) "
+            f"loop lag p50={percentile(lags, 50) * 1000:.1f}ms p99={percentile(lags, 99) * 1000:.1f}ms "
+            f"max={max(lags, default=0) * 1000:.1f}ms ticks={len(lags)}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+"""
+매칭 엔진(services.matching_service.solve_matching) 벤치마크 (DB 불필요)
+
+서울 일대의 임의 승차 위치/시간을 가진 여정 --trips개와 경로 --routes개를 만들어 한 번에 배정하고,
+같은 비용 함수를 여정마다 모든 경로에 대해 순수 Python으로 계산하는 방식(에이전트가 한 건씩 검색/선택하는 흐름)과 비교합니다.
+순수 Python 방식은 --sample개 여정만 실행한 뒤 전체 시간을 추정합니다.
+
+실행 (fms_server 디렉토리에서):
+    python benchmarks/bench_matching.py --trips 10000 --routes 2000
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../app'))
+
+import numpy as np
+
+from services.matching_service import MatchingParams, RouteCandidates, TripCandidates, solve_matching
+from utils.geohash import EARTH_RADIUS_M
+
+CENTER = (37.5547, 126.9707)
+SPREAD_DEGREES = 0.1
+PLACES = 200
+DAY_MINUTES = 24 * 60
+
+
+def make_candidates(trip_count, route_count, seats, coordinate_ratio, rng):
+    def points(n):
+        lat = CENTER[0] + rng.uniform(-SPREAD_DEGREES, SPREAD_DEGREES, n)
+        lon = CENTER[1] + rng.uniform(-SPREAD_DEGREES, SPREAD_DEGREES, n)
+        missing = rng.random(n) >= coordinate_ratio
+        lat[missing] = np.nan
+        lon[missing] = np.nan
+        return lat, lon
+
+    trip_lat, trip_lon = points(trip_count)
+    route_lat, route_lon = points(route_count)
+    trips = TripCandidates(
+        pickup_minutes=rng.uniform(0, DAY_MINUTES, trip_count),
+        lat=trip_lat,
+        lon=trip_lon,
+        name_code=rng.integers(0, PLACES, trip_count),
+        requested_route=rng.integers(0, route_count, trip_count),
+    )
+    capacity = np.full(route_count, seats, dtype=np.int64)
+    routes = RouteCandidates(
+        departure_minutes=rng.uniform(0, DAY_MINUTES, route_count),
+        lat=route_lat,
+        lon=route_lon,
+        name_code=rng.integers(0, PLACES, route_count),
+        capacity=capacity,
+        remaining=capacity.copy(),
+    )
+    return trips, routes
+
+
+def python_best_route(trips, routes, trip, remaining, params):
+    best, best_cost = -1, math.inf
+    for route in range(len(routes.departure_minutes)):
+        if remaining[route] <= 0:
+            continue
+        slack = abs(trips.pickup_minutes[trip] - routes.departure_minutes[route])
+        if slack > params.time_window_minutes:
+            continue
+        if math.isnan(trips.lat[trip]) or math.isnan(routes.lat[route]):
+            if trips.name_code[trip] != routes.name_code[route]:
+                continue
+            location = 0.0
+        else:
+            dlat = math.radians(routes.lat[route] - trips.lat[trip])
+            dlon = math.radians(routes.lon[route] - trips.lon[trip])
+            a = (math.sin(dlat / 2) ** 2
+                 + math.cos(math.radians(trips.lat[trip])) * math.cos(math.radians(routes.lat[route])) * math.sin(dlon / 2) ** 2)
+            distance = 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+            if distance > params.max_distance_m:
+                continue
+            location = distance / params.max_distance_m
+        cost = (params.time_weight * slack / params.time_window_minutes
+                + params.distance_weight * location
+                + params.seat_weight * (1 - remaining[route] / routes.capacity[route])
+                - params.requested_route_bonus * (trips.requested_route[trip] == route))
+        if cost < best_cost:
+            best, best_cost = route, cost
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trips", type=int, default=10_000)
+    parser.add_argument("--routes", type=int, default=2_000)
+    parser.add_argument("--seats", type=int, default=4)
+    parser.add_argument("--coordinate-ratio", type=float, default=0.8, help="좌표가 있는 여정/경로 비율")
+    parser.add_argument("--sample", type=int, default=200, help="순수 Python 방식으로 실행할 여정 수")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    trips, routes = make_candidates(args.trips, args.routes, args.seats, args.coordinate_ratio, rng)
+    params = MatchingParams()
+
+    started = time.perf_counter()
+    pairs = solve_matching(trips, routes, params)
+    elapsed = time.perf_counter() - started
+    print(
+        f"engine  trips={args.trips:,} routes={args.routes:,} matched={len(pairs):,} "
+        f"elapsed={elapsed:.2f}s"
+    )
+
+    remaining = routes.remaining.copy()
+    sample = min(args.sample, args.trips)
+    started = time.perf_counter()
+    for trip in range(sample):
+        route = python_best_route(trips, routes, trip, remaining, params)
+        if route >= 0:
+            remaining[route] -= 1
+    per_trip = (time.perf_counter() - started) / sample
+    print(
+        f"python  {per_trip * 1000:.2f} ms/trip → estimated {per_trip * args.trips:.1f}s for {args.trips:,} trips "
+        f"(엔진 대비 {per_trip * args.trips / elapsed:.0f}배, 에이전트 호출/HTTP 왕복 시간 제외)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+주변 경로 검색(ListingService.nearby_routes_json) 벤치마크
+
+1) 거리 필터링: 후보 좌표 --candidates개에 대해 행 단위 Python 루프와 NumPy 벡터 연산을 비교합니다. (DB 불필요)
+2) --rows를 지정하면 서울 일대에 임의 좌표의 경로를 채운 뒤 엔드 투 엔드 p50/p99를 측정합니다. (PostgreSQL 필요)
+
+실행 (fms_server 디렉토리에서):
+    python benchmarks/bench_nearby.py --candidates 100000
+    python benchmarks/bench_nearby.py --rows 1000000 --queries 200 --radius 500
+"""
+import argparse
+import asyncio
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../app'))
+
+import numpy as np
+
+from utils.distance import haversine_m
+from utils.geohash import EARTH_RADIUS_M
+
+CENTER = (37.5547, 126.9707)
+SPREAD_DEGREES = 0.2
+LOCATION = "bench-nearby"
+
+
+def python_filter(lat, lon, lats, lons, radius_m):
+    result = []
+    for i, (point_lat, point_lon) in enumerate(zip(lats, lons)):
+        dlat = math.radians(point_lat - lat)
+        dlon = math.radians(point_lon - lon)
+        a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat)) * math.cos(math.radians(point_lat)) * math.sin(dlon / 2) ** 2
+        distance = 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+        if distance <= radius_m:
+            result.append((distance, i))
+    result.sort()
+    return [i for _, i in result]
+
+
+def numpy_filter(lat, lon, lats, lons, radius_m):
+    distances = haversine_m(lat, lon, np.asarray(lats), np.asarray(lons))
+    within = np.flatnonzero(distances <= radius_m)
+    return within[np.argsort(distances[within], kind="stable")].tolist()
+
+
+def bench_filter(candidates, radius_m, repeat=5):
+    lats = [CENTER[0] + random.uniform(-0.01, 0.01) for _ in range(candidates)]
+    lons = [CENTER[1] + random.uniform(-0.01, 0.01) for _ in range(candidates)]
+    for name, fn in (("python", python_filter), ("numpy", numpy_filter)):
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn(CENTER[0], CENTER[1], lats, lons, radius_m)
+            best = min(best, time.perf_counter() - started)
+        print(f"filter {name:<6} candidates={candidates:,} best={best * 1000:8.2f} ms")
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def bench_endpoint(rows, queries, radius_m):
+    from sqlalchemy import text
+
+    from config.database import AsyncSessionLocal, async_engine
+    from services.listing_service import ListingService
+    from utils.geohash import geohash_encode
+
+    async with async_engine.begin() as connection:
+        await connection.execute(text("DELETE FROM route WHERE departure_location_name = :location"), {"location": LOCATION})
+        batch = []
+        for i in range(rows):
+            lat = CENTER[0] + random.uniform(-SPREAD_DEGREES, SPREAD_DEGREES)
+            lon = CENTER[1] + random.uniform(-SPREAD_DEGREES, SPREAD_DEGREES)
+            batch.append({"lat": lat, "lon": lon, "cell": geohash_encode(lat, lon), "location": LOCATION, "i": i})
+            if len(batch) == 10_000 or i == rows - 1:
+                await connection.execute(
+                    text(
+                        """
+                        INSERT INTO route (id, departure_location_name, departure_time, departure_lat, departure_lon,
+                                           departure_cell, created_at, updated_at)
+                        VALUES (gen_random_uuid(), :location, timestamp '2025-01-01' + :i * interval '1 second',
+                                :lat, :lon, :cell, now(), now())
+                        """
+                    ),
+                    batch,
+                )
+                batch = []
+        await connection.execute(text("ANALYZE route"))
+
+    try:
+        latencies = []
+        async with AsyncSessionLocal() as session:
+            service = ListingService(session)
+            for _ in range(queries):
+                lat = CENTER[0] + random.uniform(-SPREAD_DEGREES, SPREAD_DEGREES)
+                lon = CENTER[1] + random.uniform(-SPREAD_DEGREES, SPREAD_DEGREES)
+                started = time.perf_counter()
+                await service.nearby_routes_json(lat, lon, radius_m, limit=100)
+                latencies.append(time.perf_counter() - started)
+        print(
+            f"endpoint rows={rows:,} radius={radius_m}m "
+            f"p50={percentile(latencies, 50) * 1000:.2f}ms p99={percentile(latencies, 99) * 1000:.2f}ms"
+        )
+    finally:
+        async with async_engine.begin() as connection:
+            await connection.execute(text("DELETE FROM route WHERE departure_location_name = :location"), {"location": LOCATION})
+        await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=100_000, help="거리 필터링 후보 수")
+    parser.add_argument("--radius", type=float, default=500, help="검색 반경 (m)")
+    parser.add_argument("--rows", type=int, default=0, help="엔드 투 엔드 측정용 경로 수 (0이면 생략)")
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    bench_filter(args.candidates, args.radius)
+    if args.rows:
+        asyncio.run(bench_endpoint(args.rows, args.queries, args.radius))
+
+
+if __name__ == "__main__":
+    main()
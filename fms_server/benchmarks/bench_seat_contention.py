@@ -0,0 +1,102 @@
+"""
+인기 경로 하나에 승인 요청이 몰릴 때의 좌석 예약 처리량/지연 시간 벤치마크
+
+정원 --seats인 경로 하나에 승인 대기 여정 --requests개를 만들고, 모든 여정을 동시에 approve_trip으로 승인합니다.
+경로 행 잠금은 좌석 예약 문장과 커밋 사이에만 유지되므로, 요청 수가 늘어도 지연 시간이 잠금 대기열 길이만큼 늘지 않아야 합니다.
+끝나면 승인된 여정 수가 정원과 같은지(초과 예약 없음)도 확인합니다.
+
+실행 (fms_server 디렉토리에서, PostgreSQL 필요):
+    python benchmarks/bench_seat_contention.py --requests 500 --seats 40
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+from uuid import uuid4
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../app'))
+
+from sqlalchemy import delete, func, select
+
+from config.database import AsyncSessionLocal, async_engine
+from models.model import PassengerDB, RouteDB, TripDB
+from services.async_fms_service import AsyncFmsService
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def seed(requests, seats):
+    route_id, passenger_id = uuid4(), uuid4()
+    trip_ids = [uuid4() for _ in range(requests)]
+    async with AsyncSessionLocal() as session:
+        session.add(PassengerDB(id=passenger_id, password="x", name="bench", nickname=f"bench-{passenger_id}", contact_info=""))
+        session.add(RouteDB(
+            id=route_id,
+            departure_location_name="bench-school",
+            departure_time=datetime(2025, 3, 3, 7, 30),
+            destination_location_name="bench-school",
+            seat_capacity=seats,
+        ))
+        await session.flush()
+        session.add_all([
+            TripDB(
+                id=trip_id,
+                ride_route_id=route_id,
+                passenger_id=passenger_id,
+                pickup_request_location_name="bench-school",
+                pickup_time=datetime(2025, 3, 3, 7, 30),
+            )
+            for trip_id in trip_ids
+        ])
+        await session.commit()
+    return route_id, passenger_id, trip_ids
+
+
+async def approve(trip_id):
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as session:
+        trip = await AsyncFmsService(session).approve_trip(trip_id)
+    return trip is not None, time.perf_counter() - started
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500, help="동시 승인 요청 수")
+    parser.add_argument("--seats", type=int, default=40, help="경로 정원")
+    args = parser.parse_args()
+
+    route_id, passenger_id, trip_ids = await seed(args.requests, args.seats)
+    try:
+        started = time.perf_counter()
+        results = await asyncio.gather(*(approve(trip_id) for trip_id in trip_ids))
+        elapsed = time.perf_counter() - started
+
+        latencies = [latency for _, latency in results]
+        async with AsyncSessionLocal() as session:
+            approved = await session.scalar(
+                select(func.count()).select_from(TripDB).where(TripDB.ride_route_id == route_id, TripDB.is_approved.is_(True))
+            )
+            seats_reserved = (await session.get(RouteDB, route_id)).seats_reserved
+        print(
+            f"requests={args.requests} seats={args.seats} elapsed={elapsed:.2f}s "
+            f"throughput={args.requests / elapsed:,.0f} req/s "
+            f"p50={percentile(latencies, 50) * 1000:.1f}ms p99={percentile(latencies, 99) * 1000:.1f}ms"
+        )
+        print(f"approved={approved} seats_reserved={seats_reserved} overbooked={'YES' if approved > args.seats else 'no'}")
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(TripDB).where(TripDB.ride_route_id == route_id))
+            await session.execute(delete(RouteDB).where(RouteDB.id == route_id))
+            await session.execute(delete(PassengerDB).where(PassengerDB.id == passenger_id))
+            await session.commit()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,51 @@
+"""
+Bearer 토큰 인증(utils.security.get_token_payload)의 요청당 비용 마이크로벤치마크 (DB 불필요)
+
+- before: 매 요청마다 JWT를 디코딩/서명 검증 (utils.security.verify_token)
+- after: 검증된 토큰 캐시(utils.token_cache) 사용. 같은 토큰을 --tokens개 중에서 돌려 가며 사용합니다.
+
+실행 (fms_server 디렉토리에서):
+    python benchmarks/bench_token_auth.py --requests 100000 --tokens 50
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../app'))
+
+from services.auth_service import AuthService
+from utils import security
+from utils.token_cache import VerifiedTokenCache
+
+
+def measure(requests, tokens, authenticate):
+    started = time.perf_counter()
+    for i in range(requests):
+        authenticate(tokens[i % len(tokens)])
+    return (time.perf_counter() - started) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--tokens", type=int, default=50, help="서로 다른 토큰(에이전트) 수")
+    args = parser.parse_args()
+
+    auth_service = AuthService(session=None)
+    tokens = [
+        auth_service.create_access_token({"sub": f"agent-{i}"}, timedelta(minutes=30))
+        for i in range(args.tokens)
+    ]
+
+    before = measure(args.requests, tokens, security.verify_token)
+    security.token_cache = VerifiedTokenCache()
+    after = measure(args.requests, tokens, security.get_token_payload)
+
+    print(f"before  {before * 1e6:.1f} us/request")
+    print(f"after   {after * 1e6:.1f} us/request ({before / after:.0f}x) {security.token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
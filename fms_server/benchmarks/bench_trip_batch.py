@@ -0,0 +1,103 @@
+"""
+여정 생성/승인을 한 건씩 처리하는 경로와 배치 경로(create_trips / approve_trips)를 비교하는 벤치마크
+
+실행 (fms_server 디렉토리에서, PostgreSQL 필요):
+    python benchmarks/bench_trip_batch.py --size 30 --repeat 20
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+from uuid import uuid4
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../app'))
+
+from sqlalchemy import delete
+
+from config.database import AsyncSessionLocal, async_engine
+from domains.route import Route
+from domains.trip import Trip
+from models.model import PassengerDB, RouteDB, TripDB
+from services.async_fms_service import AsyncFmsService
+
+
+def make_trips(route_id, passenger_ids, size):
+    return [
+        Trip(
+            id=uuid4(),
+            ride_route_id=route_id,
+            passenger_id=passenger_ids[i % len(passenger_ids)],
+            pickup_request_location_name=f"bench-pickup-{i}",
+            pickup_time=datetime(2025, 3, 1, 7, 30),
+        )
+        for i in range(size)
+    ]
+
+
+async def loop_path(route_id, passenger_ids, size):
+    trips = make_trips(route_id, passenger_ids, size)
+    async with AsyncSessionLocal() as session:
+        service = AsyncFmsService(session)
+        for trip in trips:
+            await service.create_trip(trip)
+        for trip in trips:
+            await service.approve_trip(trip.id)
+    return trips
+
+
+async def batch_path(route_id, passenger_ids, size):
+    trips = make_trips(route_id, passenger_ids, size)
+    async with AsyncSessionLocal() as session:
+        service = AsyncFmsService(session)
+        await service.create_trips(trips)
+        await service.approve_trips([trip.id for trip in trips])
+    return trips
+
+
+async def measure(name, path, route_id, passenger_ids, size, repeat):
+    elapsed = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await path(route_id, passenger_ids, size)
+        elapsed.append(time.perf_counter() - started)
+    best = min(elapsed)
+    print(f"{name:<5} size={size:<5} best={best * 1000:8.2f} ms  avg={sum(elapsed) / len(elapsed) * 1000:8.2f} ms  {size / best:10,.0f} trips/sec")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=30, help="배치당 여정 수")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수")
+    args = parser.parse_args()
+
+    passenger_ids = [uuid4() for _ in range(args.size)]
+    async with AsyncSessionLocal() as session:
+        session.add_all([
+            PassengerDB(id=passenger_id, password="x", name="bench", nickname=f"bench-trip-batch-{passenger_id}", contact_info="")
+            for passenger_id in passenger_ids
+        ])
+        await session.commit()
+        # 모든 승인이 좌석 예약에 성공하도록 정원을 충분히 둡니다.
+        route = await AsyncFmsService(session).create_route(Route(
+            departure_location_name="bench-trip-batch",
+            departure_time=datetime(2025, 3, 1, 7, 0),
+            destination_location_name="bench-trip-batch",
+            seat_capacity=2 * args.size * args.repeat,
+        ))
+
+    try:
+        await measure("loop", loop_path, route.id, passenger_ids, args.size, args.repeat)
+        await measure("batch", batch_path, route.id, passenger_ids, args.size, args.repeat)
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(TripDB).where(TripDB.ride_route_id == route.id))
+            await session.execute(delete(RouteDB).where(RouteDB.id == route.id))
+            await session.execute(delete(PassengerDB).where(PassengerDB.id.in_(passenger_ids)))
+            await session.commit()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,187 @@
+"""
+핫 쿼리들이 인덱스를 사용하는지 EXPLAIN으로 확인하는 스크립트
+
+별도 스키마(index_check)에 테이블을 만들고 generate_series로 대량의 행을 채운 뒤,
+서비스가 실제로 보내는 형태의 쿼리에 대해 EXPLAIN (FORMAT JSON)을 실행합니다.
+기대한 인덱스를 사용하지 않거나 순차 스캔이 나오면 종료 코드 1로 끝납니다.
+테이블의 인덱스는 models.model의 __table_args__ 정의(= 마이그레이션 3f9a1c2d7b10, b71e4a90c2d5, c8e2f5a1d394)를 따릅니다.
+
+실행 (fms_server 디렉토리에서, PostgreSQL 13 이상 필요):
+    python benchmarks/explain_indexes.py --rows 5000000
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../app'))
+
+from sqlalchemy import text
+
+from config.database import engine
+from models.model import Base
+
+SCHEMA = "index_check"
+
+SEED_SQL = [
+    """
+    INSERT INTO passenger (id, password, name, nickname, contact_info, created_at, updated_at)
+    SELECT md5('p' || g)::uuid, 'x', 'name-' || g, 'nick-' || g, '010-0000-0000', now(), now()
+    FROM generate_series(1, :rows) AS g
+    """,
+    """
+    INSERT INTO route (id, driver_id, car_plate_number, departure_location_name, departure_time,
+                       destination_location_name, departure_location_norm, destination_location_norm,
+                       departure_cell, created_at, updated_at)
+    SELECT md5(g::text)::uuid,
+           CASE WHEN g % 3 = 0 THEN NULL ELSE gen_random_uuid() END,
+           'plate-' || (g % 10000),
+           'departure-' || (g % 2000),
+           timestamp '2025-01-01' + (g % 525600) * interval '1 minute',
+           'destination-' || (g % 2000),
+           'departure-' || (g % 2000),
+           'destination-' || (g % 2000),
+           'wydm' || lpad((g % 100000)::text, 5, '0'),
+           now(), now()
+    FROM generate_series(1, :rows) AS g
+    """,
+    """
+    INSERT INTO trip (id, ride_route_id, passenger_id, pickup_request_location_name, pickup_time,
+                      is_approved, created_at, updated_at)
+    SELECT gen_random_uuid(),
+           md5((1 + g % LEAST(:rows, 500000))::text)::uuid,
+           md5(('p' || (1 + g % LEAST(:rows, 1000000)))::text)::uuid,
+           'pickup-' || (g % 2000),
+           timestamp '2025-01-01' + (g % 525600) * interval '1 minute',
+           g % 10 <> 0,
+           now(), now()
+    FROM generate_series(1, :rows) AS g
+    """,
+]
+
+# (설명, 쿼리, 기대 인덱스)
+CHECKS = [
+    (
+        "find_ride_routes: 시간 범위 + 출발지/목적지",
+        """
+        SELECT * FROM route
+        WHERE departure_time >= '2025-03-01 07:00' AND departure_time <= '2025-03-01 09:00'
+          AND departure_location_norm = 'departure-42' AND destination_location_norm = 'destination-42'
+        """,
+        "ix_route_departure_destination_norm_time",
+    ),
+    (
+        "find_ride_routes: 시간 범위 정렬 조회",
+        """
+        SELECT * FROM route
+        WHERE departure_time >= '2025-03-01 07:00' AND departure_time <= '2025-03-01 09:00'
+        ORDER BY departure_time, id LIMIT 100
+        """,
+        "ix_route_departure_time_id",
+    ),
+    (
+        "find_ride_routes: 목적지 + 시간 범위",
+        """
+        SELECT * FROM route
+        WHERE destination_location_norm = 'destination-42'
+          AND departure_time >= '2025-03-01' AND departure_time <= '2025-03-02'
+        """,
+        "ix_route_destination_norm_time",
+    ),
+    (
+        "find_ride_routes(match=fuzzy): 출발지 유사도",
+        """
+        SELECT * FROM route
+        WHERE departure_location_norm % 'departure-1999'
+        ORDER BY similarity(departure_location_norm, 'departure-1999') DESC LIMIT 100
+        """,
+        "ix_route_departure_location_norm_trgm",
+    ),
+    (
+        "find_nearby_routes: 출발지 geohash 셀 접두사 + 시간 범위",
+        """
+        SELECT * FROM route
+        WHERE ((departure_cell >= 'wydm0042' AND departure_cell < 'wydm0042~')
+            OR (departure_cell >= 'wydm0043' AND departure_cell < 'wydm0043~'))
+          AND departure_time >= '2025-01-01' AND departure_time <= '2025-12-31'
+        """,
+        "ix_route_departure_cell_time",
+    ),
+    (
+        "운전자 미배정 경로",
+        """
+        SELECT * FROM route
+        WHERE driver_id IS NULL AND departure_time >= '2025-03-01 07:00' AND departure_time <= '2025-03-01 09:00'
+        """,
+        "ix_route_unassigned_departure_time",
+    ),
+    (
+        "find_trips: ride_route_id + is_approved",
+        "SELECT * FROM trip WHERE ride_route_id = md5('42')::uuid AND is_approved = true",
+        "ix_trip_ride_route_approved",
+    ),
+    (
+        "find_trips: passenger_id",
+        "SELECT * FROM trip WHERE passenger_id = md5('p42')::uuid",
+        "ix_trip_passenger_approved",
+    ),
+    (
+        "경로별 승인 대기 요청",
+        "SELECT * FROM trip WHERE ride_route_id = md5('42')::uuid AND NOT is_approved ORDER BY pickup_time",
+        "ix_trip_pending_ride_route",
+    ),
+    (
+        "find_by_nickname / authenticate_user",
+        "SELECT * FROM passenger WHERE nickname = 'nick-4242' LIMIT 1",
+        "ux_passenger_nickname",
+    ),
+]
+
+
+def walk_plan(plan):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from walk_plan(child)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000_000, help="테이블별 생성할 행 수")
+    parser.add_argument("--keep", action="store_true", help="확인 후 index_check 스키마를 삭제하지 않음")
+    args = parser.parse_args()
+
+    failed = False
+    with engine.connect() as connection:
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        connection.execute(text(f"SET search_path TO {SCHEMA}, public"))
+        Base.metadata.create_all(bind=connection)
+
+        print(f"seeding {args.rows} rows per table ...")
+        for statement in SEED_SQL:
+            connection.execute(text(statement), {"rows": args.rows})
+        connection.execute(text("ANALYZE"))
+        connection.commit()
+
+        for description, query, expected_index in CHECKS:
+            plan = connection.execute(text(f"EXPLAIN (FORMAT JSON) {query}")).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            nodes = list(walk_plan(plan[0]["Plan"]))
+            used_indexes = {node["Index Name"] for node in nodes if "Index Name" in node}
+            seq_scans = [node["Relation Name"] for node in nodes if node["Node Type"] == "Seq Scan"]
+
+            ok = expected_index in used_indexes and not seq_scans
+            failed = failed or not ok
+            print(f"[{'OK' if ok else 'FAIL'}] {description}: expected={expected_index} used={sorted(used_indexes)} seq_scans={seq_scans}")
+
+        if not args.keep:
+            connection.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+            connection.commit()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,55 @@
 import os
 import sys
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, Integer, String, DateTime, Uuid, Boolean
-from sqlalchemy.dialects.postgresql import UUID
-from datetime import datetime
-from sqlalchemy.schema import MetaData
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '../app'))
 
-from app.domains.passenger import Passenger
-from app.domains.route import Route
-from app.domains.trip import trip as RideRequest
+from config.database import DATABASE_URL
+from models.model import Base
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# alembic.ini의 sqlalchemy.url은 환경 변수를 치환하지 않으므로 애플리케이션과 같은 URL을 사용합니다.
+config.set_main_option("sqlalchemy.url", DATABASE_URL)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """Run migrations in 'offline' mode."""
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode."""
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+
+        with context.begin_transaction():
+            context.run_migrations()
 
-target_metadata = MetaData()
-target_metadata.reflect = lambda bind, schema=None: None # Hack to prevent reflection
 
-Passenger.__table__.to_metadata(target_metadata)
-Route.__table__.to_metadata(target_metadata)
-RideRequest.__table__.to_metadata(target_metadata)
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
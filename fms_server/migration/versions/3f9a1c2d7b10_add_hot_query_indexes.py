@@ -0,0 +1,82 @@
+"""add hot query indexes
+
+경로 검색(find_ride_routes), 여정 검색(find_trips), 로그인(find_by_nickname,
+authenticate_user)이 순차 스캔을 하지 않도록 복합/부분 인덱스를 추가합니다.
+운영 중인 테이블을 잠그지 않도록 CONCURRENTLY로 생성합니다.
+
+passenger.nickname에 중복 값이 있으면 고유 인덱스 생성이 실패하므로,
+적용 전에 중복 닉네임을 정리해야 합니다.
+
+Revision ID: 3f9a1c2d7b10
+Revises:
+Create Date: 2026-10-18 13:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c2d7b10'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ux_passenger_nickname", "passenger", ["nickname"],
+            unique=True, postgresql_concurrently=True,
+        )
+
+        op.create_index(
+            "ix_route_departure_time_id", "route", ["departure_time", "id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_route_departure_destination_time", "route",
+            ["departure_location_name", "destination_location_name", "departure_time"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_route_destination_time", "route",
+            ["destination_location_name", "departure_time"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_route_unassigned_departure_time", "route", ["departure_time"],
+            postgresql_where=sa.text("driver_id IS NULL"), postgresql_concurrently=True,
+        )
+
+        op.create_index(
+            "ix_trip_ride_route_approved", "trip", ["ride_route_id", "is_approved"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_trip_passenger_approved", "trip", ["passenger_id", "is_approved"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_trip_pending_ride_route", "trip", ["ride_route_id", "pickup_time"],
+            postgresql_where=sa.text("NOT is_approved"), postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table_name, index_name in (
+            ("trip", "ix_trip_pending_ride_route"),
+            ("trip", "ix_trip_passenger_approved"),
+            ("trip", "ix_trip_ride_route_approved"),
+            ("route", "ix_route_unassigned_departure_time"),
+            ("route", "ix_route_destination_time"),
+            ("route", "ix_route_departure_destination_time"),
+            ("route", "ix_route_departure_time_id"),
+            ("passenger", "ux_passenger_nickname"),
+        ):
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True)
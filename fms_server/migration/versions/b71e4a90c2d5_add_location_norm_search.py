@@ -0,0 +1,121 @@
+"""add normalized location names and trigram search
+
+route에 정규화된 장소명 컬럼(departure_location_norm, destination_location_norm)을 추가하고,
+기존 행을 채운 뒤 이름 기반 복합 인덱스를 정규화 컬럼 인덱스와 pg_trgm GIN 인덱스로 교체합니다.
+
+정규화 규칙(utils.location.normalize_location_name)은 Python에만 있으므로, 서로 다른 장소명만
+Python에서 정규화하여 임시 테이블에 적재한 뒤 UPDATE ... FROM 한 번으로 반영합니다.
+이후 규칙이 바뀌어도 이 마이그레이션의 결과가 달라지지 않도록 작성 시점의 규칙을 복사해 사용합니다.
+pg_trgm 확장을 만들 권한이 필요합니다.
+
+Revision ID: b71e4a90c2d5
+Revises: 3f9a1c2d7b10
+Create Date: 2026-10-18 15:20:00.000000
+
+"""
+import re
+import unicodedata
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71e4a90c2d5'
+down_revision: Union[str, None] = '3f9a1c2d7b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRGM_INDEXES = (
+    ("ix_route_departure_location_norm_trgm", "departure_location_norm"),
+    ("ix_route_destination_location_norm_trgm", "destination_location_norm"),
+)
+
+# utils.location.normalize_location_name의 이 리비전 시점 사본 (원본을 바꿔도 수정하지 않습니다)
+_SEPARATED_SUFFIX = re.compile(r"\s+(?:\d+\s*번\s*)?(?:출구|출입구|입구|게이트|정류장|정류소|승강장|방면|앞)$")
+_ATTACHED_EXIT = re.compile(r"\d+\s*번\s*(?:출구|출입구|게이트)$")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_location_name(name: str) -> str:
+    text = unicodedata.normalize("NFKC", name)
+    text = _WHITESPACE.sub(" ", text).strip()
+
+    while True:
+        stripped = _SEPARATED_SUFFIX.sub("", text)
+        stripped = _ATTACHED_EXIT.sub("", stripped).strip()
+        if stripped == text or not stripped:
+            break
+        text = stripped
+
+    return _WHITESPACE.sub("", text).lower()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column("route", sa.Column("departure_location_norm", sa.String(), nullable=True))
+    op.add_column("route", sa.Column("destination_location_norm", sa.String(), nullable=True))
+
+    bind = op.get_bind()
+    names = bind.execute(sa.text(
+        "SELECT departure_location_name FROM route WHERE departure_location_name IS NOT NULL "
+        "UNION SELECT destination_location_name FROM route WHERE destination_location_name IS NOT NULL"
+    )).scalars().all()
+    if names:
+        op.execute("CREATE TEMP TABLE location_norm (name varchar PRIMARY KEY, norm varchar) ON COMMIT DROP")
+        bind.execute(
+            sa.text("INSERT INTO location_norm (name, norm) VALUES (:name, :norm)"),
+            [{"name": name, "norm": normalize_location_name(name)} for name in names],
+        )
+        op.execute(
+            "UPDATE route SET "
+            "departure_location_norm = dep.norm, destination_location_norm = dest.norm "
+            "FROM route AS r "
+            "LEFT JOIN location_norm AS dep ON dep.name = r.departure_location_name "
+            "LEFT JOIN location_norm AS dest ON dest.name = r.destination_location_name "
+            "WHERE route.id = r.id"
+        )
+
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_route_departure_destination_time", table_name="route", postgresql_concurrently=True)
+        op.drop_index("ix_route_destination_time", table_name="route", postgresql_concurrently=True)
+        op.create_index(
+            "ix_route_departure_destination_norm_time", "route",
+            ["departure_location_norm", "destination_location_norm", "departure_time"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_route_destination_norm_time", "route",
+            ["destination_location_norm", "departure_time"],
+            postgresql_concurrently=True,
+        )
+        for index_name, column_name in TRGM_INDEXES:
+            op.create_index(
+                index_name, "route", [column_name],
+                postgresql_using="gin", postgresql_ops={column_name: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, _ in TRGM_INDEXES:
+            op.drop_index(index_name, table_name="route", postgresql_concurrently=True)
+        op.drop_index("ix_route_destination_norm_time", table_name="route", postgresql_concurrently=True)
+        op.drop_index("ix_route_departure_destination_norm_time", table_name="route", postgresql_concurrently=True)
+        op.create_index(
+            "ix_route_departure_destination_time", "route",
+            ["departure_location_name", "destination_location_name", "departure_time"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_route_destination_time", "route",
+            ["destination_location_name", "departure_time"],
+            postgresql_concurrently=True,
+        )
+
+    op.drop_column("route", "destination_location_norm")
+    op.drop_column("route", "departure_location_norm")
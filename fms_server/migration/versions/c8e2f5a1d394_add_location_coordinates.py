@@ -0,0 +1,90 @@
+"""add location coordinates and geohash cells
+
+route의 출발지/목적지와 trip의 승차 위치에 선택적 좌표(lat/lon)와 geohash 셀 컬럼을 추가하고,
+주변 경로 검색(GET /fms/routes/nearby)용 셀 인덱스를 만듭니다.
+
+기존 행의 좌표는 오프라인 사전(utils.gazetteer)에 있는 장소명만 채웁니다.
+서로 다른 장소명만 Python에서 조회하여 임시 테이블에 적재한 뒤 UPDATE ... FROM으로 반영합니다.
+
+Revision ID: c8e2f5a1d394
+Revises: b71e4a90c2d5
+Create Date: 2026-10-18 16:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from utils.gazetteer import gazetteer
+from utils.geohash import geohash_encode
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e2f5a1d394'
+down_revision: Union[str, None] = 'b71e4a90c2d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROUTE_POINTS = ("departure", "destination")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for point in ROUTE_POINTS:
+        op.add_column("route", sa.Column(f"{point}_lat", sa.Float(), nullable=True))
+        op.add_column("route", sa.Column(f"{point}_lon", sa.Float(), nullable=True))
+        op.add_column("route", sa.Column(f"{point}_cell", sa.String(12, collation="C"), nullable=True))
+    op.add_column("trip", sa.Column("pickup_lat", sa.Float(), nullable=True))
+    op.add_column("trip", sa.Column("pickup_lon", sa.Float(), nullable=True))
+    op.add_column("trip", sa.Column("pickup_cell", sa.String(12, collation="C"), nullable=True))
+
+    bind = op.get_bind()
+    names = bind.execute(sa.text(
+        "SELECT departure_location_name FROM route WHERE departure_location_name IS NOT NULL "
+        "UNION SELECT destination_location_name FROM route WHERE destination_location_name IS NOT NULL "
+        "UNION SELECT pickup_request_location_name FROM trip WHERE pickup_request_location_name IS NOT NULL"
+    )).scalars().all()
+    points = []
+    for name in names:
+        point = gazetteer.lookup(name)
+        if point is not None:
+            points.append({"name": name, "lat": point[0], "lon": point[1], "cell": geohash_encode(*point)})
+
+    if points:
+        op.execute(
+            "CREATE TEMP TABLE location_point "
+            "(name varchar PRIMARY KEY, lat double precision, lon double precision, cell varchar) ON COMMIT DROP"
+        )
+        bind.execute(sa.text("INSERT INTO location_point VALUES (:name, :lat, :lon, :cell)"), points)
+        for point in ROUTE_POINTS:
+            op.execute(
+                f"UPDATE route SET {point}_lat = p.lat, {point}_lon = p.lon, {point}_cell = p.cell "
+                f"FROM location_point AS p WHERE p.name = route.{point}_location_name"
+            )
+        op.execute(
+            "UPDATE trip SET pickup_lat = p.lat, pickup_lon = p.lon, pickup_cell = p.cell "
+            "FROM location_point AS p WHERE p.name = trip.pickup_request_location_name"
+        )
+
+    with op.get_context().autocommit_block():
+        for point in ROUTE_POINTS:
+            op.create_index(
+                f"ix_route_{point}_cell_time", "route", [f"{point}_cell", "departure_time"],
+                postgresql_concurrently=True,
+            )
+        op.create_index("ix_trip_pickup_cell", "trip", ["pickup_cell"], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_trip_pickup_cell", table_name="trip", postgresql_concurrently=True)
+        for point in ROUTE_POINTS:
+            op.drop_index(f"ix_route_{point}_cell_time", table_name="route", postgresql_concurrently=True)
+
+    for column_name in ("pickup_cell", "pickup_lon", "pickup_lat"):
+        op.drop_column("trip", column_name)
+    for point in ROUTE_POINTS:
+        for suffix in ("cell", "lon", "lat"):
+            op.drop_column("route", f"{point}_{suffix}")
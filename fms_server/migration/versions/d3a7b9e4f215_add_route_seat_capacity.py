@@ -0,0 +1,57 @@
+"""add route seat capacity
+
+route에 정원(seat_capacity)과 예약된 좌석 수(seats_reserved) 컬럼을 추가합니다.
+여정 승인(POST /fms/trips/approve)과 매칭 엔진 적용은 이 컬럼으로 좌석을 예약하며,
+CHECK 제약 ck_route_seats_reserved가 초과 예약을 막습니다.
+
+기존 행의 seats_reserved는 경로별 승인된 여정 수로 채우고, 이미 정원(기본 4)보다 많이 승인된 경로는
+정원을 승인된 여정 수로 올려 제약을 만족시킵니다.
+제약은 NOT VALID로 추가한 뒤 별도 트랜잭션에서 VALIDATE하여, 검증 중에 route 쓰기를 막지 않습니다.
+
+Revision ID: d3a7b9e4f215
+Revises: c8e2f5a1d394
+Create Date: 2026-10-18 18:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a7b9e4f215'
+down_revision: Union[str, None] = 'c8e2f5a1d394'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DEFAULT_SEAT_CAPACITY = 4
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("route", sa.Column(
+        "seat_capacity", sa.Integer(), nullable=False, server_default=sa.text(str(DEFAULT_SEAT_CAPACITY))
+    ))
+    op.add_column("route", sa.Column("seats_reserved", sa.Integer(), nullable=False, server_default=sa.text("0")))
+
+    op.execute(
+        "UPDATE route SET seats_reserved = approved.seats, "
+        "seat_capacity = GREATEST(route.seat_capacity, approved.seats) "
+        "FROM (SELECT ride_route_id, count(*) AS seats FROM trip WHERE is_approved GROUP BY ride_route_id) AS approved "
+        "WHERE approved.ride_route_id = route.id"
+    )
+    op.execute(
+        "ALTER TABLE route ADD CONSTRAINT ck_route_seats_reserved "
+        "CHECK (seats_reserved >= 0 AND seats_reserved <= seat_capacity) NOT VALID"
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE route VALIDATE CONSTRAINT ck_route_seats_reserved")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("ck_route_seats_reserved", "route", type_="check")
+    op.drop_column("route", "seats_reserved")
+    op.drop_column("route", "seat_capacity")
@@ -0,0 +1,63 @@
+"""add trip foreign keys
+
+trip.ride_route_id → route.id, trip.passenger_id → passenger.id 외래 키를 추가합니다.
+(TripDB.route / TripDB.passenger 관계와 GET /fms/trips/details의 조인에 사용)
+
+제약은 NOT VALID로 추가하여 기존 행 검사 없이 새로 쓰는 행부터 적용하고, 별도 트랜잭션에서 VALIDATE합니다.
+참조 대상이 없는 기존 여정이 있으면 데이터를 지우지 않고 해당 제약을 NOT VALID로 남겨 두며,
+정리한 뒤 `ALTER TABLE trip VALIDATE CONSTRAINT ...`를 직접 실행하면 됩니다.
+참조 대상 쪽 조회에는 기존 인덱스 ix_trip_ride_route_approved, ix_trip_passenger_approved를 사용합니다.
+
+Revision ID: e5c1f8a2b7d6
+Revises: d3a7b9e4f215
+Create Date: 2026-10-18 20:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c1f8a2b7d6'
+down_revision: Union[str, None] = 'd3a7b9e4f215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (제약 이름, 컬럼, 참조 테이블)
+FOREIGN_KEYS = (
+    ("fk_trip_ride_route_id", "ride_route_id", "route"),
+    ("fk_trip_passenger_id", "passenger_id", "passenger"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, column, referred_table in FOREIGN_KEYS:
+        op.execute(
+            f"ALTER TABLE trip ADD CONSTRAINT {name} "
+            f"FOREIGN KEY ({column}) REFERENCES {referred_table} (id) NOT VALID"
+        )
+
+    bind = op.get_bind()
+    orphans = {
+        name: bind.execute(sa.text(
+            f"SELECT count(*) FROM trip WHERE {column} IS NOT NULL "
+            f"AND NOT EXISTS (SELECT 1 FROM {referred_table} WHERE {referred_table}.id = trip.{column})"
+        )).scalar()
+        for name, column, referred_table in FOREIGN_KEYS
+    }
+
+    with op.get_context().autocommit_block():
+        for name, _, _ in FOREIGN_KEYS:
+            if orphans[name]:
+                print(f"{name}: {orphans[name]} trips reference missing rows, leaving the constraint NOT VALID")
+                continue
+            op.execute(f"ALTER TABLE trip VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _, _ in reversed(FOREIGN_KEYS):
+        op.drop_constraint(name, "trip", type_="foreignkey")
@@ -0,0 +1,66 @@
+"""add change sync columns
+
+동기화 API(GET /fms/sync/routes, GET /fms/sync/trips)를 위해 route/trip에 행을 마지막으로 쓴 트랜잭션 ID(change_xid)와
+(change_xid, id) 인덱스를, 삭제된 경로를 전달하기 위한 route_tombstone 테이블을 추가합니다.
+
+updated_at은 애플리케이션 시각(datetime.now)이고 커밋 순서와 일치하지 않으므로 커서로 사용하지 않습니다.
+change_xid는 pg_current_xact_id()(64비트)이며, 조회 시 진행 중인 가장 오래된 트랜잭션보다 작은 값만 반환하여
+늦게 커밋된 행이 이미 지나간 커서 뒤에 끼어들지 않게 합니다. (PostgreSQL 13 이상)
+
+기존 행은 상수 기본값 0으로 채워 테이블을 다시 쓰지 않고, 이후 기본값을 현재 트랜잭션 ID로 바꿉니다.
+인덱스는 운영 중인 테이블을 잠그지 않도록 CONCURRENTLY로 생성합니다.
+
+Revision ID: f2b6d8c4a913
+Revises: e5c1f8a2b7d6
+Create Date: 2026-10-18 22:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b6d8c4a913'
+down_revision: Union[str, None] = 'e5c1f8a2b7d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CURRENT_XACT_ID = "(pg_current_xact_id()::text)::bigint"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ("route", "trip"):
+        op.add_column(table, sa.Column("change_xid", sa.BigInteger(), nullable=False, server_default=sa.text("0")))
+        op.alter_column(table, "change_xid", server_default=sa.text(CURRENT_XACT_ID))
+
+    op.create_table(
+        "route_tombstone",
+        sa.Column("id", sa.UUID(), primary_key=True),
+        sa.Column("change_xid", sa.BigInteger(), nullable=False, server_default=sa.text(CURRENT_XACT_ID)),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
+    )
+    op.create_index("ix_route_tombstone_change_xid_id", "route_tombstone", ["change_xid", "id"])
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_route_change_xid_id", "route", ["change_xid", "id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_trip_change_xid_id", "trip", ["change_xid", "id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_trip_change_xid_id", table_name="trip", postgresql_concurrently=True)
+        op.drop_index("ix_route_change_xid_id", table_name="route", postgresql_concurrently=True)
+
+    op.drop_table("route_tombstone")
+    op.drop_column("trip", "change_xid")
+    op.drop_column("route", "change_xid")
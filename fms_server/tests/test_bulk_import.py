@@ -0,0 +1,136 @@
+import asyncio
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete, select
+
+from fms_server.app.config.database import AsyncSessionLocal, async_engine
+from fms_server.app.models.model import RouteDB
+from fms_server.app.services import bulk_import_service as bulk_import_module
+from fms_server.app.services.bulk_import_service import BulkImportService, iter_lines
+from fms_server.app.services.route_cache import RouteSearchCache
+
+CSV_HEADER = "id,departure_location_name,departure_time,destination_location_name,seat_capacity"
+
+
+async def stream(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+def collect(iterator):
+    async def run():
+        return [item async for item in iterator]
+    return asyncio.run(run())
+
+def parse(body, content_type="text/csv"):
+    rows = collect(BulkImportService(session=None)._parse(stream(body.encode()), content_type))
+    return [(line_no, parsed if isinstance(parsed, str) else parsed.departure_location_name) for line_no, parsed in rows]
+
+def test_lines_are_split_across_chunks():
+    encoded = "한".encode()
+    lines = collect(iter_lines(stream(b"\xef\xbb\xbfa,b\r\n", b"c,", encoded[:2], encoded[2:] + b"\n\n", b"last")))
+
+    # BOM과 CR은 제거하고, 빈 줄은 건너뛰되 줄 번호는 셉니다.
+    assert lines == [(1, "a,b"), (2, "c,한"), (4, "last")]
+
+def test_csv_rows_are_validated_per_line():
+    rows = parse("\n".join([
+        "departure_location_name,departure_time,destination_location_name",
+        "서울역,2025-03-03T07:30:00,부산역",
+        "서울역,2025-03-03T07:30:00",
+        "서울역,not-a-time,부산역",
+        '"서울역, 1번 출구",2025-03-03T07:30:00,부산역',
+        'a,"b"c,d',
+    ]))
+
+    assert rows[0] == (2, "서울역")
+    assert rows[1] == (3, "expected 3 columns, got 2")
+    assert rows[2][0] == 4 and rows[2][1].startswith("departure_time:")
+    assert rows[3] == (5, "서울역, 1번 출구")
+    assert rows[4][0] == 6 and rows[4][1].startswith("invalid CSV row:")
+
+def test_quoted_csv_field_spanning_lines_is_rejected():
+    rows = parse("\n".join([
+        "departure_location_name,departure_time,destination_location_name",
+        '"서울역',
+        '1번 출구",2025-03-03T07:30:00,부산역',
+        "시청,2025-03-03T08:00:00,부산역",
+    ]))
+
+    # 필드가 닫히는 줄까지 오류로 처리하여 잘린 값이나 나머지 줄이 행으로 등록되지 않습니다.
+    assert rows == [
+        (2, "quoted field spans lines (not supported)"),
+        (3, "quoted field from line 2 spans lines (not supported)"),
+        (4, "시청"),
+    ]
+
+def test_ndjson_rows_are_validated_per_line():
+    rows = parse("\n".join([
+        json.dumps({"departure_location_name": "서울역", "departure_time": "2025-03-03T07:30:00", "destination_location_name": "부산역"}),
+        "{not json",
+        json.dumps({"departure_location_name": "서울역", "departure_time": "2025-03-03T07:30:00"}),
+    ]), "application/x-ndjson")
+
+    assert rows[0] == (1, "서울역")
+    assert rows[1][0] == 2
+    assert rows[2] == (3, "destination_location_name: Field required")
+
+def test_unsupported_content_type_is_rejected():
+    with pytest.raises(ValueError):
+        asyncio.run(BulkImportService(session=None).import_routes(stream(b""), "application/json"))
+
+
+async def import_body(body, content_type):
+    async with AsyncSessionLocal() as session:
+        return await BulkImportService(session).import_routes(stream(body.encode()), content_type)
+
+async def run_imports(tag, route_id):
+    destination = f"학교{tag}"
+    csv_body = "\n".join([
+        CSV_HEADER,
+        f"{route_id},서울역 1번 출구,2025-03-03T07:30:00,{destination},2",
+        f",시청 앞,2025-03-03T07:40:00,{destination},4",
+        # 같은 id가 다시 나오면 마지막 행을 사용합니다.
+        f"{route_id},서울역 2번 출구,2025-03-03T07:50:00,{destination},3",
+        f",시청,not-a-time,{destination},4",
+    ])
+    ndjson_body = "\n".join([
+        json.dumps({"id": str(route_id), "departure_location_name": "강남역", "departure_time": "2025-03-03T08:00:00",
+                    "destination_location_name": destination, "seat_capacity": 5}),
+        "{not json",
+    ])
+    try:
+        results = [await import_body(csv_body, "text/csv")]
+        async with AsyncSessionLocal() as session:
+            after_csv = (await session.get(RouteDB, route_id)).departure_location_norm
+        results.append(await import_body(ndjson_body, "application/x-ndjson"))
+        async with AsyncSessionLocal() as session:
+            routes = (await session.scalars(select(RouteDB).where(RouteDB.destination_location_name == destination))).all()
+            rows = {route.id == route_id: route for route in routes}
+        return results, after_csv, rows
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(RouteDB).where(RouteDB.destination_location_name == destination))
+            await session.commit()
+        await async_engine.dispose()
+
+def test_import_upserts_routes_and_clears_the_route_cache(test_db, monkeypatch):
+    cache = RouteSearchCache(maxsize=10, ttl=60)
+    monkeypatch.setattr(bulk_import_module, "route_cache", cache)
+    cache.set("cached", 1)
+    route_id = uuid4()
+
+    (first, second), after_csv, rows = asyncio.run(run_imports(uuid4().hex, route_id))
+
+    assert (first.inserted, first.updated, first.failed) == (2, 0, 1)
+    assert [error.line for error in first.errors] == [5]
+    assert after_csv == "서울역"
+    assert (second.inserted, second.updated, second.failed) == (0, 1, 1)
+    assert [error.line for error in second.errors] == [2]
+
+    updated, other = rows[True], rows[False]
+    assert (updated.departure_location_name, updated.departure_location_norm, updated.seat_capacity) == ("강남역", "강남역", 5)
+    # ORM 이벤트를 거치지 않는 COPY 경로에서도 정규화 이름을 채웁니다.
+    assert other.departure_location_norm == "시청"
+    assert cache.get("cached") is None
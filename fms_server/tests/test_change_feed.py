@@ -0,0 +1,157 @@
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fms_server.app.config.database import AsyncSessionLocal, async_engine
+from fms_server.app.domains.route import Route
+from fms_server.app.models.model import DEFAULT_SEAT_CAPACITY, RouteDB
+from fms_server.app.services import async_fms_service as async_fms_service_module
+from fms_server.app.services.change_feed import ChangeFeed, ChangeFilter, ChangeMessage, Subscription, route_change, trip_change
+from fms_server.app.services.route_cache import RouteSnapshot
+
+
+async def never_connect():
+    await asyncio.Event().wait()
+
+def payload(change):
+    return json.dumps(change, ensure_ascii=False)
+
+def make_trip(route_id, passenger_id, location="보건소"):
+    return SimpleNamespace(
+        id=uuid4(),
+        ride_route_id=route_id,
+        passenger_id=passenger_id,
+        pickup_request_location_name=location,
+        pickup_time=datetime(2025, 3, 3, 7, 0),
+        is_approved=True,
+    )
+
+def test_route_change_lists_locations_before_and_after_update():
+    route = SimpleNamespace(
+        id=uuid4(),
+        departure_location_name="시장",
+        departure_time=datetime(2025, 3, 3, 7, 30),
+        destination_location_name="읍사무소",
+        seat_capacity=4,
+    )
+    before = SimpleNamespace(**{**vars(route), "departure_location_name": "보건소"})
+
+    change = route_change("updated", route, RouteSnapshot.of(before))
+    assert change["id"] == str(route.id)
+    assert set(change["locations"]) == {"시장", "읍사무소", "보건소"}
+
+def test_async_create_route_notifies_after_the_insert(test_db, monkeypatch):
+    notified = []
+
+    async def record(session, changes):
+        # 알림을 만들 때 경로가 이미 INSERT되어 있어야 합니다. (session.new가 비어 있음)
+        notified.append((list(session.new), changes))
+
+    async def create():
+        try:
+            async with AsyncSessionLocal() as session:
+                service = async_fms_service_module.AsyncFmsService(session)
+                route = await service.create_route(Route(
+                    departure_location_name="시장 앞",
+                    departure_time=datetime(2025, 3, 3, 7, 30),
+                    destination_location_name="읍사무소",
+                ))
+                await session.delete(await session.get(RouteDB, route.id))
+                await session.commit()
+            return route
+        finally:
+            await async_engine.dispose()
+
+    monkeypatch.setattr(async_fms_service_module, "notify_changes", record)
+    route = asyncio.run(create())
+
+    [(pending, [change])] = notified
+    assert pending == []
+    assert change["id"] == str(route.id)
+    assert change["seat_capacity"] == DEFAULT_SEAT_CAPACITY
+    assert set(change["locations"]) == {"시장", "읍사무소"}
+
+def test_filters_are_combined():
+    route_id, passenger_id = uuid4(), uuid4()
+    feed = ChangeFeed(never_connect)
+
+    async def run():
+        subscriptions = {
+            "all": feed.subscribe(ChangeFilter.of()),
+            "route": feed.subscribe(ChangeFilter.of(route_id=route_id)),
+            "passenger": feed.subscribe(ChangeFilter.of(passenger_id=passenger_id)),
+            "location": feed.subscribe(ChangeFilter.of(location="보건소 정류장")),
+            "routes_only": feed.subscribe(ChangeFilter.of(entity="route")),
+        }
+        feed.publish(payload(trip_change("approved", make_trip(route_id, passenger_id))))
+        feed.publish(payload(trip_change("created", make_trip(uuid4(), uuid4(), "시장"))))
+        received = {}
+        for name, subscription in subscriptions.items():
+            messages = []
+            while (message := await subscription.get(0.01)) is not None:
+                messages.append(json.loads(message.data)["ride_route_id"])
+            received[name] = messages
+        await feed.close()
+        return received
+
+    received = asyncio.run(run())
+    assert len(received["all"]) == 2
+    assert received["route"] == [str(route_id)]
+    assert received["passenger"] == [str(route_id)]
+    assert received["location"] == [str(route_id)]
+    assert received["routes_only"] == []
+    assert feed.stats()["delivered"] == 5
+
+def test_bulk_import_reaches_route_and_location_subscribers_only():
+    feed = ChangeFeed(never_connect)
+
+    async def run():
+        by_location = feed.subscribe(ChangeFilter.of(location="보건소"))
+        by_passenger = feed.subscribe(ChangeFilter.of(passenger_id=uuid4()))
+        feed.publish(payload({"entity": "route", "op": "imported", "inserted": 3, "updated": 0}))
+        result = (await by_location.get(0.01), await by_passenger.get(0.01))
+        await feed.close()
+        return result
+
+    location_message, passenger_message = asyncio.run(run())
+    assert location_message.event == "change"
+    assert passenger_message is None
+
+def test_slow_subscriber_gets_one_lagged_message():
+    async def run():
+        subscription = Subscription(ChangeFilter(), maxsize=2)
+        discarded = [subscription.offer(ChangeMessage("change", str(i))) for i in range(5)]
+        messages = []
+        while (message := await subscription.get(0.01)) is not None:
+            messages.append(message)
+        # lagged를 받은 뒤에는 다시 정상적으로 전달됩니다.
+        subscription.offer(ChangeMessage("change", "5"))
+        return discarded, messages, await subscription.get(0.01)
+
+    discarded, messages, after = asyncio.run(run())
+    assert discarded == [0, 0, 3, 0, 2]
+    assert [message.event for message in messages] == ["lagged"]
+    assert json.loads(messages[0].data) == {"dropped": 5}
+    assert after == ChangeMessage("change", "5")
+
+def test_malformed_payload_is_counted_and_skipped():
+    feed = ChangeFeed(never_connect)
+    feed.publish("not json")
+    feed.publish("[1, 2]")
+    assert feed.stats()["malformed"] == 2
+
+def test_subscriber_limit():
+    feed = ChangeFeed(never_connect, max_subscribers=1)
+
+    async def run():
+        first = feed.subscribe(ChangeFilter())
+        second = feed.subscribe(ChangeFilter())
+        feed.unsubscribe(first)
+        third = feed.subscribe(ChangeFilter())
+        await feed.close()
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+    assert first is not None and second is None and third is not None
@@ -0,0 +1,32 @@
+import math
+
+from fms_server.app.utils.gazetteer import gazetteer
+from fms_server.app.utils.geohash import METERS_PER_DEGREE, covering_cells, geohash_encode
+
+
+def distance_m(lat1, lon1, lat2, lon2):
+    x = math.radians(lon2 - lon1) * math.cos(math.radians((lat1 + lat2) / 2))
+    y = math.radians(lat2 - lat1)
+    return math.hypot(x, y) * METERS_PER_DEGREE * 180 / math.pi
+
+def test_geohash_encode_known_value():
+    assert geohash_encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    assert geohash_encode(None, 126.97) is None
+
+def test_covering_cells_contain_points_within_radius():
+    lat, lon, radius_m = 37.5547, 126.9707, 800
+    cells = covering_cells(lat, lon, radius_m)
+
+    for bearing in range(0, 360, 15):
+        point_lat = lat + radius_m * 0.99 * math.cos(math.radians(bearing)) / METERS_PER_DEGREE
+        point_lon = lon + radius_m * 0.99 * math.sin(math.radians(bearing)) / (METERS_PER_DEGREE * math.cos(math.radians(lat)))
+        assert distance_m(lat, lon, point_lat, point_lon) <= radius_m
+        assert any(geohash_encode(point_lat, point_lon).startswith(cell) for cell in cells)
+
+def test_covering_cells_shrink_with_radius():
+    assert len(covering_cells(37.5547, 126.9707, 100)[0]) > len(covering_cells(37.5547, 126.9707, 5000)[0])
+
+def test_gazetteer_resolves_normalized_names_and_prefers_given_coordinates():
+    assert gazetteer.resolve("서울역 1번 출구", None, None) == gazetteer.lookup("서울역")
+    assert gazetteer.resolve("서울역", 1.0, 2.0) == (1.0, 2.0)
+    assert gazetteer.resolve("없는 장소", None, None) == (None, None)
@@ -0,0 +1,35 @@
+import unicodedata
+
+from fms_server.app.utils.location import normalize_location_name
+
+
+def test_spacing_and_exit_variants_share_one_key():
+    assert normalize_location_name("서울역") == "서울역"
+    assert normalize_location_name("서울 역") == "서울역"
+    assert normalize_location_name("서울역 1번 출구") == "서울역"
+    assert normalize_location_name("  서울역\t 1 번  출구 ") == "서울역"
+    assert normalize_location_name(None) is None
+
+def test_nfkc_joins_jamo_and_folds_full_width_characters():
+    # 분리된(NFD) 한글 자모는 완성형 음절로 합칩니다.
+    assert normalize_location_name(unicodedata.normalize("NFD", "서울역")) == "서울역"
+    # 전각 영숫자/공백은 반각으로 바꾼 뒤 소문자화합니다.
+    assert normalize_location_name("ＫＴＸ　광명역") == "ktx광명역"
+    assert normalize_location_name("강남역 ２번 출구") == "강남역"
+
+def test_separated_suffixes_are_removed_repeatedly():
+    assert normalize_location_name("시청 앞") == "시청"
+    assert normalize_location_name("터미널 정류장") == "터미널"
+    assert normalize_location_name("판교역 방면 승강장") == "판교역"
+    assert normalize_location_name("인천공항 게이트") == "인천공항"
+
+def test_attached_suffixes_are_kept_except_exit_numbers():
+    # 붙어 있는 출구 번호 표기는 제거합니다.
+    assert normalize_location_name("서울역1번출구") == "서울역"
+    # 고유 명칭의 일부인 접미사는 그대로 둡니다.
+    assert normalize_location_name("서울대입구") == "서울대입구"
+    assert normalize_location_name("시청앞") == "시청앞"
+
+def test_suffix_only_name_is_kept():
+    assert normalize_location_name("정류장") == "정류장"
+    assert normalize_location_name(" 앞 ") == "앞"
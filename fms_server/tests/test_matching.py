@@ -0,0 +1,65 @@
+import numpy as np
+
+from fms_server.app.services.matching_service import MatchingParams, RouteCandidates, TripCandidates, solve_matching
+
+
+def make_trips(pickup_minutes, names, requested=None, lat=None, lon=None):
+    n = len(pickup_minutes)
+    return TripCandidates(
+        pickup_minutes=np.array(pickup_minutes, dtype=np.float64),
+        lat=np.array(lat if lat is not None else [np.nan] * n, dtype=np.float64),
+        lon=np.array(lon if lon is not None else [np.nan] * n, dtype=np.float64),
+        name_code=np.array(names, dtype=np.int64),
+        requested_route=np.array(requested if requested is not None else [-1] * n, dtype=np.int64),
+    )
+
+def make_routes(departure_minutes, names, seats, lat=None, lon=None):
+    m = len(departure_minutes)
+    return RouteCandidates(
+        departure_minutes=np.array(departure_minutes, dtype=np.float64),
+        lat=np.array(lat if lat is not None else [np.nan] * m, dtype=np.float64),
+        lon=np.array(lon if lon is not None else [np.nan] * m, dtype=np.float64),
+        name_code=np.array(names, dtype=np.int64),
+        capacity=np.array(seats, dtype=np.int64),
+        remaining=np.array(seats, dtype=np.int64),
+    )
+
+def test_respects_remaining_seats_and_time_window():
+    trips = make_trips([0, 1, 2, 100], [0, 0, 0, 0])
+    routes = make_routes([0, 10], [0, 0], [2, 1])
+
+    pairs = solve_matching(trips, routes, MatchingParams(time_window_minutes=30))
+
+    assert sorted(trip for trip, _, _ in pairs) == [0, 1, 2]
+    assert [route for _, route, _ in pairs].count(0) == 2
+    assert [route for _, route, _ in pairs].count(1) == 1
+
+def test_location_name_must_match_without_coordinates():
+    trips = make_trips([0, 0], [0, 1])
+    routes = make_routes([0], [0], [4])
+
+    assert [(trip, route) for trip, route, _ in solve_matching(trips, routes)] == [(0, 0)]
+
+def test_uses_distance_when_coordinates_exist():
+    # 장소명은 달라도 500m 거리면 배정되고, 5km 거리는 제외됩니다.
+    trips = make_trips([0, 0], [0, 1], lat=[37.5547, 37.5547], lon=[126.9707, 126.9707])
+    routes = make_routes([0, 0], [2, 3], [1, 1], lat=[37.5592, 37.6000], lon=[126.9707, 126.9707])
+
+    pairs = solve_matching(trips, routes, MatchingParams(max_distance_m=1000))
+
+    assert len(pairs) == 1
+    assert pairs[0][1] == 0
+
+def test_trip_retries_next_route_when_top_candidates_fill_up():
+    trips = make_trips([0, 0, 0], [0, 0, 0])
+    routes = make_routes([0, 5, 10], [0, 0, 0], [1, 1, 1])
+
+    pairs = solve_matching(trips, routes, MatchingParams(top_k=1))
+
+    assert sorted(route for _, route, _ in pairs) == [0, 1, 2]
+
+def test_prefers_requested_route():
+    trips = make_trips([5], [0], requested=[1])
+    routes = make_routes([4, 6], [0, 0], [4, 4])
+
+    assert solve_matching(trips, routes)[0][1] == 1
@@ -0,0 +1,35 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from fms_server.app.main import app
+from services.auth_service import AuthService
+from utils import security
+
+OPERATOR_PATHS = ["/metrics", "/fms/internal/cache", "/fms/internal/slow-queries"]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(security, "OPERATOR_TOKEN", "operator-secret")
+    return TestClient(app)
+
+@pytest.mark.parametrize("path", OPERATOR_PATHS)
+def test_operator_endpoints_require_the_operator_token(client, path):
+    passenger_token = AuthService(session=None).create_access_token({"sub": "kim"})
+
+    assert client.get(path).status_code == 401
+    assert client.get(path, headers={"Authorization": f"Bearer {passenger_token}"}).status_code == 403
+    assert client.get(path, headers={"Authorization": "Bearer operator-secret"}).status_code == 200
+
+def test_operator_endpoints_are_closed_without_a_configured_token(client, monkeypatch):
+    monkeypatch.setattr(security, "OPERATOR_TOKEN", "")
+
+    assert client.get("/metrics", headers={"Authorization": "Bearer "}).status_code == 403
+    assert client.get("/metrics", headers={"Authorization": "Bearer anything"}).status_code == 403
+
+def test_n_plus_one_logging_is_not_changeable_over_http(client):
+    response = client.put(
+        "/fms/internal/n-plus-one", params={"enabled": "true"}, headers={"Authorization": "Bearer operator-secret"}
+    )
+
+    assert response.status_code in (404, 405)
@@ -0,0 +1,39 @@
+import asyncio
+
+from passlib.hash import pbkdf2_sha256
+
+from fms_server.app.utils.password import (
+    PASSWORD_HASH_ROUNDS,
+    hash_password,
+    verify_password,
+    verify_password_async,
+)
+
+
+def test_current_rounds_hash_is_not_rehashed():
+    hashed = hash_password("secret")
+
+    assert f"$pbkdf2-sha256${PASSWORD_HASH_ROUNDS}$" in hashed
+    assert verify_password("secret", hashed) == (True, None)
+
+def test_hash_with_old_rounds_is_rehashed_on_verify():
+    old_hash = pbkdf2_sha256.using(rounds=1000).hash("secret")
+
+    verified, new_hash = verify_password("secret", old_hash)
+    assert verified
+    assert f"$pbkdf2-sha256${PASSWORD_HASH_ROUNDS}$" in new_hash
+    assert verify_password("secret", new_hash) == (True, None)
+
+def test_wrong_password_or_unknown_hash_fails():
+    old_hash = pbkdf2_sha256.using(rounds=1000).hash("secret")
+
+    assert verify_password("wrong", old_hash) == (False, None)
+    assert verify_password("secret", "not-a-hash") == (False, None)
+
+def test_async_verify_runs_in_pool():
+    hashed = hash_password("secret")
+
+    async def verify_many():
+        return await asyncio.gather(*(verify_password_async("secret", hashed) for _ in range(4)))
+
+    assert asyncio.run(verify_many()) == [(True, None)] * 4
@@ -0,0 +1,69 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from fms_server.app.config.pool_metrics import Histogram, PoolMetrics
+
+
+def instrumented_engine(metrics, pool_size=1, max_overflow=0, pool_timeout=0.05):
+    engine = create_engine(
+        "sqlite://",
+        poolclass=metrics.pool_class(QueuePool),
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+    )
+    metrics.instrument(engine)
+    return engine
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((1, 10, 100))
+    for value in (0.5, 1, 5, 50, 500):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert [bucket["count"] for bucket in snapshot["buckets"]] == [2, 3, 4, 5]
+    assert snapshot["buckets"][-1]["le"] == "+Inf"
+    assert snapshot["count"] == 5
+    assert snapshot["max"] == 500
+
+def test_checkout_wait_hold_and_age_are_recorded():
+    metrics = PoolMetrics("test")
+    engine = instrumented_engine(metrics)
+
+    with engine.connect() as connection:
+        connection.execute(text("select 1"))
+        stats = metrics.stats()
+        assert stats["checked_out"] == 1
+        assert stats["overflow"] == 0
+        assert stats["connection_age_seconds"]["count"] == 1
+
+    stats = metrics.stats()
+    assert stats["checkouts"] == 1
+    assert stats["connects"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["wait_ms"]["count"] == 1
+    assert stats["hold_ms"]["count"] == 1
+
+def test_pool_timeout_is_counted():
+    metrics = PoolMetrics("test")
+    engine = instrumented_engine(metrics)
+
+    with engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    stats = metrics.stats()
+    assert stats["timeouts"] == 1
+    assert stats["wait_ms"]["count"] == 2
+    assert stats["wait_ms"]["max"] >= 50
+
+def test_closed_connections_leave_age_stats():
+    metrics = PoolMetrics("test")
+    engine = instrumented_engine(metrics)
+    with engine.connect():
+        pass
+
+    engine.dispose()
+    assert metrics.stats()["connection_age_seconds"]["count"] == 0
@@ -0,0 +1,35 @@
+from fms_server.app.services.profile_cache import PassengerProfile, PassengerProfileCache, etag_matches
+
+
+def test_etag_is_strong_and_depends_on_body():
+    profile = PassengerProfile.of(b'{"nickname":"kim"}')
+
+    assert profile.etag.startswith('"') and not profile.etag.startswith("W/")
+    assert PassengerProfile.of(b'{"nickname":"kim"}').etag == profile.etag
+    assert PassengerProfile.of(b'{"nickname":"lee"}').etag != profile.etag
+
+def test_if_none_match_parsing():
+    etag = PassengerProfile.of(b"{}").etag
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+def test_invalidate_drops_only_that_passenger():
+    cache = PassengerProfileCache(maxsize=10, ttl=60)
+    cache.set("kim", PassengerProfile.of(b"kim"))
+    cache.set("lee", PassengerProfile.of(b"lee"))
+
+    cache.invalidate("kim")
+    assert cache.get("kim") is None
+    assert cache.get("lee").body == b"lee"
+    assert cache.stats()["invalidations"] == 1
+
+def test_expired_profile_is_a_miss():
+    cache = PassengerProfileCache(maxsize=10, ttl=0)
+    cache.set("kim", PassengerProfile.of(b"kim"))
+
+    assert cache.get("kim") is None
+    assert (cache.hits, cache.misses) == (0, 1)
@@ -0,0 +1,89 @@
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, text
+
+from fms_server.app.config.pool_metrics import PoolMetrics
+from fms_server.app.config.request_metrics import RequestMetrics, RequestMetricsMiddleware, parameter_shape
+
+
+def make_app(engine, path, queries):
+    """scope["route"]를 설정하고 queries만큼 SQL을 실행한 뒤 200을 응답하는 ASGI 앱 (FastAPI 라우팅 대신)"""
+    async def app(scope, receive, send):
+        scope["route"] = SimpleNamespace(path=path)
+        with engine.connect() as connection:
+            for i in range(queries):
+                connection.execute(text("select :id"), {"id": i})
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+    return app
+
+def call(middleware, path="/items/1"):
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        pass
+
+    asyncio.run(middleware({"type": "http", "method": "GET", "path": path}, receive, send))
+
+def test_sql_statements_are_counted_per_request_and_route():
+    metrics = RequestMetrics(slow_query_seconds=60)
+    engine = metrics.instrument(create_engine("sqlite://"))
+    middleware = RequestMetricsMiddleware(make_app(engine, "/items/{item_id}", queries=3), metrics)
+
+    call(middleware)
+    call(middleware)
+    # 요청 밖에서 실행한 SQL은 요청별 집계에 포함되지 않습니다.
+    with engine.connect() as connection:
+        connection.execute(text("select 1"))
+
+    statements = metrics.request_statements[("/items/{item_id}",)]
+    assert (statements.count, statements.sum) == (2, 6)
+    assert metrics.latency[("GET", "/items/{item_id}")].count == 2
+    assert metrics.requests[("GET", "/items/{item_id}", "200")] == 2
+    assert metrics.statement_seconds[("SELECT",)].count == 7
+    assert metrics.in_flight == 0
+    assert metrics.slow_query_samples() == []
+
+def test_slow_queries_keep_parameter_shapes_not_values():
+    metrics = RequestMetrics(slow_query_seconds=0, slow_query_samples=2)
+    engine = metrics.instrument(create_engine("sqlite://"))
+    call(RequestMetricsMiddleware(make_app(engine, "/items/{item_id}", queries=3), metrics))
+
+    samples = metrics.slow_query_samples()
+    assert len(samples) == 2
+    assert samples[0]["route"] == "/items/{item_id}"
+    assert samples[0]["parameters"] == ["int"]
+    assert metrics.slow_statements == 3
+
+    assert parameter_shape({"ids": [1, 2, 3], "name": "비밀"}) == {"ids": "list[3]", "name": "str"}
+    assert parameter_shape([("a", 1), ("b", 2)], executemany=True) == {"executemany": 2, "row": ["str", "int"]}
+
+def test_repeated_statements_are_logged_as_n_plus_one(capsys):
+    metrics = RequestMetrics(slow_query_seconds=60, n_plus_one_threshold=5)
+    engine = metrics.instrument(create_engine("sqlite://"))
+
+    call(RequestMetricsMiddleware(make_app(engine, "/items", queries=5), metrics))
+    assert capsys.readouterr().out == ""
+
+    metrics.log_n_plus_one = True
+    call(RequestMetricsMiddleware(make_app(engine, "/items", queries=4), metrics))
+    call(RequestMetricsMiddleware(make_app(engine, "/items", queries=5), metrics))
+    assert capsys.readouterr().out == "N+1 suspected: GET /items executed 5x: select ?\n"
+    assert metrics.n_plus_one_requests == 1
+
+def test_prometheus_text_has_cumulative_buckets_and_escaped_labels():
+    metrics = RequestMetrics(slow_query_seconds=60)
+    engine = metrics.instrument(create_engine("sqlite://"))
+    call(RequestMetricsMiddleware(make_app(engine, '/odd"path', queries=1), metrics))
+    pool = PoolMetrics("primary")
+    pool.wait_ms.observe(3)
+
+    lines = metrics.render_prometheus([pool]).splitlines()
+    assert 'fms_http_requests_total{method="GET",route="/odd\\"path",status="200"} 1' in lines
+    assert 'fms_http_request_sql_statements_bucket{route="/odd\\"path",le="0"} 0' in lines
+    assert 'fms_http_request_sql_statements_bucket{route="/odd\\"path",le="1"} 1' in lines
+    assert 'fms_http_request_sql_statements_bucket{route="/odd\\"path",le="+Inf"} 1' in lines
+    assert 'fms_db_pool_wait_milliseconds_bucket{pool="primary",le="5"} 1' in lines
+    assert 'fms_db_pool_timeouts_total{pool="primary"} 0' in lines
@@ -0,0 +1,159 @@
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fms_server.app.domains.route import Route
+from fms_server.app.services import fms_service as fms_service_module
+from fms_server.app.services.fms_service import FmsService
+from fms_server.app.services.route_cache import RouteSearchCache, RouteSnapshot, route_filter
+
+
+def morning_filter():
+    return route_filter(
+        start_time=datetime(2025, 3, 1, 7, 0),
+        end_time=datetime(2025, 3, 1, 9, 0),
+        departure_location_name=" 마을 회관 ",
+        destination_location_name="시내 버스 터미널",
+    )
+
+def snapshot(departure_time, departure_location_name, destination_location_name):
+    return RouteSnapshot.of(SimpleNamespace(
+        departure_time=departure_time,
+        departure_location_name=departure_location_name,
+        destination_location_name=destination_location_name,
+    ))
+
+def test_route_filter_normalizes_location_names():
+    assert morning_filter() == route_filter(
+        datetime(2025, 3, 1, 7, 0), datetime(2025, 3, 1, 9, 0), "마을회관 정류장", "시내 버스 터미널"
+    )
+
+def test_hit_and_miss_counters():
+    cache = RouteSearchCache(maxsize=10, ttl=60)
+    key = ("list", morning_filter())
+
+    assert cache.get(key) is None
+    cache.set(key, ["route"], route_filter=morning_filter())
+    assert cache.get(key) == ["route"]
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+def test_write_inside_window_invalidates_overlapping_entry():
+    cache = RouteSearchCache(maxsize=10, ttl=60)
+    key = ("list", morning_filter())
+    cache.set(key, [], route_filter=morning_filter())
+
+    cache.invalidate_route(uuid4(), snapshot(datetime(2025, 3, 1, 8, 0), "마을 회관", "시내 버스 터미널"))
+
+    assert cache.get(key) is None
+    assert cache.stats()["invalidations"] == 1
+
+def test_write_outside_window_or_location_keeps_entry():
+    cache = RouteSearchCache(maxsize=10, ttl=60)
+    key = ("list", morning_filter())
+    cache.set(key, [], route_filter=morning_filter())
+
+    cache.invalidate_route(uuid4(), snapshot(datetime(2025, 3, 1, 18, 0), "마을 회관", "시내 버스 터미널"))
+    cache.invalidate_route(uuid4(), snapshot(datetime(2025, 3, 1, 8, 0), "서울역", "시내 버스 터미널"))
+
+    assert cache.get(key) == []
+
+def test_update_invalidates_old_and_new_values_and_single_route_entry():
+    cache = RouteSearchCache(maxsize=10, ttl=60)
+    route_id = uuid4()
+    cache.set(("list", morning_filter()), [], route_filter=morning_filter())
+    cache.set(("route", route_id), "route", route_id=route_id)
+
+    # 검색 범위 밖에서 안으로 옮겨진 경우에도 무효화되어야 합니다.
+    cache.invalidate_route(
+        route_id,
+        snapshot(datetime(2025, 3, 2, 8, 0), "마을 회관", "시내 버스 터미널"),
+        snapshot(datetime(2025, 3, 1, 8, 0), "마을 회관", "시내 버스 터미널"),
+    )
+
+    assert cache.get(("list", morning_filter())) is None
+    assert cache.get(("route", route_id)) is None
+
+def test_lru_eviction():
+    cache = RouteSearchCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+def test_fill_started_before_overlapping_invalidation_is_dropped():
+    cache = RouteSearchCache(maxsize=10, ttl=60)
+    key = ("list", morning_filter())
+    token = cache.begin_fill()
+
+    # 조회 중에 다른 요청이 범위 안의 경로를 쓰고 무효화한 경우
+    cache.invalidate_route(uuid4(), snapshot(datetime(2025, 3, 1, 8, 0), "마을 회관", "시내 버스 터미널"))
+    cache.set(key, ["stale"], route_filter=morning_filter(), token=token)
+
+    assert cache.get(key) is None
+    assert cache.stats()["stale_fills"] == 1
+
+def test_fill_after_unrelated_invalidation_is_kept():
+    cache = RouteSearchCache(maxsize=10, ttl=60)
+    key = ("list", morning_filter())
+    token = cache.begin_fill()
+
+    cache.invalidate_route(uuid4(), snapshot(datetime(2025, 3, 1, 18, 0), "마을 회관", "시내 버스 터미널"))
+    cache.set(key, ["route"], route_filter=morning_filter(), token=token)
+
+    assert cache.get(key) == ["route"]
+
+def test_replica_fill_within_lag_of_overlapping_invalidation_is_dropped():
+    cache = RouteSearchCache(maxsize=10, ttl=60, replica_lag=5)
+    route_id = uuid4()
+    cache.invalidate_route(route_id, snapshot(datetime(2025, 3, 1, 8, 0), "마을 회관", "시내 버스 터미널"))
+
+    # 무효화 뒤에 시작했더라도 복제본은 아직 쓰기 전의 행을 반환할 수 있습니다.
+    token = cache.begin_fill()
+    cache.set(("route", route_id), "stale", route_id=route_id, token=token, replica=True)
+    cache.set(("route", route_id), "fresh", route_id=route_id, token=token)
+
+    assert cache.get(("route", route_id)) == "fresh"
+    assert cache.stats()["stale_fills"] == 1
+
+def test_fill_is_dropped_when_invalidation_history_overflowed():
+    cache = RouteSearchCache(maxsize=10, ttl=60, history=2)
+    token = cache.begin_fill()
+    for _ in range(3):
+        cache.invalidate_route(uuid4(), snapshot(datetime(2025, 3, 1, 18, 0), "서울역", "부산역"))
+
+    cache.set("a", 1, token=token)
+
+    assert cache.get("a") is None
+
+def test_sync_service_writes_invalidate_cached_searches(db_session, monkeypatch):
+    cache = RouteSearchCache(maxsize=10, ttl=60)
+    monkeypatch.setattr(fms_service_module, "route_cache", cache)
+    service = FmsService(db_session)
+    key = ("list", morning_filter())
+    route = Route(departure_location_name="마을 회관", departure_time=datetime(2025, 3, 1, 8, 0), destination_location_name="시내 버스 터미널")
+
+    cache.set(key, [], route_filter=morning_filter())
+    created = service.create_route(route)
+    assert cache.get(key) is None
+
+    cache.set(key, [created], route_filter=morning_filter())
+    cache.set(("route", created.id), created, route_id=created.id)
+    service.update_ride_route(created.id, route.model_copy(update={"departure_time": datetime(2025, 3, 1, 18, 0)}))
+    assert cache.get(key) is None
+    assert cache.get(("route", created.id)) is None
+
+    evening = route_filter(datetime(2025, 3, 1, 17, 0), datetime(2025, 3, 1, 19, 0), "마을 회관", "시내 버스 터미널")
+    cache.set(("list", evening), [created], route_filter=evening)
+    cache.set(key, [], route_filter=morning_filter())
+    assert service.delete_ride_route(created.id) is True
+    assert cache.get(("list", evening)) is None
+    # 삭제 전의 값(18시)은 아침 검색 범위 밖이므로 유지됩니다.
+    assert cache.get(key) == []
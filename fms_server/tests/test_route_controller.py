@@ -0,0 +1,37 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from config.database import async_engine
+
+
+def test_controllers_use_the_test_database_session(authorized_client):
+    checkouts = []
+
+    def count(*args):
+        checkouts.append(args)
+
+    departure = f"정류장{uuid4().hex}"
+    event.listen(async_engine.sync_engine, "checkout", count)
+    try:
+        created = authorized_client.post("/fms/routes/", json={
+            "departure_location_name": departure,
+            "departure_time": "2025-03-03T07:30:00",
+            "destination_location_name": "초등학교",
+        })
+        found = authorized_client.get("/fms/routes/", params={"departure_location_name": departure})
+    finally:
+        event.remove(async_engine.sync_engine, "checkout", count)
+
+    assert created.status_code == 200
+    assert [item["id"] for item in found.json()["items"]] == [created.json()["id"]]
+    # 쓰기/조회 모두 재정의한 세션을 사용하고 애플리케이션 엔진의 커넥션은 사용하지 않습니다.
+    assert checkouts == []
+
+@pytest.mark.parametrize("params", [{"stream": "true"}, {"cursor": "abc"}])
+def test_fuzzy_match_rejects_stream_and_cursor(authorized_client, params):
+    response = authorized_client.get("/fms/routes/", params={"match": "fuzzy", "departure_location_name": "서울역", **params})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "match=fuzzy cannot be combined with stream or cursor"
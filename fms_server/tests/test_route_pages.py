@@ -0,0 +1,69 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete
+
+from fms_server.app.config.database import AsyncSessionLocal, async_engine
+from fms_server.app.models.model import RouteDB
+from fms_server.app.services.listing_service import ListingService
+from fms_server.app.utils.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trips_routes_without_departure_time():
+    route_id = uuid4()
+    departure_time = datetime(2025, 3, 3, 7, 30)
+
+    assert decode_cursor(encode_cursor(departure_time, route_id)) == (departure_time, route_id)
+    assert decode_cursor(encode_cursor(None, route_id)) == (None, route_id)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+async def list_route_pages(page_sizes):
+    """출발 시간이 있는 경로와 없는 경로를 만들고, 페이지 크기별로 모든 페이지의 경로 ID를 조회합니다."""
+    departure = f"정류장{uuid4().hex}"
+    timed = [(datetime(2025, 3, 3, 7, 30) + timedelta(minutes=i % 3), uuid4()) for i in range(5)]
+    untimed = [uuid4() for _ in range(4)]
+    async with AsyncSessionLocal() as session:
+        session.add_all([
+            RouteDB(id=route_id, departure_location_name=departure, departure_time=departure_time, destination_location_name="초등학교")
+            for departure_time, route_id in timed
+        ])
+        session.add_all([
+            RouteDB(id=route_id, departure_location_name=departure, departure_time=None, destination_location_name="초등학교")
+            for route_id in untimed
+        ])
+        await session.commit()
+
+    try:
+        results = {}
+        async with AsyncSessionLocal() as session:
+            for limit in page_sizes:
+                ids, cursor = [], None
+                while True:
+                    page = json.loads(await ListingService(session).route_page_json(
+                        departure_location_name=departure, cursor=cursor, limit=limit
+                    ))
+                    assert len(page["items"]) <= limit
+                    ids += [item["id"] for item in page["items"]]
+                    cursor = page["next_cursor"]
+                    if cursor is None:
+                        break
+                results[limit] = ids
+        expected = [str(route_id) for _, route_id in sorted(timed)] + sorted(str(route_id) for route_id in untimed)
+        return expected, results
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(RouteDB).where(RouteDB.id.in_([route_id for _, route_id in timed] + untimed)))
+            await session.commit()
+        await async_engine.dispose()
+
+def test_routes_without_departure_time_come_last_in_pages(test_db):
+    expected, results = asyncio.run(list_route_pages([2, 3, 4, 5, 20]))
+
+    # 출발 시간 순서 뒤에 출발 시간이 없는 경로가 id 순으로 이어지며, 페이지 경계에서 빠지거나 겹치지 않습니다.
+    for ids in results.values():
+        assert ids == expected
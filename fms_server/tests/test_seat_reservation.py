@@ -0,0 +1,138 @@
+import asyncio
+import random
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import func, select
+
+from fms_server.app.config.database import AsyncSessionLocal, async_engine
+from fms_server.app.models.model import PassengerDB, RouteDB, TripDB
+from fms_server.app.controllers.dto.request_dto import RequestRunMatching
+from fms_server.app.services.async_fms_service import AsyncFmsService
+from fms_server.app.services.matching_service import MatchingService
+
+SEATS = 5
+TRIPS = 200
+
+
+async def seed_route_with_pending_trips():
+    route_id, passenger_id = uuid4(), uuid4()
+    trip_ids = [uuid4() for _ in range(TRIPS)]
+    async with AsyncSessionLocal() as session:
+        session.add(PassengerDB(id=passenger_id, password="x", name="학부모", nickname=f"parent-{passenger_id}", contact_info=""))
+        session.add(RouteDB(
+            id=route_id,
+            departure_location_name="통학 정류장",
+            departure_time=datetime(2025, 3, 3, 7, 30),
+            destination_location_name="초등학교",
+            seat_capacity=SEATS,
+        ))
+        await session.flush()
+        session.add_all([
+            TripDB(
+                id=trip_id,
+                ride_route_id=route_id,
+                passenger_id=passenger_id,
+                pickup_request_location_name="통학 정류장",
+                pickup_time=datetime(2025, 3, 3, 7, 30),
+            )
+            for trip_id in trip_ids
+        ])
+        await session.commit()
+    return route_id, trip_ids
+
+async def approve_one(trip_id):
+    async with AsyncSessionLocal() as session:
+        return await AsyncFmsService(session).approve_trip(trip_id)
+
+async def approve_batch(trip_ids):
+    async with AsyncSessionLocal() as session:
+        return await AsyncFmsService(session).approve_trips(trip_ids)
+
+async def stress():
+    try:
+        route_id, trip_ids = await seed_route_with_pending_trips()
+
+        # 단건 승인 200개와 서로 겹치는 일괄 승인 20개를 동시에 실행합니다.
+        batches = [random.sample(trip_ids, 30) for _ in range(20)]
+        results = await asyncio.gather(
+            *(approve_one(trip_id) for trip_id in trip_ids),
+            *(approve_batch(batch) for batch in batches),
+        )
+
+        async with AsyncSessionLocal() as session:
+            route = await session.get(RouteDB, route_id)
+            approved = await session.scalar(
+                select(func.count()).select_from(TripDB).where(TripDB.ride_route_id == route_id, TripDB.is_approved.is_(True))
+            )
+        return route.seats_reserved, approved, results
+    finally:
+        await async_engine.dispose()
+
+def test_concurrent_approvals_never_overbook(test_db):
+    seats_reserved, approved, results = asyncio.run(stress())
+
+    assert approved == SEATS
+    assert seats_reserved == SEATS
+
+    single_results = [result for result in results[:TRIPS] if result is not None]
+    batch_results = results[TRIPS:]
+    assert all(result is not None for result in batch_results)
+    granted = {trip.id for trip in single_results} | {trip.id for result in batch_results for trip in result.approved}
+    assert len(granted) == SEATS
+
+
+class RacingMatchingService(MatchingService):
+    """여정/경로를 조회한 직후 다른 요청이 경로의 마지막 좌석을 승인하는 매칭"""
+    def __init__(self, session, racing_trip_id):
+        super().__init__(session)
+        self.racing_trip_id = racing_trip_id
+
+    async def _load(self, request):
+        rows = await super()._load(request)
+        await approve_one(self.racing_trip_id)
+        return rows
+
+async def run_matching_against_concurrent_approval():
+    route_id, passenger_id = uuid4(), uuid4()
+    trip_ids = [uuid4(), uuid4()]
+    try:
+        async with AsyncSessionLocal() as session:
+            session.add(PassengerDB(id=passenger_id, password="x", name="학부모", nickname=f"parent-{passenger_id}", contact_info=""))
+            session.add(RouteDB(
+                id=route_id,
+                departure_location_name="통학 정류장",
+                departure_time=datetime(2031, 3, 3, 7, 30),
+                destination_location_name="초등학교",
+                seat_capacity=1,
+            ))
+            await session.flush()
+            session.add_all([
+                TripDB(
+                    id=trip_id,
+                    ride_route_id=route_id,
+                    passenger_id=passenger_id,
+                    pickup_request_location_name="통학 정류장",
+                    pickup_time=datetime(2031, 3, 3, 7, 25 + 10 * i),
+                )
+                for i, trip_id in enumerate(trip_ids)
+            ])
+            await session.commit()
+
+        async with AsyncSessionLocal() as session:
+            result = await RacingMatchingService(session, trip_ids[0]).run(RequestRunMatching(
+                start_time=datetime(2031, 3, 3, 7, 0),
+                end_time=datetime(2031, 3, 3, 8, 0),
+                apply=True,
+            ))
+        return trip_ids, result
+    finally:
+        await async_engine.dispose()
+
+def test_matching_reports_assignments_lost_to_a_concurrent_approval_as_unmatched(test_db):
+    trip_ids, result = asyncio.run(run_matching_against_concurrent_approval())
+
+    # 배정된 여정이 다른 승인에 좌석을 빼앗겨 적용되지 않았으므로 모든 여정이 unmatched_trip_ids에 있어야 합니다.
+    assert result.applied
+    assert result.assignments == []
+    assert sorted(result.unmatched_trip_ids) == sorted(trip_ids)
@@ -0,0 +1,97 @@
+import asyncio
+import json
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import delete
+
+from fms_server.app.config.database import AsyncSessionLocal, async_engine
+from fms_server.app.domains.route import Route
+from fms_server.app.domains.trip import Trip
+from fms_server.app.models.model import PassengerDB, RouteDB, RouteTombstoneDB, TripDB
+from fms_server.app.services.async_fms_service import AsyncFmsService
+from fms_server.app.services.listing_service import ListingService
+
+
+def make_route(name):
+    return Route(departure_location_name=name, departure_time=datetime(2025, 3, 3, 7, 30), destination_location_name="초등학교")
+
+async def sync_all(method, since, limit=1000):
+    """has_more가 false가 될 때까지 동기화하고 (변경 목록, 삭제 목록, 마지막 커서, 요청 수)를 반환합니다."""
+    items, deleted, requests = [], [], 0
+    while True:
+        async with AsyncSessionLocal() as session:
+            page = json.loads(await getattr(ListingService(session), method)(since=since, limit=limit))
+        requests += 1
+        items += page["items"]
+        deleted += page.get("deleted_ids", [])
+        since = page["next_cursor"]
+        if not page["has_more"]:
+            return items, deleted, since, requests
+
+async def run_sync_scenario():
+    _, _, route_cursor, _ = await sync_all("route_sync_json", None)
+    _, _, trip_cursor, _ = await sync_all("trip_sync_json", None)
+    passenger_id = uuid4()
+    route_ids = []
+    try:
+        async with AsyncSessionLocal() as session:
+            session.add(PassengerDB(id=passenger_id, password="x", name="학생", nickname=f"student-{passenger_id}", contact_info="010"))
+            await session.commit()
+            service = AsyncFmsService(session)
+            kept = await service.create_route(make_route("통학 정류장"))
+            removed = await service.create_route(make_route("임시 정류장"))
+            route_ids += [kept.id, removed.id]
+            await service.update_ride_route(kept.id, kept.model_copy(update={"car_plate_number": "12가3456"}))
+            await service.delete_ride_route(removed.id)
+            trip = await service.create_trip(Trip(
+                id=uuid4(), ride_route_id=kept.id, passenger_id=passenger_id,
+                pickup_request_location_name="통학 정류장", pickup_time=datetime(2025, 3, 3, 7, 0),
+            ))
+            await service.approve_trip(trip.id)
+
+        routes, deleted, next_route_cursor, _ = await sync_all("route_sync_json", route_cursor, limit=1)
+        trips, _, next_trip_cursor, _ = await sync_all("trip_sync_json", trip_cursor)
+        unchanged = await sync_all("route_sync_json", next_route_cursor)
+
+        # 커밋되지 않은 쓰기보다 나중에 커밋된 쓰기는 앞의 쓰기가 끝날 때까지 반환하지 않습니다.
+        async with AsyncSessionLocal() as slow, AsyncSessionLocal() as fast:
+            slow_id = uuid4()
+            route_ids.append(slow_id)
+            slow.add(RouteDB(id=slow_id, departure_location_name="늦은 정류장", departure_time=datetime(2025, 3, 3, 8, 0)))
+            await slow.flush()
+            fast_route = await AsyncFmsService(fast).create_route(make_route("빠른 정류장"))
+            route_ids.append(fast_route.id)
+            during, _, during_cursor, _ = await sync_all("route_sync_json", next_route_cursor)
+            await slow.commit()
+        after, _, _, _ = await sync_all("route_sync_json", during_cursor)
+
+        return {
+            "kept": kept, "removed": removed, "trip": trip,
+            "routes": routes, "deleted": deleted, "trips": trips, "unchanged": unchanged,
+            "next_route_cursor": next_route_cursor, "during": during, "after": after,
+        }
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(TripDB).where(TripDB.passenger_id == passenger_id))
+            await session.execute(delete(RouteDB).where(RouteDB.id.in_(route_ids)))
+            await session.execute(delete(RouteTombstoneDB).where(RouteTombstoneDB.id.in_(route_ids)))
+            await session.execute(delete(PassengerDB).where(PassengerDB.id == passenger_id))
+            await session.commit()
+        await async_engine.dispose()
+
+def test_sync_returns_changes_tombstones_and_waits_for_in_flight_writes(test_db):
+    result = asyncio.run(run_sync_scenario())
+
+    kept, removed = str(result["kept"].id), str(result["removed"].id)
+    assert [route["id"] for route in result["routes"]] == [kept]
+    assert result["routes"][0]["car_plate_number"] == "12가3456"
+    assert result["deleted"] == [removed]
+
+    assert [(trip["id"], trip["is_approved"]) for trip in result["trips"]] == [(str(result["trip"].id), True)]
+
+    items, deleted, cursor, requests = result["unchanged"]
+    assert (items, deleted, cursor, requests) == ([], [], result["next_route_cursor"], 1)
+
+    assert result["during"] == []
+    assert sorted(route["departure_location_name"] for route in result["after"]) == ["늦은 정류장", "빠른 정류장"]
@@ -0,0 +1,73 @@
+import time
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from fms_server.app.services.auth_service import AuthService
+from fms_server.app.utils import security
+from fms_server.app.utils.token_cache import VerifiedTokenCache
+
+
+def counting_verify(results):
+    calls = []
+
+    def verify(token):
+        calls.append(token)
+        return results.get(token)
+    return verify, calls
+
+def test_valid_token_is_verified_once_until_exp():
+    cache = VerifiedTokenCache()
+    verify, calls = counting_verify({"good": {"sub": "kim", "exp": time.time() + 60}})
+
+    assert cache.get_or_verify("good", verify)["sub"] == "kim"
+    assert cache.get_or_verify("good", verify)["sub"] == "kim"
+    assert calls == ["good"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_expired_entry_is_verified_again():
+    cache = VerifiedTokenCache()
+    verify, calls = counting_verify({"old": {"sub": "kim", "exp": time.time() - 1}})
+
+    cache.get_or_verify("old", verify)
+    cache.get_or_verify("old", verify)
+    assert calls == ["old", "old"]
+
+def test_rejected_token_is_negatively_cached():
+    cache = VerifiedTokenCache(negative_ttl=60)
+    verify, calls = counting_verify({})
+
+    assert cache.get_or_verify("bad", verify) is None
+    assert cache.get_or_verify("bad", verify) is None
+    assert calls == ["bad"]
+    assert cache.negative_hits == 1
+
+def test_rejected_tokens_do_not_evict_valid_tokens():
+    cache = VerifiedTokenCache(maxsize=2, negative_maxsize=2)
+    verify, calls = counting_verify({"good": {"sub": "kim", "exp": time.time() + 60}})
+
+    cache.get_or_verify("good", verify)
+    for i in range(10):
+        cache.get_or_verify(f"bad-{i}", verify)
+    cache.get_or_verify("good", verify)
+    assert calls.count("good") == 1
+    assert cache.stats()["rejected_size"] == 2
+
+def test_cached_payload_cannot_be_mutated_by_callers():
+    cache = VerifiedTokenCache()
+    verify, _ = counting_verify({"good": {"sub": "kim", "exp": time.time() + 60}})
+
+    cache.get_or_verify("good", verify)["sub"] = "lee"
+    assert cache.get_or_verify("good", verify)["sub"] == "kim"
+
+def test_get_token_payload_uses_cache(monkeypatch):
+    cache = VerifiedTokenCache()
+    monkeypatch.setattr(security, "token_cache", cache)
+    token = AuthService(session=None).create_access_token({"sub": "kim"}, timedelta(minutes=5))
+
+    assert security.get_token_payload(token)["sub"] == "kim"
+    assert security.get_token_payload(token)["sub"] == "kim"
+    with pytest.raises(HTTPException):
+        security.get_token_payload(token + "x")
+    assert (cache.hits, cache.misses) == (1, 2)
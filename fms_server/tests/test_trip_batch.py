@@ -0,0 +1,151 @@
+import asyncio
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete, select
+
+from fms_server.app.config.database import AsyncSessionLocal, async_engine
+from fms_server.app.domains.trip import Trip
+from fms_server.app.models.model import PassengerDB, RouteDB, TripDB
+from fms_server.app.services.async_fms_service import AsyncFmsService
+
+
+async def seed(seat_capacity):
+    route_id, passenger_id = uuid4(), uuid4()
+    async with AsyncSessionLocal() as session:
+        session.add(PassengerDB(id=passenger_id, name="김승객", nickname=f"승객{passenger_id.hex}"))
+        session.add(RouteDB(
+            id=route_id,
+            departure_location_name="서울역",
+            departure_time=datetime(2025, 3, 3, 7, 30),
+            destination_location_name="부산역",
+            seat_capacity=seat_capacity,
+        ))
+        await session.commit()
+    return route_id, passenger_id
+
+async def cleanup(route_id, passenger_id):
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(TripDB).where(TripDB.ride_route_id == route_id))
+        await session.execute(delete(RouteDB).where(RouteDB.id == route_id))
+        await session.execute(delete(PassengerDB).where(PassengerDB.id == passenger_id))
+        await session.commit()
+    await async_engine.dispose()
+
+async def run_with_route(scenario, seat_capacity=2):
+    route_id, passenger_id = await seed(seat_capacity)
+    try:
+        return await scenario(route_id, passenger_id)
+    finally:
+        await cleanup(route_id, passenger_id)
+
+def new_trip(route_id, passenger_id, **fields):
+    return Trip(**{
+        "id": uuid4(),
+        "ride_route_id": route_id,
+        "passenger_id": passenger_id,
+        "pickup_request_location_name": "서울역",
+        "pickup_time": datetime(2025, 3, 3, 7, 20),
+        **fields,
+    })
+
+def test_batch_create_matches_single_create_and_skips_conflicting_ids(test_db):
+    async def scenario(route_id, passenger_id):
+        single = new_trip(route_id, passenger_id)
+        batch = new_trip(route_id, passenger_id)
+        conflicting = new_trip(route_id, passenger_id, id=single.id, pickup_request_location_name="시청")
+        missing_route_id, missing_passenger_id = uuid4(), uuid4()
+        async with AsyncSessionLocal() as session:
+            service = AsyncFmsService(session)
+            await service.create_trip(single)
+            result = await service.create_trips([
+                batch,
+                conflicting,
+                new_trip(missing_route_id, passenger_id),
+                new_trip(route_id, missing_passenger_id),
+            ])
+            rows = {row.id: row for row in await session.scalars(select(TripDB).where(TripDB.ride_route_id == route_id))}
+        return single, batch, result, rows, missing_route_id, missing_passenger_id
+
+    single, batch, result, rows, missing_route_id, missing_passenger_id = asyncio.run(run_with_route(scenario))
+
+    # 이미 있는 id는 on_conflict_do_nothing으로 건너뛰고, 기존 행은 바뀌지 않습니다.
+    assert [trip.id for trip in result.created] == [batch.id]
+    assert rows.keys() == {single.id, batch.id}
+    assert rows[single.id].pickup_request_location_name == "서울역"
+    assert result.missing_route_ids == [missing_route_id]
+    assert result.missing_passenger_ids == [missing_passenger_id]
+
+    # Core INSERT 경로도 ORM 이벤트로 채우는 좌표/셀과 기본값을 똑같이 채웁니다.
+    def columns(row):
+        return (row.pickup_lat, row.pickup_lon, row.pickup_cell, row.is_approved)
+    assert columns(rows[batch.id]) == columns(rows[single.id])
+    assert rows[batch.id].pickup_cell is not None
+    assert rows[batch.id].created_at is not None and rows[batch.id].updated_at is not None
+    assert result.created[0].model_dump() == Trip.model_validate(rows[batch.id]).model_dump()
+
+def test_batch_approve_matches_single_approve(test_db):
+    async def scenario(route_id, passenger_id):
+        trips = [new_trip(route_id, passenger_id) for _ in range(3)]
+        missing_id = uuid4()
+        async with AsyncSessionLocal() as session:
+            service = AsyncFmsService(session)
+            # 먼저 요청된(created_at) 여정부터 승인하므로 하나씩 만들어 순서를 정합니다.
+            for trip in trips:
+                await service.create_trip(trip)
+            first, second, third = (trip.id for trip in trips)
+            batch = await service.approve_trips([third, second, first, missing_id])
+            singles = [await service.approve_trip(trip_id) for trip_id in (first, third, missing_id)]
+            seats_reserved = await session.scalar(select(RouteDB.seats_reserved).where(RouteDB.id == route_id))
+        return (first, second, third, missing_id), batch, singles, seats_reserved
+
+    (first, second, third, missing_id), batch, singles, seats_reserved = asyncio.run(run_with_route(scenario))
+
+    assert sorted(trip.id for trip in batch.approved) == sorted([first, second])
+    assert all(trip.is_approved for trip in batch.approved)
+    assert batch.full_ids == [third]
+    assert batch.missing_ids == [missing_id]
+    assert batch.busy_ids == []
+    # 단건 승인도 같은 규칙을 따릅니다. 이미 승인된 여정은 그대로 반환하고, 좌석이 없거나 없는 여정은 None입니다.
+    approved_first = next(trip for trip in batch.approved if trip.id == first)
+    assert singles[0].model_dump() == approved_first.model_dump()
+    assert singles[1:] == [None, None]
+    assert seats_reserved == 2
+
+@pytest.fixture
+def seeded_route(test_db):
+    # TestClient는 자체 이벤트 루프를 사용하므로 준비와 정리를 각각 실행합니다.
+    route_id, passenger_id = asyncio.run(seed(seat_capacity=1))
+    asyncio.run(async_engine.dispose())
+    yield route_id, passenger_id
+    asyncio.run(cleanup(route_id, passenger_id))
+
+def test_batch_endpoints(authorized_client, seeded_route):
+    route_id, passenger_id = seeded_route
+    missing_route_id = str(uuid4())
+    request_trip = {
+        "ride_route_id": str(route_id),
+        "passenger_id": str(passenger_id),
+        "pickup_request_location_name": "서울역",
+        "pickup_time": "2025-03-03T07:20:00",
+    }
+
+    created = authorized_client.post("/fms/trips/batch", json={
+        "trips": [request_trip, request_trip, {**request_trip, "ride_route_id": missing_route_id}],
+    })
+
+    assert created.status_code == 201
+    body = created.json()
+    assert len(body["created"]) == 2
+    assert body["missing_route_ids"] == [missing_route_id]
+    assert body["missing_passenger_ids"] == []
+
+    first, second = (trip["id"] for trip in body["created"])
+    approved = authorized_client.post("/fms/trips/approve", json={"ids": [first, second]})
+
+    assert approved.status_code == 200
+    # 좌석이 1개이므로 하나만 승인됩니다.
+    assert len(approved.json()["approved"]) == 1
+    assert len(approved.json()["full_ids"]) == 1
+    assert authorized_client.post("/fms/trips/batch", json={"trips": []}).status_code == 422
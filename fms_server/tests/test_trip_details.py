@@ -0,0 +1,122 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import delete, event
+
+from fms_server.app.config.database import AsyncSessionLocal, async_engine
+from fms_server.app.models.model import PassengerDB, RouteDB, TripDB
+from fms_server.app.services.async_fms_service import AsyncFmsService
+from fms_server.app.services.listing_service import ListingService
+
+TRIPS = 60
+
+
+async def seed():
+    route_ids = [uuid4() for _ in range(3)]
+    passenger_ids = [uuid4() for _ in range(TRIPS)]
+    async with AsyncSessionLocal() as session:
+        session.add_all([
+            PassengerDB(id=passenger_id, password="x", name=f"학생-{i}", nickname=f"student-{passenger_id}", contact_info="010")
+            for i, passenger_id in enumerate(passenger_ids)
+        ])
+        session.add_all([
+            RouteDB(
+                id=route_id,
+                car_plate_number=f"12가{i:04d}",
+                departure_location_name="통학 정류장",
+                departure_time=datetime(2025, 3, 3, 7, 30),
+                destination_location_name="초등학교",
+            )
+            for i, route_id in enumerate(route_ids)
+        ])
+        await session.flush()
+        session.add_all([
+            TripDB(
+                id=uuid4(),
+                ride_route_id=route_ids[i % len(route_ids)],
+                passenger_id=passenger_id,
+                pickup_request_location_name="통학 정류장",
+                pickup_time=datetime(2025, 3, 3, 7, 0) + timedelta(seconds=i),
+            )
+            for i, passenger_id in enumerate(passenger_ids)
+        ])
+        await session.commit()
+    return route_ids, passenger_ids
+
+async def cleanup(route_ids, passenger_ids):
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(TripDB).where(TripDB.passenger_id.in_(passenger_ids)))
+        await session.execute(delete(RouteDB).where(RouteDB.id.in_(route_ids)))
+        await session.execute(delete(PassengerDB).where(PassengerDB.id.in_(passenger_ids)))
+        await session.commit()
+
+async def list_all_pages(page_sizes):
+    """페이지 크기별로 모든 페이지를 조회하고 (실행된 SQL 문 수, 페이지 목록)을 반환합니다."""
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    route_ids, passenger_ids = await seed()
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count)
+    try:
+        results = {}
+        for limit in page_sizes:
+            statements.clear()
+            pages, cursor = [], None
+            async with AsyncSessionLocal() as session:
+                while True:
+                    page = json.loads(await ListingService(session).trip_detail_page_json(
+                        ride_route_id=route_ids[0], cursor=cursor, limit=limit
+                    ))
+                    pages.append(page)
+                    cursor = page["next_cursor"]
+                    if cursor is None:
+                        break
+            results[limit] = (len(statements), pages)
+        return route_ids, results
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", count)
+        await cleanup(route_ids, passenger_ids)
+        await async_engine.dispose()
+
+def test_trip_details_use_one_query_per_page_regardless_of_page_size(test_db):
+    route_ids, results = asyncio.run(list_all_pages([3, 7, 50]))
+
+    for limit, (statement_count, pages) in results.items():
+        assert statement_count == len(pages)
+        items = [item for page in pages for item in page["items"]]
+        assert len(items) == TRIPS // len(route_ids)
+        assert all(len(page["items"]) <= limit for page in pages)
+
+    for item in results[50][1][0]["items"]:
+        assert item["route"]["id"] == str(route_ids[0])
+        assert item["route"]["car_plate_number"] == "12가0000"
+        assert item["passenger"]["id"] == item["passenger_id"]
+        assert item["passenger"]["name"].startswith("학생-")
+
+async def delete_routes():
+    route_ids, passenger_ids = await seed()
+    try:
+        async with AsyncSessionLocal() as session:
+            service = AsyncFmsService(session)
+            referenced = await service.delete_ride_route(route_ids[0])
+            kept = await session.get(RouteDB, route_ids[0]) is not None
+            await session.execute(delete(TripDB).where(TripDB.ride_route_id == route_ids[1]))
+            await session.commit()
+            unreferenced = await service.delete_ride_route(route_ids[1])
+            missing = await service.delete_ride_route(uuid4())
+        return referenced, kept, unreferenced, missing
+    finally:
+        await cleanup(route_ids, passenger_ids)
+        await async_engine.dispose()
+
+def test_route_with_trips_is_not_deleted(test_db):
+    referenced, kept, unreferenced, missing = asyncio.run(delete_routes())
+
+    # fk_trip_ride_route_id 때문에 여정이 남아 있는 경로는 삭제되지 않고 False를 반환합니다.
+    assert (referenced, kept) == (False, True)
+    assert unreferenced is True
+    assert missing is False
@@ -31,9 +31,16 @@ def find_ride_routes(start_time: Optional[str] = None, end_time: Optional[str] =
     # None 값을 가진 파라미터는 제거
     params = {k: v for k, v in params.items() if v is not None}
     print(f"API 호출: GET {endpoint} | 파라미터: {params}")
-    response = requests.get(endpoint, params=params)
-    response.raise_for_status()
-    return response.json()
+    # 응답은 {"items": [...], "next_cursor": ...} 페이지이므로 next_cursor가 없을 때까지 이어서 조회합니다.
+    routes = []
+    while True:
+        response = requests.get(endpoint, params=params)
+        response.raise_for_status()
+        page = response.json()
+        routes.extend(page["items"])
+        if page["next_cursor"] is None:
+            return routes
+        params["cursor"] = page["next_cursor"]
     
 
 root_agent = Agent(